@@ -1,11 +1,14 @@
-from django.contrib import admin
-from .models import Champion, League, Team, Player, Match, PickBan, PBContext
+from django.contrib import admin, messages
+from django.http import JsonResponse
+from .draft_validation import find_draft_violations
+from .models import Champion, League, Team, Player, Match, PickBan, PBContext, SeriesStat
 
 # admin.site.register()를 사용하여 각 모델을 관리자 페이지에 등록
 admin.site.register(Champion)
 admin.site.register(League)
 admin.site.register(Team)
 admin.site.register(Player)
+admin.site.register(SeriesStat)
 
 # Match 모델은 인라인으로 PickBan을 함께 볼 수 있게 설정하면 편리
 class PickBanInline(admin.TabularInline):
@@ -13,9 +16,21 @@ class PickBanInline(admin.TabularInline):
     extra = 0 # 추가 PickBan 레코드 생성 필드 수
 
 class MatchAdmin(admin.ModelAdmin):
-    list_display = ('match_date', 'stage', 'team_a', 'team_b', 'winner')
+    list_display = ('match_date', 'stage', 'match_number', 'set_number', 'team_a', 'team_b', 'winner')
     list_filter = ('stage', 'match_date')
     inlines = [PickBanInline]
+    actions = ['validate_drafts']
+
+    @admin.action(description='선택한 경기의 벤픽 무결성 검사')
+    def validate_drafts(self, request, queryset):
+        # 위반이 있으면 validate_drafts 명령과 같은 형식의 JSON 보고서를 내려받음
+        report = find_draft_violations(list(queryset.values_list('pk', flat=True)))
+        if not report['violation_count']:
+            self.message_user(request, f"위반 없음 (경기 {report['checked_matches']}개 검사)", messages.SUCCESS)
+            return None
+        response = JsonResponse(report, json_dumps_params={'ensure_ascii': False, 'indent': 2})
+        response['Content-Disposition'] = 'attachment; filename="draft_violations.json"'
+        return response
 
 admin.site.register(Match, MatchAdmin)
 
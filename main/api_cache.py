@@ -0,0 +1,143 @@
+"""
+JSON API 응답 캐시.
+모델 그룹(champions, stories, series_stats, match:<id>)마다 버전 번호를 두고 캐시 키에 포함시킵니다.
+데이터가 바뀌면 버전만 올리므로 이전 키는 더 이상 읽히지 않고 만료될 때까지 방치됩니다.
+버전은 관리 명령 프로세스에서도 올리므로 settings.CACHES는 프로세스 간 공유되는 백엔드여야 합니다.
+캐시 키와 ETag에는 응답을 만드는 코드/템플릿의 해시(CODE_VERSION)도 포함되어, 배포 후에는 새로 만들어집니다.
+"""
+import glob
+import hashlib
+import json
+import os
+import time
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+# 모델 그룹 이름
+CHAMPIONS = 'champions'
+STORIES = 'stories'
+SERIES_STATS = 'series_stats'
+
+# 응답 본문 보관 시간 (버전이 바뀌면 바로 무효화되므로 길게 둠)
+RESPONSE_TIMEOUT = 60 * 60 * 24
+# 재생성 잠금 유지 시간 / 잠금 대기 간격 / 최대 대기 시간 (초)
+LOCK_TIMEOUT = 30
+LOCK_POLL_INTERVAL = 0.05
+LOCK_WAIT = 5
+
+
+def _code_version():
+    """직렬화/뷰 코드와 템플릿 파일 내용의 해시"""
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    paths = [os.path.join(app_dir, name) for name in ('models.py', 'serializers.py', 'views.py')]
+    paths += sorted(glob.glob(os.path.join(app_dir, 'templates', 'main', '*.html')))
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+CODE_VERSION = _code_version()
+
+
+def match_group(match_id):
+    """경기별 벤픽 데이터 그룹 이름"""
+    return f'match:{match_id}'
+
+
+def _version_key(group):
+    return f'api:version:{group}'
+
+
+def get_version(group, create=True):
+    """
+    그룹의 현재 데이터 버전.
+    버전 키가 없으면(최초 또는 캐시 축출) 현재 시각(ns)으로 시작하여 이전 버전과 겹치지 않게 합니다.
+    create=False이면 새로 만들지 않고 None을 반환합니다 (요청 URL의 id로 만드는 그룹용).
+    """
+    key = _version_key(group)
+    version = cache.get(key)
+    if version is None and create:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _bump(group):
+    # incr(읽기 후 쓰기)는 파일 캐시 등에서 원자적이지 않아 동시에 올리면 같은 값이 될 수 있으므로,
+    # 항상 이전 값보다 큰 새 시각 값으로 덮어씁니다.
+    key = _version_key(group)
+    current = cache.get(key) or 0
+    cache.set(key, max(time.time_ns(), current + 1), timeout=None)
+
+
+def bump_version(*groups):
+    """
+    그룹 버전을 올려 캐시된 응답을 무효화합니다.
+    트랜잭션 안에서는 커밋 후에 올려, 커밋 전 데이터가 새 버전 키로 캐시되지 않게 합니다.
+    """
+    transaction.on_commit(lambda: [_bump(group) for group in groups])
+
+
+def group_etag(*groups, create=True):
+    """
+    코드 버전과 그룹 버전으로 만든 ETag 값 (캐시만 읽고 DB는 조회하지 않음).
+    create=False이고 버전이 없는 그룹이 있으면 None (ETag 없이 응답)
+    """
+    versions = [get_version(group, create) for group in groups]
+    if None in versions:
+        return None
+    return '-'.join([CODE_VERSION] + [f'{group}.{version}' for group, version in zip(groups, versions)])
+
+
+def json_body(data):
+    """JsonResponse와 같은 인코더로 직렬화한 응답 본문"""
+    return json.dumps(data, cls=DjangoJSONEncoder)
+
+
+def cached_body(group, name, build, timeout=RESPONSE_TIMEOUT, create_version=True):
+    """
+    (그룹 버전, 이름) 키로 캐시된 값(응답 본문 등)을 반환하고, 없으면 build()로 만들어 저장합니다.
+    build()가 None을 반환하면(예: 404) 캐시하지 않습니다.
+
+    create_version=False이면 버전이 없는 그룹은 build() 결과가 있을 때만 버전을 만듭니다.
+    요청 URL의 id(없는 경기 등)마다 만료되지 않는 버전 키가 쌓여 실제 항목을 밀어내지 않게 합니다.
+    본문은 이 요청이 버전을 만들었을 때만 캐시합니다 (build 중에 다른 프로세스가 올린 버전으로 저장하지 않도록).
+
+    같은 키를 여러 요청이 동시에 놓치면 잠금(cache.add)을 얻은 요청 하나만 재생성하고,
+    나머지는 잠시 기다렸다가 그 결과를 읽습니다 (캐시 스탬피드 방지).
+    """
+    version = get_version(group, create=create_version)
+    if version is None:
+        body = build()
+        version = time.time_ns()
+        if body is not None and cache.add(_version_key(group), version, timeout=None):
+            cache.set(f'api:{CODE_VERSION}:{group}:v{version}:{name}', body, timeout=timeout)
+        return body
+
+    key = f'api:{CODE_VERSION}:{group}:v{version}:{name}'
+    body = cache.get(key)
+    if body is not None:
+        return body
+
+    lock_key = f'{key}:lock'
+    if not cache.add(lock_key, 1, timeout=LOCK_TIMEOUT):
+        deadline = time.monotonic() + LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            body = cache.get(key)
+            if body is not None:
+                return body
+        # 재생성 요청이 너무 오래 걸리면 캐시하지 않고 직접 만들어 응답
+        return build()
+
+    try:
+        body = build()
+        if body is not None:
+            cache.set(key, body, timeout=timeout)
+        return body
+    finally:
+        cache.delete(lock_key)
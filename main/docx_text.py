@@ -0,0 +1,213 @@
+"""
+docx 문서의 문단 텍스트 추출, 파일 해시 기반 캐시, 문서 구조(목차)로 경기/세트 찾기
+"""
+import hashlib
+import json
+import os
+import re
+import time
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+from django.conf import settings
+
+from main.matchers import AnchorIndex
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+W_BODY = f'{W_NS}body'
+W_P = f'{W_NS}p'
+W_T = f'{W_NS}t'
+# 문단 텍스트에서 공백 문자로 변환되는 요소 (python-docx의 run.text와 동일)
+W_SPECIAL_CHARS = {
+    f'{W_NS}tab': '\t',
+    f'{W_NS}br': '\n',
+    f'{W_NS}cr': '\n',
+}
+
+# 파싱된 문단 목록을 저장하는 기본 캐시 폴더
+DEFAULT_CACHE_DIR = os.path.join(settings.BASE_DIR, '.cache', 'docx')
+# 추출 로직이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = 1
+
+# 스토리 문서 구조 (worlds_story.docx 형식)
+# "1. 8강: ..." / "1.2. 1경기: Gen.G vs Hanwha Life Esports (최종 스코어 3:1)" / "1.2.1. 경기 총평" /
+# "1.2.2. 세트별 분석" / "1세트 (GEN 승):" / "밴픽 전략 분석: ..." / "경기 흐름 및 핵심 서사: ..."
+OUTLINE_STAGES = {'8강': 'QF', '4강': 'SF', '결승': 'F'}
+STAGE_HEADING = re.compile(r'^\d+\.\s*(8강|4강|결승)\s*:')
+MATCH_HEADING = re.compile(
+    r'^\d+(?:\.\d+)+\.\s*(\d+)경기\s*:\s*(.+?)\s+vs\s+(.+?)\s*\(최종 스코어\s*(\d+\s*:\s*\d+)\)\s*$'
+)
+OVERVIEW_HEADING = re.compile(r'^\d+(?:\.\d+)+\.\s*경기 총평\s*$')
+NUMBERED_HEADING = re.compile(r'^\d+(?:\.\d+)*\.\s')
+SET_HEADING = re.compile(r'^(\d+)세트\s*\(\s*(.+?)\s*승\s*\)\s*:?\s*$')
+BANPICK_PREFIX = '밴픽 전략 분석:'
+NARRATIVE_PREFIX = '경기 흐름 및 핵심 서사:'
+
+
+def file_sha256(path):
+    """파일 전체의 SHA-256 해시 (고정 크기 블록 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_paragraph_texts(path):
+    """
+    docx(zip) 안의 word/document.xml을 스트리밍 파싱하여 본문 문단 텍스트를 순서대로 반환합니다.
+    python-docx의 Document(path).paragraphs와 같은 문단(본문 최상위 w:p)만 대상으로 하며,
+    객체 모델을 만들지 않고 처리가 끝난 요소는 바로 해제합니다.
+    """
+    with zipfile.ZipFile(path) as archive, archive.open('word/document.xml') as xml_file:
+        parents = []
+        depth_in_paragraph = 0
+        parts = []
+
+        for event, element in iterparse(xml_file, events=('start', 'end')):
+            tag = element.tag
+            if event == 'start':
+                if tag == W_P:
+                    # 본문 바로 아래 문단만 수집 (표/텍스트 상자 안 문단은 제외)
+                    if depth_in_paragraph or (parents and parents[-1] == W_BODY):
+                        depth_in_paragraph += 1
+                parents.append(tag)
+                continue
+
+            parents.pop()
+            if depth_in_paragraph == 1:
+                if tag == W_T:
+                    parts.append(element.text or '')
+                elif tag in W_SPECIAL_CHARS:
+                    parts.append(W_SPECIAL_CHARS[tag])
+
+            if tag == W_P and depth_in_paragraph:
+                depth_in_paragraph -= 1
+                if not depth_in_paragraph:
+                    yield ''.join(parts)
+                    parts = []
+
+            if not depth_in_paragraph:
+                element.clear()
+
+
+def extract_paragraphs(path, extractor='xml'):
+    """
+    비어 있지 않은 문단 텍스트(앞뒤 공백 제거) 목록을 반환합니다.
+    extractor='xml'은 스트리밍 추출, 'python-docx'는 python-docx 객체 모델을 사용합니다.
+    """
+    if extractor == 'python-docx':
+        from docx import Document
+        texts = (p.text for p in Document(path).paragraphs)
+    else:
+        texts = iter_paragraph_texts(path)
+    return [text.strip() for text in texts if text.strip()]
+
+
+def load_paragraphs(path, cache_dir=DEFAULT_CACHE_DIR, extractor='xml'):
+    """
+    파일 해시를 키로 하는 디스크 캐시를 거쳐 문단 목록을 반환합니다.
+    문서가 바뀌지 않았다면 docx 파싱 없이 캐시된 JSON을 읽습니다.
+    cache_dir이 None이면 캐시를 사용하지 않습니다.
+    반환값: (문단 목록, 캐시 적중 여부)
+    """
+    if cache_dir is None:
+        return extract_paragraphs(path, extractor), False
+
+    cache_path = os.path.join(cache_dir, f'{file_sha256(path)}.{extractor}.v{CACHE_VERSION}.json')
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f), True
+    except (OSError, ValueError):
+        pass
+
+    paragraphs = extract_paragraphs(path, extractor)
+
+    # 다른 프로세스가 읽는 중에도 깨진 파일이 보이지 않도록 임시 파일에 쓴 뒤 교체
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(paragraphs, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+
+    return paragraphs, False
+
+
+def parse_story_outline(paragraphs):
+    """
+    문서 구조(단계 제목, "N경기: A vs B (최종 스코어 X:Y)" 제목, 세트 제목)로 경기와 세트 문단을 찾습니다.
+    앵커(MATCH_SPECS)에 없는 경기가 담긴 문서(단계/지역/시즌별 문서)도 읽을 수 있게 합니다.
+    세트별 분석이 없는 결승 요약 형식은 대상이 아닙니다.
+    반환값: [{'stage', 'match_number', 'team_a', 'team_b', 'final_score', 'overview',
+              'sets': [{'set_number', 'winner', 'banpick', 'narrative'}]}] (winner는 문서의 약칭 그대로)
+    """
+    matches = []
+    stage = None
+    match = None
+    section = None  # 'overview' / 'sets'
+
+    for text in paragraphs:
+        stage_heading = STAGE_HEADING.match(text)
+        match_heading = MATCH_HEADING.match(text)
+        set_heading = SET_HEADING.match(text)
+
+        if stage_heading:
+            stage, match, section = OUTLINE_STAGES[stage_heading.group(1)], None, None
+        elif match_heading and stage:
+            match_number, team_a, team_b, final_score = match_heading.groups()
+            match = {
+                'stage': stage,
+                'match_number': int(match_number),
+                'team_a': team_a,
+                'team_b': team_b,
+                'final_score': final_score.replace(' ', ''),
+                'overview': [],
+                'sets': [],
+            }
+            matches.append(match)
+            section = None
+        elif match is None:
+            continue
+        elif OVERVIEW_HEADING.match(text):
+            section = 'overview'
+        elif set_heading:
+            section = 'sets'
+            match['sets'].append({
+                'set_number': int(set_heading.group(1)),
+                'winner': set_heading.group(2),
+                'banpick': '',
+                'narrative': '',
+            })
+        elif NUMBERED_HEADING.match(text):
+            # 세트별 분석 등 다른 소제목 (다음 경기 제목 전까지 총평 수집 중단)
+            section = None
+        elif section == 'overview':
+            match['overview'].append(text)
+        elif section == 'sets':
+            current = match['sets'][-1]
+            if text.startswith(BANPICK_PREFIX) and not current['banpick']:
+                current['banpick'] = text
+            elif text.startswith(NARRATIVE_PREFIX) and not current['narrative']:
+                current['narrative'] = text
+
+    for match in matches:
+        match['overview'] = '\n'.join(match['overview'])
+    return [match for match in matches if match['sets']]
+
+
+def index_document(path, anchors, cache_dir=DEFAULT_CACHE_DIR, extractor='xml'):
+    """
+    문서 하나의 문단을 (캐시를 거쳐) 추출하고 앵커 색인과 문서 구조(parse_story_outline)를 만듭니다.
+    프로세스 풀 작업 단위로 사용되므로 ORM에 접근하지 않고, 피클 가능한 dict만 반환합니다.
+    """
+    started = time.perf_counter()
+    paragraphs, cache_hit = load_paragraphs(path, cache_dir=cache_dir, extractor=extractor)
+    index = AnchorIndex(anchors).add_document(paragraphs, source=str(path))
+    return {
+        'path': str(path),
+        'found': {anchor: matches for anchor, matches in index.found.items() if matches},
+        'outline': parse_story_outline(paragraphs),
+        'paragraph_count': len(paragraphs),
+        'cache_hit': cache_hit,
+        'elapsed': time.perf_counter() - started,
+    }
@@ -0,0 +1,100 @@
+"""
+벤픽(PickBan) 데이터 무결성 검사.
+경기별로 Python에서 순회하지 않고, 검사 항목마다 테이블 전체에 대한 집계 쿼리 하나로 위반 항목을 찾습니다.
+"""
+from django.db.models import Count, F, Max, Min, Q
+
+from main.models import Match, PickBan
+
+# 한 경기(세트)의 벤픽 구성: 벤 10개 + 픽 10개, 순서 1~20
+BANS_PER_DRAFT = 10
+PICKS_PER_DRAFT = 10
+ACTIONS_PER_DRAFT = BANS_PER_DRAFT + PICKS_PER_DRAFT
+
+# 검사 항목 코드
+MISSING_DRAFT = 'missing_draft'
+ACTION_COUNT = 'action_count'
+DUPLICATE_CHAMPION = 'duplicate_champion'
+PLAYER_ON_BAN = 'player_on_ban'
+FOREIGN_TEAM = 'foreign_team'
+
+
+def find_draft_violations(match_ids=None):
+    """
+    벤픽 데이터를 검사하여 기계 판독용 보고서(dict)를 반환합니다.
+    match_ids를 주면 해당 경기만 검사합니다.
+
+    - missing_draft: 벤픽이 하나도 없는 경기
+    - action_count: 벤 10개/픽 10개, 순서 1~20이 아닌 경기
+      ((경기, 순서)가 유일하므로 개수 20개 + 최소 1 + 최대 20이면 순서 1~20이 모두 있음)
+    - duplicate_champion: 한 경기에 같은 챔피언이 두 번 이상 등장 (벤/픽 구분 없음)
+    - player_on_ban: 벤에 선수가 지정됨
+    - foreign_team: 경기의 두 팀이 아닌 팀의 벤픽
+    """
+    matches = Match.objects.all()
+    pick_bans = PickBan.objects.all()
+    if match_ids is not None:
+        matches = matches.filter(pk__in=match_ids)
+        pick_bans = pick_bans.filter(match_id__in=match_ids)
+
+    violations = []
+
+    for match_id in matches.filter(pickban__isnull=True).values_list('pk', flat=True):
+        violations.append({'check': MISSING_DRAFT, 'match_id': match_id})
+
+    counts = (
+        pick_bans.values('match_id')
+        .annotate(
+            total=Count('id'),
+            bans=Count('id', filter=Q(pb_type='BAN')),
+            picks=Count('id', filter=Q(pb_type='PICK')),
+            min_order=Min('order'),
+            max_order=Max('order'),
+        )
+        # exclude에 여러 조건을 주면 NOT (모두 만족)이므로 하나라도 어긋난 경기만 남음
+        .exclude(
+            total=ACTIONS_PER_DRAFT, bans=BANS_PER_DRAFT, picks=PICKS_PER_DRAFT,
+            min_order=1, max_order=ACTIONS_PER_DRAFT,
+        )
+        .order_by('match_id')
+    )
+    for row in counts:
+        violations.append({'check': ACTION_COUNT, **row})
+
+    duplicates = (
+        pick_bans.values('match_id', 'champion_id', 'champion__name')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .order_by('match_id', 'champion__name')
+    )
+    for row in duplicates:
+        violations.append({
+            'check': DUPLICATE_CHAMPION,
+            'match_id': row['match_id'],
+            'champion_id': row['champion_id'],
+            'champion': row['champion__name'],
+            'count': row['count'],
+        })
+
+    player_on_ban = (
+        pick_bans.filter(pb_type='BAN', player__isnull=False)
+        .values('id', 'match_id', 'order', 'player_id')
+        .order_by('match_id', 'order')
+    )
+    for row in player_on_ban:
+        violations.append({'check': PLAYER_ON_BAN, 'pick_ban_id': row.pop('id'), **row})
+
+    foreign_team = (
+        pick_bans.exclude(team=F('match__team_a')).exclude(team=F('match__team_b'))
+        .values('id', 'match_id', 'order', 'team_id')
+        .order_by('match_id', 'order')
+    )
+    for row in foreign_team:
+        violations.append({'check': FOREIGN_TEAM, 'pick_ban_id': row.pop('id'), **row})
+
+    return {
+        'checked_matches': matches.count(),
+        'checked_actions': pick_bans.count(),
+        'violation_count': len(violations),
+        'violations': violations,
+    }
@@ -1,12 +1,46 @@
 """
 정적 HTML 파일 생성 명령어
 GitHub Pages 배포용 docs 폴더에 정적 HTML을 생성합니다.
+
+페이지마다 원본 행·렌더링 코드·매핑(로고, 키워드, 챔피언 파일명)으로 만든 지문을
+docs/.export-manifest.json에 기록해 두고, 지문이 바뀐 페이지만 다시 씁니다.
+원본이 사라진 페이지는 manifest에 기록된 것만 삭제합니다 (직접 만든 페이지는 건드리지 않음).
+
+docs를 하드링크로 복제한 스테이징 폴더에서 작업한 뒤 폴더 이름을 바꿔 한 번에 게시하므로,
+중간에 실패해도 docs에는 이전 결과가 그대로 남습니다.
+Linux에서는 renameat2(RENAME_EXCHANGE)로 docs와 스테이징 폴더를 원자적으로 맞바꿔 docs가 없는 순간이 없고,
+지원하지 않는 환경에서는 이름 변경 두 번 사이에 docs가 잠깐 없는 구간이 생깁니다 (중단되면 다음 실행이 복구).
+동시 실행은 잠금 폴더(os.mkdir은 원자적)로 막습니다.
+내용이 같은 파일은 다시 쓰지 않아 수정 시각이 유지됩니다 (rsync 등은 실제로 바뀐 파일만 전송).
+
+페이지 공용 스타일(main/static/main/css/site.css)은 내용 해시를 붙인 static/css/site.<hash>.css로 게시하고
+페이지에는 첫 화면에 필요한 규칙만 인라인으로 둡니다 (파일 이름이 내용과 함께 바뀌므로 브라우저/CDN이 오래 캐시해도 안전).
+
+게시 전에 HTML/CSS/JS/JSON/SVG 파일마다 최고 압축 수준의 .gz(와 brotli가 설치되어 있으면 .br) 사본을 만듭니다.
+brotli가 없으면 경고를 출력하고 .br 없이 게시하며, --require-brotli를 주면 아무것도 바꾸지 않고 실패합니다.
 """
-from django.core.management.base import BaseCommand
-from django.template.loader import render_to_string
+import ctypes
+import errno
+import gzip
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
 from main.models import MatchStory, ChampionStat
 from main.templatetags.champion_filters import champion_filename
-import os
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 .br 사본은 만들지 않음
+    brotli = None
 
 # 팀 로고 매핑
 TEAM_LOGO_MAP = {
@@ -37,59 +71,447 @@ STAGE_NAMES = {
     'F': '결승'
 }
 
+# 페이지 지문 기록 파일 (docs 폴더 기준)
+MANIFEST_NAME = '.export-manifest.json'
+
+# 게시 전 작업 폴더 / 교체 직후 이전 docs를 잠시 두는 폴더 / 실행 잠금 폴더 (출력 폴더와 같은 상위 폴더 기준)
+STAGING_NAME = '.docs-staging'
+PREVIOUS_NAME = '.docs-previous'
+LOCK_NAME = '.docs-export.lock'
+
+# renameat2(2) 인자 (linux/fcntl.h, linux/fs.h)
+AT_FDCWD = -100
+RENAME_EXCHANGE = 2
+
+# 공용 스타일시트 원본 / 게시 폴더 (docs 폴더 기준)
+SITE_CSS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'static', 'main', 'css', 'site.css'
+)
+SITE_CSS_DIR = 'static/css'
+
+# 미리 압축해 둘 파일 확장자 / 압축 사본 확장자
+COMPRESSIBLE_EXTENSIONS = ('.html', '.css', '.js', '.json', '.svg')
+GZIP_SUFFIX = '.gz'
+BROTLI_SUFFIX = '.br'
+
+# 스토리 페이지에 출력되는 MatchStory 필드
+STORY_PAGE_FIELDS = (
+    'set_number', 'team_a', 'team_b', 'winner', 'final_score',
+    'match_overview', 'banpick_analysis', 'game_narrative', 'key_champions',
+)
+
+
+def split_champions(key_champions):
+    """'아지르, 오리아나' 형식의 주요 챔피언 문자열을 이름 목록으로 분리"""
+    return [c.strip() for c in key_champions.split(',') if c.strip()]
+
+
+def renderer_version(*functions):
+    """렌더링 함수(HTML 템플릿/CSS가 들어 있는 f-string 포함) 소스 코드의 해시"""
+    source = ''.join(inspect.getsource(function) for function in functions)
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+def page_fingerprint(inputs):
+    """페이지를 만드는 데 쓰인 입력 전체의 해시"""
+    serialized = json.dumps(inputs, cls=DjangoJSONEncoder, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+def link_or_copy(src, dst):
+    """하드링크로 복제 (지원하지 않는 파일 시스템이면 수정 시각을 유지하며 복사)"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def replace_file(output_path, data):
+    """
+    새 파일에 쓴 뒤 이름을 바꿔 교체합니다.
+    하드링크로 공유 중인 기존 파일(게시된 docs)은 건드리지 않습니다.
+    """
+    temp_path = f'{output_path}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, output_path)
+
+
+def write_if_changed(output_path, content):
+    """내용이 바뀐 경우에만 파일을 씁니다 (같으면 수정 시각 유지)."""
+    data = content.encode('utf-8')
+    try:
+        with open(output_path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    replace_file(output_path, data)
+    return True
+
+
+def compress_file(path):
+    """
+    path의 .gz/.br 사본을 최고 압축 수준으로 만들고 (원본 크기, {접미사: 사본 크기}, 새로 압축한 사본 수)를 반환합니다.
+    사본의 수정 시각을 원본과 맞춰 두어, 원본이 그대로면 다음 실행에서 다시 압축하지 않습니다.
+    """
+    source = os.stat(path)
+    compressors = {GZIP_SUFFIX: lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressors[BROTLI_SUFFIX] = lambda data: brotli.compress(data, quality=11)
+    elif os.path.exists(path + BROTLI_SUFFIX) and os.stat(path + BROTLI_SUFFIX).st_mtime_ns != source.st_mtime_ns:
+        # 갱신할 수 없는 .br은 원본과 내용이 달라지므로 삭제
+        os.remove(path + BROTLI_SUFFIX)
+
+    sizes, compressed = {}, 0
+    data = None
+    for suffix, compress in compressors.items():
+        sibling_path = path + suffix
+        try:
+            sibling = os.stat(sibling_path)
+            if sibling.st_mtime_ns == source.st_mtime_ns:
+                sizes[suffix] = sibling.st_size
+                continue
+        except FileNotFoundError:
+            pass
+
+        if data is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        compressed_data = compress(data)
+        replace_file(sibling_path, compressed_data)
+        os.utime(sibling_path, ns=(source.st_atime_ns, source.st_mtime_ns))
+        sizes[suffix] = len(compressed_data)
+        compressed += 1
+    return source.st_size, sizes, compressed
+
+
+def exchange_paths(path_a, path_b):
+    """두 경로를 원자적으로 맞바꿈 (Linux renameat2 RENAME_EXCHANGE). 지원하지 않으면 False"""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):  # glibc 2.28 미만 등
+        return False
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    if renameat2(AT_FDCWD, os.fsencode(path_a), AT_FDCWD, os.fsencode(path_b), RENAME_EXCHANGE) == 0:
+        return True
+    error = ctypes.get_errno()
+    if error in (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):  # 커널/파일 시스템이 교환을 지원하지 않음
+        return False
+    raise OSError(error, os.strerror(error), path_a, None, path_b)
+
+
+def render_page(output_path, method, kwargs):
+    """
+    Command().<method>(**kwargs)로 만든 HTML을 output_path에 저장합니다.
+    --jobs 작업 프로세스에서도 실행되므로 모듈 수준 함수로 둡니다 (인자는 모두 pickle 가능).
+    """
+    write_if_changed(output_path, getattr(Command(), method)(**kwargs))
+
+
+def render_page_task(task):
+    render_page(*task)
+
 
 class Command(BaseCommand):
     help = 'GitHub Pages용 정적 HTML 파일을 생성합니다.'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            metavar='DIR',
+            help='게시할 폴더 (기본값: 프로젝트 폴더의 docs). 스테이징/잠금 폴더는 같은 상위 폴더에 만듭니다.',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='지문이 같아도 모든 페이지를 다시 생성합니다.',
+        )
+        parser.add_argument(
+            '--jobs',
+            type=int,
+            default=1,
+            help='페이지를 렌더링할 프로세스 수 (기본값: 1, 0이면 CPU 수만큼)',
+        )
+        parser.add_argument(
+            '--require-brotli',
+            action='store_true',
+            help='brotli가 설치되어 있지 않으면 .br 사본 없이 게시하지 않고 실패합니다.',
+        )
+
     def handle(self, *args, **options):
-        base_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), 'docs')
+        project_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+        publish_dir = os.path.abspath(options['output'] or os.path.join(project_dir, 'docs'))
+        # 폴더 교체(이름 변경)는 같은 파일 시스템 안에서만 가능하므로 작업 폴더는 출력 폴더 옆에 둠
+        work_dir = os.path.dirname(publish_dir)
+        staging_dir = os.path.join(work_dir, STAGING_NAME)
+        previous_dir = os.path.join(work_dir, PREVIOUS_NAME)
+        lock_dir = os.path.join(work_dir, LOCK_NAME)
+        
+        self.stdout.write(f'📁 출력 폴더: {publish_dir}')
+
+        jobs = options['jobs'] or os.cpu_count() or 1
+        if jobs < 0:
+            raise CommandError('--jobs는 0 이상이어야 합니다.')
+        if brotli is None:
+            if options['require_brotli']:
+                raise CommandError('brotli가 설치되어 있지 않아 .br 사본을 만들 수 없습니다 (pip install brotli).')
+            self.stderr.write(self.style.WARNING(
+                '⚠️ brotli가 설치되어 있지 않아 .br 사본을 만들지 않습니다. 기존 .br 사본은 원본이 바뀌면 삭제됩니다 '
+                '(pip install brotli, 또는 --require-brotli로 실패 처리).'
+            ))
+
+        self.acquire_lock(lock_dir)
+        try:
+            self.recover_publish(publish_dir, previous_dir)
+            self.prepare_staging(publish_dir, staging_dir)
+            try:
+                self.export_site(staging_dir, options['force'], jobs)
+                self.compress_site(staging_dir, jobs)
+            except BaseException:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                raise
+            self.publish(staging_dir, publish_dir, previous_dir)
+        finally:
+            os.rmdir(lock_dir)
         
-        self.stdout.write(f'📁 출력 폴더: {base_dir}')
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 정적 HTML 생성 완료! (재생성 {self.counts['rebuilt']}개, "
+            f"건너뜀 {self.counts['skipped']}개, 삭제 {self.counts['deleted']}개)"
+        ))
+
+    def acquire_lock(self, lock_dir):
+        """잠금 폴더 생성 (os.mkdir은 원자적이라 동시에 실행된 export 중 하나만 성공)"""
+        try:
+            os.mkdir(lock_dir)
+        except FileExistsError:
+            raise CommandError(
+                f'다른 export_static이 실행 중입니다: {lock_dir}\n'
+                '실행 중인 export가 없다면(비정상 종료) 잠금 폴더를 삭제한 뒤 다시 실행하세요.'
+            )
+
+    def recover_publish(self, publish_dir, previous_dir):
+        """이전 실행이 폴더 교체 도중 중단되었으면 정리"""
+        if not os.path.exists(previous_dir):
+            return
+        if os.path.exists(publish_dir):
+            shutil.rmtree(previous_dir)
+        else:
+            os.rename(previous_dir, publish_dir)
+            self.stdout.write(self.style.WARNING('⚠️ 중단된 게시를 되돌려 이전 docs를 복구했습니다.'))
+
+    def prepare_staging(self, publish_dir, staging_dir):
+        """docs를 하드링크로 복제한 스테이징 폴더 생성 (잠금을 잡은 뒤이므로 남아 있는 폴더는 중단된 실행의 잔재)"""
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        if os.path.exists(publish_dir):
+            shutil.copytree(publish_dir, staging_dir, copy_function=link_or_copy)
+        else:
+            os.makedirs(staging_dir)
+
+    def publish(self, staging_dir, publish_dir, previous_dir):
+        """
+        스테이징 폴더를 docs 자리로 교체 (같은 파일 시스템 안의 이름 변경).
+        가능하면 두 폴더를 원자적으로 맞바꾸고, 아니면 docs → previous, staging → docs 순서로 이름을 바꿉니다
+        (두 번째 이름 변경 전까지 docs가 잠깐 없으며, 그 사이 중단되면 recover_publish가 previous를 되돌림).
+        """
+        if os.path.exists(publish_dir) and exchange_paths(staging_dir, publish_dir):
+            shutil.rmtree(staging_dir, ignore_errors=True)  # 이제 이전 docs가 들어 있음
+            return
+        if os.path.exists(publish_dir):
+            os.rename(publish_dir, previous_dir)
+        os.rename(staging_dir, publish_dir)
+        shutil.rmtree(previous_dir, ignore_errors=True)
+
+    def export_site(self, base_dir, force, jobs):
+        """base_dir(스테이징 폴더)에 바뀐 페이지를 생성하고 manifest 갱신"""
+        manifest_path = os.path.join(base_dir, MANIFEST_NAME)
+
+        self.force = force
+        self.previous = self.load_manifest(manifest_path)
+        self.fingerprints = {}
+        self.pending = []
+        self.counts = Counter()
+
+        # 공용 스타일시트 생성 (페이지가 해시가 붙은 파일 이름을 참조하므로 먼저)
+        self.export_stylesheet(base_dir)
         
         # 스토리 페이지 생성
         self.export_story_pages(base_dir)
         
         # 챔피언 통계 페이지 생성
         self.export_champion_stats(base_dir)
-        
-        self.stdout.write(self.style.SUCCESS('✅ 정적 HTML 생성 완료!'))
+
+        # 바뀐 페이지 렌더링/저장
+        self.write_pages(jobs)
+
+        # 원본이 사라진 페이지 삭제
+        self.remove_stale_pages(base_dir)
+        self.save_manifest(manifest_path)
+
+    def load_manifest(self, manifest_path):
+        """이전 실행의 페이지별 지문 ({상대 경로: 지문})"""
+        try:
+            with open(manifest_path, encoding='utf-8') as f:
+                return json.load(f).get('pages', {})
+        except FileNotFoundError:
+            return {}
+        except (ValueError, AttributeError):
+            self.stdout.write(self.style.WARNING(f'⚠️ manifest를 읽을 수 없어 전체를 다시 생성합니다: {manifest_path}'))
+            return {}
+
+    def save_manifest(self, manifest_path):
+        manifest = json.dumps({'pages': self.fingerprints}, ensure_ascii=False, indent=2, sort_keys=True)
+        write_if_changed(manifest_path, manifest + '\n')
+
+    def export_page(self, base_dir, rel_path, inputs, method, **kwargs):
+        """
+        입력 지문이 이전 실행과 같고 파일이 남아 있으면 건너뛰고,
+        아니면 self.<method>(**kwargs)로 다시 만들도록 write_pages 대기열에 추가합니다.
+        rel_path는 docs 폴더 기준 '/' 구분 경로입니다.
+        """
+        fingerprint = page_fingerprint(inputs)
+        self.fingerprints[rel_path] = fingerprint
+        output_path = os.path.join(base_dir, *rel_path.split('/'))
+
+        if not self.force and self.previous.get(rel_path) == fingerprint and os.path.exists(output_path):
+            self.counts['skipped'] += 1
+            return
+
+        self.pending.append((rel_path, (output_path, method, kwargs)))
+
+    def write_pages(self, jobs):
+        """
+        대기열의 페이지를 렌더링해 저장합니다.
+        jobs가 2 이상이면 프로세스 풀에 나눠 맡기며, 같은 함수에 같은 입력을 넘기므로 결과 파일은 순차 실행과 같습니다.
+        """
+        tasks = [task for _, task in self.pending]
+        if jobs > 1 and len(tasks) > 1:
+            # 작업 하나가 페이지 하나라 가벼우므로 여러 개씩 묶어 전달 비용을 줄임
+            chunksize = max(1, len(tasks) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs, initializer=django.setup) as executor:
+                for _ in executor.map(render_page_task, tasks, chunksize=chunksize):
+                    pass
+        else:
+            for task in tasks:
+                render_page(*task)
+
+        for rel_path, _ in self.pending:
+            self.counts['rebuilt'] += 1
+            self.stdout.write(f'  📄 생성: {rel_path}')
+
+    def remove_stale_pages(self, base_dir):
+        """이전 manifest에는 있었지만 이번에 생성되지 않은 페이지와 빈 폴더 삭제"""
+        for rel_path in sorted(set(self.previous) - set(self.fingerprints)):
+            output_path = os.path.join(base_dir, *rel_path.split('/'))
+            if os.path.exists(output_path):
+                os.remove(output_path)
+                self.counts['deleted'] += 1
+                self.stdout.write(f'  🗑️ 삭제: {rel_path}')
+            # 압축 사본도 함께 지워야 빈 폴더가 정리됨
+            for suffix in (GZIP_SUFFIX, BROTLI_SUFFIX):
+                if os.path.exists(output_path + suffix):
+                    os.remove(output_path + suffix)
+
+            directory = os.path.dirname(output_path)
+            while directory != base_dir and os.path.isdir(directory) and not os.listdir(directory):
+                os.rmdir(directory)
+                directory = os.path.dirname(directory)
+
+    def compress_site(self, base_dir, jobs):
+        """압축 대상 파일마다 .gz/.br 사본을 작업 스레드 풀에서 생성하고 절감량 출력 (zlib/brotli는 압축 중 GIL을 풂)"""
+        sources, orphans = [], []
+        for directory, _, filenames in os.walk(base_dir):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                if filename.startswith('.'):
+                    continue
+                if filename.endswith((GZIP_SUFFIX, BROTLI_SUFFIX)):
+                    # 원본이 삭제된 압축 사본
+                    source_path = os.path.splitext(path)[0]
+                    if source_path.endswith(COMPRESSIBLE_EXTENSIONS) and not os.path.exists(source_path):
+                        orphans.append(path)
+                elif filename.endswith(COMPRESSIBLE_EXTENSIONS):
+                    sources.append(path)
+
+        for path in orphans:
+            os.remove(path)
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(compress_file, sources))
+
+        original_size = sum(size for size, _, _ in results)
+        compressed = sum(count for _, _, count in results)
+        summary = [f'원본 {original_size / 1024:.1f}KB']
+        for suffix, label in ((GZIP_SUFFIX, 'gzip'), (BROTLI_SUFFIX, 'brotli')):
+            if brotli is None and suffix == BROTLI_SUFFIX:
+                summary.append('brotli 미설치로 .br 생략')
+                continue
+            size = sum(sizes[suffix] for _, sizes, _ in results)
+            saved = (1 - size / original_size) * 100 if original_size else 0
+            summary.append(f'{label} {size / 1024:.1f}KB (-{saved:.1f}%)')
+
+        self.stdout.write(
+            f"  🗜️ 압축: 파일 {len(sources)}개, 새로 압축 {compressed}개, 삭제 {len(orphans)}개 | " + ', '.join(summary)
+        )
+
+    def export_stylesheet(self, base_dir):
+        """site.css를 내용 해시가 붙은 이름으로 게시하고 self.stylesheet(docs 기준 경로)에 기록"""
+        with open(SITE_CSS_PATH, encoding='utf-8') as f:
+            css = f.read()
+        content_hash = hashlib.sha256(css.encode('utf-8')).hexdigest()[:12]
+        self.stylesheet = f'{SITE_CSS_DIR}/site.{content_hash}.css'
+        # 이전 해시의 파일은 manifest에서 빠지므로 remove_stale_pages가 삭제
+        self.export_page(base_dir, self.stylesheet, {'css': css}, 'render_stylesheet', css=css)
+
+    def render_stylesheet(self, css):
+        return css
 
     def export_story_pages(self, base_dir):
         """각 경기 스토리 페이지를 정적 HTML로 생성"""
         stages = ['QF', 'SF', 'F']
+        renderer = renderer_version(self.generate_story_html)
+
+        # 전체 스토리를 한 번에 조회해 (단계, 경기 번호)별로 묶음
+        stories_by_match = {stage: {} for stage in stages}
+        stories = MatchStory.objects.filter(stage__in=stages).order_by('match_number', 'set_number')
+        for story in stories:
+            stories_by_match[story.stage].setdefault(story.match_number, []).append(story)
         
         for stage in stages:
-            stories_by_match = {}
-            stories = MatchStory.objects.filter(stage=stage).order_by('match_number', 'set_number')
-            
-            for story in stories:
-                key = story.match_number
-                if key not in stories_by_match:
-                    stories_by_match[key] = []
-                stories_by_match[key].append(story)
-            
-            for match_number, match_stories in stories_by_match.items():
+            for match_number, match_stories in stories_by_match[stage].items():
                 first_story = match_stories[0]
-                
-                html_content = self.generate_story_html(
+                champions = {
+                    c for story in match_stories for c in split_champions(story.key_champions)
+                }
+                inputs = {
+                    'renderer': renderer,
+                    'stage_name': STAGE_NAMES.get(stage, stage),
+                    'keywords': MATCH_KEYWORDS.get((stage, match_number), []),
+                    'team_logos': [TEAM_LOGO_MAP.get(first_story.team_a, ''), TEAM_LOGO_MAP.get(first_story.team_b, '')],
+                    'champion_files': {c: champion_filename(c) for c in champions},
+                    'stylesheet': self.stylesheet,
+                    'stories': [
+                        {field: getattr(story, field) for field in STORY_PAGE_FIELDS}
+                        for story in match_stories
+                    ],
+                }
+
+                self.export_page(
+                    base_dir,
+                    f'stories/{stage}/{match_number}/index.html',
+                    inputs,
+                    'generate_story_html',
                     stage=stage,
                     match_number=match_number,
                     stories=match_stories,
-                    first_story=first_story
+                    first_story=first_story,
+                    stylesheet=f'../../../{self.stylesheet}',
                 )
-                
-                # 폴더 생성
-                output_dir = os.path.join(base_dir, 'stories', stage, str(match_number))
-                os.makedirs(output_dir, exist_ok=True)
-                
-                # HTML 파일 저장
-                output_path = os.path.join(output_dir, 'index.html')
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                
-                self.stdout.write(f'  📄 생성: stories/{stage}/{match_number}/index.html')
 
-    def generate_story_html(self, stage, match_number, stories, first_story):
+    def generate_story_html(self, stage, match_number, stories, first_story, stylesheet):
         """스토리 상세 페이지 HTML 생성"""
         keywords = MATCH_KEYWORDS.get((stage, match_number), [])
         team_a_logo = TEAM_LOGO_MAP.get(first_story.team_a, '')
@@ -104,7 +526,7 @@ class Command(BaseCommand):
             # 주요 챔피언 HTML
             key_champions_html = ""
             if story.key_champions:
-                champions = [c.strip() for c in story.key_champions.split(',') if c.strip()]
+                champions = split_champions(story.key_champions)
                 if champions:
                     champions_items = []
                     for c in champions:
@@ -182,122 +604,10 @@ class Command(BaseCommand):
         background-image: radial-gradient(ellipse at top, rgba(200, 155, 60, 0.05) 0%, transparent 50%);
     }}
     .container {{ max-width: 900px; margin: 0 auto; padding: 40px 20px; }}
-    .back-link {{
-        display: inline-flex; align-items: center; gap: 8px;
-        color: var(--text-secondary); text-decoration: none;
-        margin-bottom: 30px; font-size: 0.95rem; transition: color 0.2s;
-    }}
-    .back-link:hover {{ color: var(--gold-primary); }}
-    .header {{
-        text-align: center; margin-bottom: 40px; padding: 40px;
-        background: var(--bg-card); border-radius: 16px; border: 1px solid var(--border-color);
-    }}
-    .stage-badge {{
-        display: inline-block; font-family: 'Orbitron', sans-serif; font-size: 0.85rem;
-        background: var(--gold-primary); color: var(--bg-dark);
-        padding: 6px 16px; border-radius: 4px; font-weight: 700; margin-bottom: 16px;
-    }}
-    .match-title {{
-        font-family: 'Orbitron', sans-serif; font-size: 2rem; font-weight: 900;
-        color: var(--text-primary); margin-bottom: 12px; display: flex;
-        align-items: center; justify-content: center; gap: 16px; flex-wrap: wrap;
-    }}
-    .team-logo {{ width: 48px; height: 48px; object-fit: contain; }}
-    .team-with-logo {{ display: flex; align-items: center; gap: 8px; }}
-    .vs-divider {{ color: var(--red-accent); margin: 0 12px; font-size: 1.2rem; }}
-    .final-score {{
-        font-family: 'Orbitron', sans-serif; font-size: 2.5rem; font-weight: 900;
-        color: var(--gold-primary); margin-top: 12px;
-    }}
-    .keywords-container {{
-        display: flex; flex-wrap: wrap; justify-content: center; gap: 12px;
-        margin-top: 24px; padding-top: 20px; border-top: 1px solid var(--border-color);
-    }}
-    .keyword-tag {{
-        font-family: 'Orbitron', sans-serif; font-size: 1.1rem; font-weight: 700;
-        color: var(--blue-accent); background: rgba(10, 200, 185, 0.1);
-        padding: 8px 16px; border-radius: 24px; border: 1px solid rgba(10, 200, 185, 0.3);
-        transition: all 0.3s ease;
-    }}
-    .keyword-tag::before {{ content: '#'; opacity: 0.7; }}
-    .keyword-tag:hover {{
-        background: rgba(10, 200, 185, 0.2); transform: translateY(-2px);
-    }}
-    .overview-section {{
-        background: var(--bg-card); border-radius: 16px; padding: 30px;
-        margin-bottom: 30px; border: 1px solid var(--border-color);
-    }}
-    .overview-title {{
-        display: flex; align-items: center; gap: 12px;
-        font-family: 'Orbitron', sans-serif; font-size: 1.2rem;
-        color: var(--gold-primary); margin-bottom: 16px;
-    }}
-    .overview-text {{ color: var(--text-secondary); line-height: 1.9; }}
-    .set-card {{
-        background: var(--bg-card); border-radius: 16px; border: 1px solid var(--border-color);
-        margin-bottom: 24px; overflow: hidden; transition: border-color 0.3s ease;
-    }}
-    .set-card:hover {{ border-color: var(--gold-primary); }}
-    .set-header {{
-        background: linear-gradient(180deg, #1a2332 0%, #111827 100%);
-        padding: 20px 24px; border-bottom: 1px solid var(--border-color);
-        display: flex; justify-content: space-between; align-items: center;
-    }}
-    .set-number {{ font-family: 'Orbitron', sans-serif; font-size: 1.3rem; font-weight: 700; }}
-    .set-winner {{
-        font-size: 0.9rem; padding: 6px 16px; border-radius: 20px; font-weight: 600;
-    }}
-    .set-winner.team-a {{ background: rgba(10, 200, 185, 0.2); color: var(--blue-accent); border: 1px solid var(--blue-accent); }}
-    .set-winner.team-b {{ background: rgba(255, 70, 85, 0.2); color: var(--red-accent); border: 1px solid var(--red-accent); }}
-    .set-body {{ padding: 24px; }}
-    .analysis-section {{ margin-bottom: 24px; }}
-    .analysis-label {{
-        display: flex; align-items: center; gap: 8px;
-        font-family: 'Orbitron', sans-serif; font-size: 0.9rem;
-        color: var(--gold-primary); margin-bottom: 12px;
-    }}
-    .analysis-content {{
-        color: var(--text-secondary); line-height: 1.9; font-size: 0.95rem;
-        padding-left: 28px; border-left: 2px solid var(--border-color);
-    }}
-    .key-champions {{ margin-bottom: 24px; }}
-    .key-champions-title {{
-        display: flex; align-items: center; gap: 8px;
-        font-size: 0.9rem; color: var(--gold-primary); margin-bottom: 12px;
-    }}
-    .champions-grid {{ display: flex; flex-wrap: wrap; gap: 12px; justify-content: center; }}
-    .champion-item {{ display: flex; flex-direction: column; align-items: center; gap: 6px; transition: transform 0.2s ease; }}
-    .champion-item:hover {{ transform: scale(1.1); }}
-    .champion-portrait {{
-        width: 56px; height: 56px; border-radius: 8px; border: 2px solid var(--gold-primary);
-        background: var(--bg-hover); object-fit: cover; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.4);
-    }}
-    .champion-portrait.placeholder {{
-        display: flex; align-items: center; justify-content: center;
-        font-size: 1.5rem; color: var(--gold-primary);
-    }}
-    img.champion-portrait {{ display: block; }}
-    .champion-name {{ font-size: 0.7rem; color: var(--text-secondary); text-align: center; max-width: 60px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }}
-    .nav-buttons {{ display: flex; justify-content: space-between; margin-top: 40px; gap: 16px; }}
-    .nav-btn {{
-        flex: 1; padding: 16px 24px; background: var(--bg-card);
-        border: 1px solid var(--border-color); border-radius: 8px;
-        color: var(--text-secondary); text-decoration: none; text-align: center;
-        font-weight: 500; transition: all 0.3s ease;
-    }}
-    .nav-btn:hover {{ border-color: var(--gold-primary); color: var(--gold-primary); }}
-    .footer {{
-        text-align: center; margin-top: 60px; padding: 30px;
-        border-top: 1px solid var(--border-color); color: var(--text-secondary);
-    }}
-    @media (max-width: 768px) {{
-        .match-title {{ font-size: 1.4rem; }}
-        .final-score {{ font-size: 2rem; }}
-        .nav-buttons {{ flex-direction: column; }}
-    }}
 </style>
+<link rel="stylesheet" href="{stylesheet}">
 </head>
-<body>
+<body class="story-page">
     <div class="container">
         <a href="../../" class="back-link">← 스토리 목록으로 돌아가기</a>
         
@@ -341,8 +651,34 @@ class Command(BaseCommand):
 
     def export_champion_stats(self, base_dir):
         """챔피언 통계 페이지를 정적 HTML로 생성"""
-        stats = list(ChampionStat.objects.select_related('champion').order_by('-tier_score'))
-        
+        # 같은 티어 점수는 id 순 (실행마다 순서가 같아야 지문도 같음)
+        stats = list(ChampionStat.objects.select_related('champion').order_by('-tier_score', 'id'))
+        inputs = {
+            'renderer': renderer_version(self.render_champion_stats, self.generate_champion_stats_html),
+            'stylesheet': self.stylesheet,
+            'stats': [
+                {
+                    'name': stat.champion.name,
+                    'filename': champion_filename(stat.champion.name),
+                    'tier_score': stat.tier_score,
+                    'total_picks': stat.total_picks,
+                    'blue_first_pick': stat.blue_first_pick,
+                    'red_first_pick': stat.red_first_pick,
+                    'side_index': stat.side_index,
+                    'side_preference': stat.side_preference,
+                    'side_preference_display': stat.get_side_preference_display(),
+                }
+                for stat in stats
+            ],
+        }
+
+        self.export_page(
+            base_dir, 'champions/index.html', inputs, 'render_champion_stats',
+            stats=stats, stylesheet=f'../{self.stylesheet}',
+        )
+
+    def render_champion_stats(self, stats, stylesheet):
+        """챔피언 통계 페이지 HTML (tier_score 내림차순 stats)"""
         # 통계 계산
         total_picks = sum(s.total_picks for s in stats)
         blue_picks = sum(s.blue_first_pick for s in stats)
@@ -386,21 +722,16 @@ class Command(BaseCommand):
             </tr>
             '''
         
-        html_content = self.generate_champion_stats_html(
+        return self.generate_champion_stats_html(
             stats_count=len(stats),
             max_tier=max_tier,
             total_picks=total_picks,
             blue_picks=blue_picks,
-            rows_html=rows_html
+            rows_html=rows_html,
+            stylesheet=stylesheet
         )
-        
-        output_path = os.path.join(base_dir, 'champions', 'index.html')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        self.stdout.write(f'  📄 생성: champions/index.html')
 
-    def generate_champion_stats_html(self, stats_count, max_tier, total_picks, blue_picks, rows_html):
+    def generate_champion_stats_html(self, stats_count, max_tier, total_picks, blue_picks, rows_html, stylesheet):
         """챔피언 통계 페이지 HTML 생성"""
         return f'''<!DOCTYPE html>
 <html lang="ko">
@@ -423,147 +754,10 @@ class Command(BaseCommand):
         background-image: radial-gradient(ellipse at top, rgba(200, 155, 60, 0.05) 0%, transparent 50%);
     }}
     .container {{ max-width: 1400px; margin: 0 auto; padding: 40px 20px; }}
-    .header {{ text-align: center; margin-bottom: 50px; position: relative; }}
-    .header::before {{
-        content: ''; position: absolute; top: 50%; left: 0; right: 0; height: 1px;
-        background: linear-gradient(90deg, transparent, var(--gold-primary), transparent);
-    }}
-    .header-content {{ display: inline-block; background: var(--bg-dark); padding: 0 40px; position: relative; }}
-    .title {{
-        font-family: 'Orbitron', sans-serif; font-size: 2.8rem; font-weight: 900;
-        background: var(--gradient-gold); -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent; letter-spacing: 3px; text-transform: uppercase;
-    }}
-    .subtitle {{ font-size: 1rem; color: var(--text-secondary); letter-spacing: 2px; }}
-    .nav-bar {{ display: flex; justify-content: center; gap: 20px; margin-bottom: 40px; }}
-    .nav-link {{
-        color: var(--text-secondary); text-decoration: none; padding: 12px 24px;
-        border: 1px solid var(--border-color); border-radius: 4px; transition: all 0.3s ease;
-    }}
-    .nav-link:hover, .nav-link.active {{ color: var(--gold-primary); border-color: var(--gold-primary); background: rgba(200, 155, 60, 0.1); }}
-    .filter-controls {{
-        display: flex; flex-wrap: wrap; justify-content: center; gap: 10px; margin-bottom: 30px;
-    }}
-    .filter-btn {{
-        padding: 10px 20px; border: 1px solid var(--border-color); border-radius: 25px;
-        background: transparent; color: var(--text-secondary); cursor: pointer;
-        transition: all 0.3s ease; font-family: 'Noto Sans KR', sans-serif; font-size: 0.9rem;
-    }}
-    .filter-btn:hover, .filter-btn.active {{
-        border-color: var(--blue-accent); color: var(--blue-accent); background: rgba(10, 200, 185, 0.1);
-    }}
-    .filter-btn.blue {{ border-color: #4a90d9; color: #4a90d9; }}
-    .filter-btn.blue:hover, .filter-btn.blue.active {{ background: rgba(74, 144, 217, 0.2); }}
-    .filter-btn.red {{ border-color: #d94a4a; color: #d94a4a; }}
-    .filter-btn.red:hover, .filter-btn.red.active {{ background: rgba(217, 74, 74, 0.2); }}
-    .filter-btn.balanced {{ border-color: #7a7a7a; color: #7a7a7a; }}
-    .filter-btn.balanced:hover, .filter-btn.balanced.active {{ background: rgba(122, 122, 122, 0.2); }}
-    .champion-table th {{ cursor: pointer; }}
-    .champion-table th:hover {{ background: #1f2d40; }}
-    .stats-summary {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-bottom: 40px; }}
-    .stat-card {{
-        background: var(--bg-card); border: 1px solid var(--border-color);
-        border-radius: 8px; padding: 24px; text-align: center; transition: all 0.3s ease;
-    }}
-    .stat-card:hover {{ border-color: var(--gold-primary); transform: translateY(-3px); }}
-    .stat-value {{ font-family: 'Orbitron', sans-serif; font-size: 2.5rem; font-weight: 700; color: var(--gold-primary); }}
-    .stat-label {{ font-size: 0.9rem; color: var(--text-secondary); text-transform: uppercase; letter-spacing: 1px; }}
-    .table-container {{
-        background: var(--bg-card); border-radius: 12px; border: 1px solid var(--border-color);
-        overflow: hidden; box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
-    }}
-    .champion-table {{ width: 100%; border-collapse: collapse; }}
-    .champion-table th {{
-        background: linear-gradient(180deg, #1a2332 0%, #111827 100%);
-        padding: 18px 16px; text-align: left; font-weight: 600; color: var(--gold-primary);
-        text-transform: uppercase; font-size: 0.85rem; letter-spacing: 1px;
-        border-bottom: 2px solid var(--gold-primary);
-    }}
-    .champion-table td {{ padding: 16px; border-bottom: 1px solid var(--border-color); }}
-    .champion-table tbody tr {{ transition: all 0.2s ease; }}
-    .champion-table tbody tr:hover {{ background: var(--bg-hover); }}
-    .rank-badge {{
-        display: inline-flex; align-items: center; justify-content: center;
-        width: 32px; height: 32px; border-radius: 50%;
-        font-family: 'Orbitron', sans-serif; font-weight: 700; font-size: 0.85rem;
-    }}
-    .rank-1 {{ background: linear-gradient(135deg, #ffd700, #b8860b); color: #000; }}
-    .rank-2 {{ background: linear-gradient(135deg, #c0c0c0, #808080); color: #000; }}
-    .rank-3 {{ background: linear-gradient(135deg, #cd7f32, #8b4513); color: #fff; }}
-    .rank-default {{ background: var(--bg-dark); color: var(--text-secondary); border: 1px solid var(--border-color); }}
-    .champion-name {{ font-weight: 600; font-size: 1.05rem; display: flex; align-items: center; gap: 12px; }}
-    .champion-icon {{
-        width: 40px; height: 40px; border-radius: 50%; background: var(--bg-dark);
-        border: 2px solid var(--gold-primary); object-fit: cover;
-    }}
-    img.champion-icon {{ display: block; }}
-    .champion-icon.placeholder {{
-        display: flex; align-items: center; justify-content: center; font-size: 1.2rem;
-    }}
-    .tier-bar-container {{ display: flex; align-items: center; gap: 12px; }}
-    .tier-bar {{ width: 120px; height: 8px; background: var(--bg-dark); border-radius: 4px; overflow: hidden; }}
-    .tier-bar-fill {{ height: 100%; border-radius: 4px; }}
-    .tier-value {{ font-family: 'Orbitron', sans-serif; font-weight: 600; color: var(--gold-primary); min-width: 40px; }}
-    .pick-stats {{ display: flex; gap: 8px; }}
-    .pick-stat {{ padding: 4px 12px; border-radius: 4px; font-size: 0.9rem; font-weight: 500; }}
-    .pick-stat.total {{ background: rgba(200, 155, 60, 0.2); color: var(--gold-primary); }}
-    .pick-stat.blue {{ background: rgba(74, 144, 217, 0.2); color: #4a90d9; }}
-    .pick-stat.red {{ background: rgba(217, 74, 74, 0.2); color: #d94a4a; }}
-    .side-badge {{
-        display: inline-flex; align-items: center; gap: 6px;
-        padding: 6px 14px; border-radius: 20px; font-size: 0.85rem; font-weight: 500;
-    }}
-    .side-badge.BLUE_MUST {{ background: rgba(74, 144, 217, 0.3); color: #6db3f2; border: 1px solid #4a90d9; }}
-    .side-badge.BLUE_PREF {{ background: rgba(74, 144, 217, 0.2); color: #4a90d9; }}
-    .side-badge.BLUE_WEAK {{ background: rgba(74, 144, 217, 0.1); color: #4a90d9; }}
-    .side-badge.BALANCED {{ background: rgba(160, 155, 140, 0.2); color: var(--text-secondary); }}
-    .side-badge.RED_WEAK {{ background: rgba(217, 74, 74, 0.1); color: #d94a4a; }}
-    .side-badge.RED_PREF {{ background: rgba(217, 74, 74, 0.2); color: #d94a4a; }}
-    .side-badge.RED_MUST {{ background: rgba(217, 74, 74, 0.3); color: #f26d6d; border: 1px solid #d94a4a; }}
-    .side-index {{ font-family: 'Orbitron', sans-serif; font-weight: 600; }}
-    .analysis-principles {{
-        background: var(--bg-card); border: 1px solid var(--border-color);
-        border-radius: 12px; padding: 30px; margin-top: 40px;
-    }}
-    .analysis-title {{
-        font-family: 'Orbitron', sans-serif; font-size: 1.3rem; color: #28a745;
-        margin-bottom: 24px; padding-bottom: 12px; border-bottom: 1px solid var(--border-color);
-        display: flex; align-items: center; gap: 10px;
-    }}
-    .principles-grid {{
-        display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-        gap: 20px; margin-bottom: 24px;
-    }}
-    .principle-card {{
-        background: var(--bg-dark); border: 1px solid #28a745; border-radius: 8px; padding: 20px;
-    }}
-    .principle-card h4 {{
-        font-family: 'Orbitron', sans-serif; font-size: 1rem; color: var(--gold-primary);
-        margin-bottom: 10px; display: flex; align-items: center; gap: 8px;
-    }}
-    .principle-card p {{ font-size: 0.9rem; color: var(--text-secondary); line-height: 1.7; }}
-    .principle-card ul {{ list-style: none; padding-left: 0; margin-top: 10px; }}
-    .principle-card ul li {{ font-size: 0.85rem; color: var(--text-secondary); margin-bottom: 5px; padding-left: 1em; }}
-    .principle-card ul li::before {{ content: '•'; color: #28a745; display: inline-block; width: 1em; margin-left: -1em; }}
-    .caution-box {{
-        background: rgba(255, 70, 85, 0.1); border: 1px solid var(--red-accent);
-        border-radius: 8px; padding: 20px; color: var(--red-accent); font-size: 0.9rem; line-height: 1.6;
-    }}
-    .caution-box strong {{ color: var(--gold-primary); }}
-    .footer {{
-        text-align: center; margin-top: 60px; padding: 30px;
-        border-top: 1px solid var(--border-color); color: var(--text-secondary);
-    }}
-    .footer a {{ color: var(--gold-primary); text-decoration: none; }}
-    @media (max-width: 768px) {{
-        .title {{ font-size: 1.8rem; }}
-        .stats-summary {{ grid-template-columns: repeat(2, 1fr); }}
-        .champion-table {{ font-size: 0.85rem; }}
-        .tier-bar {{ width: 60px; }}
-    }}
 </style>
+<link rel="stylesheet" href="{stylesheet}">
 </head>
-<body>
+<body class="champions-page">
     <div class="container">
         <header class="header">
             <div class="header-content">
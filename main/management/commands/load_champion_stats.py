@@ -1,91 +1,506 @@
 import csv
-from django.core.management.base import BaseCommand
+import glob
+import hashlib
+import json
+from pathlib import Path
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
-from main.models import Champion, ChampionStat
+from django.db import transaction
+from main.api_cache import CHAMPIONS, bump_version
+from main.models import (
+    CHAMPION_STAT_FIELDS, Champion, ChampionStat, ChampionStatSource, champion_stat_fingerprint,
+)
+
+
+# bulk upsert 시 충돌하면 갱신할 필드 목록 (CSV 통계 필드 + 내용 지문)
+UPSERT_FIELDS = CHAMPION_STAT_FIELDS + ['content_hash']
+
+# CSV 컬럼명
+NAME_COLUMN = '챔피언'
+SIDE_INDEX_COLUMN = 'Side Index (진영 선호도)'
+NUMERIC_COLUMNS = {
+    'total_picks': '총 픽 횟수 (Total)',
+    'blue_first_pick': '블루 1픽 (Blue 1st)',
+    'red_first_pick': '레드 1픽 (Red 1st)',
+    'tier_score': 'Tier Score (가치 점수)',
+}
+INTEGER_FIELDS = ['total_picks', 'blue_first_pick', 'red_first_pick']
+FLOAT_FIELDS = ['tier_score', 'side_index']
+
+# Side Index 형식: "0.67 (블루 선호)" -> 수치, 괄호 안 라벨
+SIDE_INDEX_PATTERN = r'^\s*([-+]?\d+(?:\.\d+)?)\s*\(\s*([^()]*?)\s*\)\s*$'
+# 라벨 -> 코드 매핑은 모델의 선택지를 그대로 사용
+SIDE_LABEL_TO_CODE = {label: code for code, label in ChampionStat.SIDE_PREFERENCE_CHOICES}
+
+# --chunk-size를 지정하지 않았을 때 CSV를 나눠 읽는 행 수
+DEFAULT_CHUNK_SIZE = 5000
 
 
 class Command(BaseCommand):
     help = 'prechampions.csv 파일에서 챔피언 통계 데이터를 로드합니다.'
-    
-    def parse_side_preference(self, side_index_str):
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            action='append',
+            dest='paths',
+            metavar='PATH_OR_GLOB',
+            help='로드할 CSV 파일 경로 또는 glob 패턴 (여러 번 지정 가능, .csv.gz 지원). '
+                 '지정하지 않으면 BASE_DIR/prechampions.csv를 사용합니다.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='스트리밍 모드: 파일을 N행 단위로 읽어 청크마다 일괄 upsert 후 커밋합니다 '
+                 '(--bulk 포함). 입력 크기와 관계없이 메모리 사용량이 일정합니다.',
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='증분 모드: 체크섬이 같은 파일은 건너뛰고, 내용 지문이 달라진 행만 기록합니다. '
+                 '추가/변경/유지/삭제 요약을 출력합니다 (--chunk-size와 함께 사용 가능).',
+        )
+        parser.add_argument(
+            '--summary-json',
+            metavar='PATH',
+            help='--incremental 모드의 변경 요약을 JSON 파일로 저장합니다 (캐시 무효화 범위 지정용).',
+        )
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='챔피언 조회/생성과 통계 upsert를 배치 쿼리로 묶어 하나의 트랜잭션에서 처리합니다.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='--bulk 모드에서 한 번에 INSERT/UPSERT 할 행 수 (기본값: 500)',
+        )
+        parser.add_argument(
+            '--rejects',
+            metavar='PATH',
+            help='파싱할 수 없는 행(파일, 줄 번호, 원본 값, 사유)을 CSV로 저장합니다.',
+        )
+
+    def parse_side_index(self, column):
         """
-        Side Index 문자열에서 수치와 선호도 분류를 추출합니다.
+        Side Index 컬럼 전체를 한 번에 파싱합니다.
         예: "0.67 (블루 선호)" -> (0.67, 'BLUE_PREF')
+        형식이 맞지 않거나 알 수 없는 라벨은 NaN으로 남겨 거부 행으로 처리합니다.
+        """
+        extracted = column.str.extract(SIDE_INDEX_PATTERN)
+        side_values = pd.to_numeric(extracted[0], errors='coerce')
+        side_prefs = extracted[1].map(SIDE_LABEL_TO_CODE)
+        return side_values, side_prefs
+
+    def parse_frame(self, frame):
         """
-        # 숫자 부분 추출
-        parts = side_index_str.split(' ')
-        side_value = float(parts[0])
-        
-        # 선호도 분류 추출
-        preference_map = {
-            '블루 필수': 'BLUE_MUST',
-            '블루 선호': 'BLUE_PREF',
-            '약한 블루': 'BLUE_WEAK',
-            '균형': 'BALANCED',
-            '약한 레드': 'RED_WEAK',
-            '레드 선호': 'RED_PREF',
-            '레드 필수': 'RED_MUST',
+        CSV 청크(DataFrame)를 컬럼 단위로 파싱합니다.
+        (챔피언 이름, 통계 필드 dict) 목록과 거부 행 DataFrame을 반환합니다.
+        """
+        parsed = pd.DataFrame({'name': frame[NAME_COLUMN].str.strip()}, index=frame.index)
+        for field, column in NUMERIC_COLUMNS.items():
+            parsed[field] = pd.to_numeric(frame[column], errors='coerce')
+        parsed['side_index'], parsed['side_preference'] = self.parse_side_index(frame[SIDE_INDEX_COLUMN])
+
+        # 거부 사유를 컬럼별로 계산
+        checks = {
+            '챔피언 이름 없음': parsed['name'].isna() | (parsed['name'] == ''),
+            **{f'숫자 아님: {column}': parsed[field].isna() for field, column in NUMERIC_COLUMNS.items()},
+            **{
+                f'정수 아님: {NUMERIC_COLUMNS[field]}': parsed[field].notna() & (parsed[field] % 1 != 0)
+                for field in INTEGER_FIELDS
+            },
+            f'형식 오류: {SIDE_INDEX_COLUMN}': parsed['side_index'].isna() | parsed['side_preference'].isna(),
         }
-        
-        # 괄호 안의 텍스트 추출
-        if '(' in side_index_str and ')' in side_index_str:
-            pref_text = side_index_str.split('(')[1].rstrip(')')
-            preference = preference_map.get(pref_text, 'BALANCED')
-        else:
-            preference = 'BALANCED'
-        
-        return side_value, preference
-    
-    def handle(self, *args, **options):
-        csv_path = settings.BASE_DIR / 'prechampions.csv'
-        
-        if not csv_path.exists():
-            self.stderr.write(self.style.ERROR(f'CSV 파일을 찾을 수 없습니다: {csv_path}'))
+        reasons = pd.Series('', index=frame.index)
+        for reason, mask in checks.items():
+            reasons = reasons.mask(mask & (reasons == ''), reason)
+        rejected = reasons != ''
+
+        # to_numeric은 청크마다 dtype을 추론하므로(정수뿐인 청크는 int64) 모델 필드 타입으로 고정
+        valid = parsed[~rejected].astype({
+            **{field: 'int64' for field in INTEGER_FIELDS},
+            **{field: 'float64' for field in FLOAT_FIELDS},
+        })
+        records = [
+            (row.pop('name'), row)
+            for row in valid[['name'] + CHAMPION_STAT_FIELDS].to_dict('records')
+        ]
+
+        rejects = pd.DataFrame({
+            'line': frame.index[rejected] + 2,  # 헤더 1줄 + 0부터 시작하는 인덱스
+            'champion': frame.loc[rejected, NAME_COLUMN],
+            'side_index': frame.loc[rejected, SIDE_INDEX_COLUMN],
+            'reason': reasons[rejected],
+        })
+        return records, rejects
+
+    def resolve_paths(self, patterns):
+        """--path 인자(경로 또는 glob 패턴)를 실제 파일 목록으로 변환"""
+        if not patterns:
+            return [settings.BASE_DIR / 'prechampions.csv']
+
+        paths = []
+        for pattern in patterns:
+            if glob.has_magic(pattern):
+                matched = sorted(glob.glob(pattern, recursive=True))
+                if not matched:
+                    raise CommandError(f'패턴과 일치하는 CSV 파일이 없습니다: {pattern}')
+                paths.extend(Path(p) for p in matched)
+            else:
+                paths.append(Path(pattern))
+        return paths
+
+    def iter_records(self, csv_path, chunk_size):
+        """
+        CSV 파일을 chunk_size 행씩 읽어 파싱된 레코드 목록을 청크 단위로 반환합니다.
+        (.gz 파일은 자동으로 압축 해제, 한 번에 한 청크만 메모리에 유지)
+        """
+        frames = pd.read_csv(
+            csv_path,
+            chunksize=chunk_size,
+            dtype=str,
+            keep_default_na=False,
+            encoding='utf-8',
+        )
+        with frames:
+            for frame in frames:
+                records, rejects = self.parse_frame(frame)
+                self.report_rejects(csv_path, rejects)
+                yield records
+
+    def report_rejects(self, csv_path, rejects):
+        """거부 행을 경고로 출력하고, --rejects 지정 시 파일에 기록"""
+        if rejects.empty:
             return
-        
+        self.reject_count += len(rejects)
+        for row in rejects.itertuples(index=False):
+            if self.rejects_writer:
+                self.rejects_writer.writerow([csv_path, row.line, row.champion, row.side_index, row.reason])
+            if self.reject_count - len(rejects) < 20:
+                self.stderr.write(self.style.WARNING(
+                    f'  ⚠️ 거부: {csv_path}:{row.line} {row.champion!r} ({row.side_index!r}) - {row.reason}'
+                ))
+
+    def handle(self, *args, **options):
+        csv_paths = self.resolve_paths(options['paths'])
+        chunk_size = options['chunk_size']
+
+        if chunk_size is not None and chunk_size < 1:
+            raise CommandError('--chunk-size는 1 이상이어야 합니다.')
+
+        self.reject_count = 0
+        self.rejects_writer = None
+        rejects_file = None
+        if options['rejects']:
+            rejects_file = open(options['rejects'], 'w', encoding='utf-8', newline='')
+            self.rejects_writer = csv.writer(rejects_file)
+            self.rejects_writer.writerow(['file', 'line', 'champion', 'side_index', 'reason'])
+
+        try:
+            if options['incremental']:
+                changed = self.handle_incremental(csv_paths, chunk_size, options['batch_size'], options['summary_json'])
+            else:
+                changed = self.handle_full(csv_paths, chunk_size, options)
+        finally:
+            if rejects_file:
+                rejects_file.close()
+
+        # bulk upsert는 시그널을 보내지 않으므로 챔피언 통계 API 캐시를 직접 무효화
+        # (아무것도 바뀌지 않은 증분 로드는 캐시/ETag를 그대로 유지)
+        if changed:
+            bump_version(CHAMPIONS)
+
+        if self.reject_count:
+            self.stderr.write(self.style.WARNING(
+                f'⚠️ 파싱할 수 없어 건너뛴 행: {self.reject_count}개'
+                + (f' (상세: {options["rejects"]})' if options['rejects'] else '')
+            ))
+
+    def handle_full(self, csv_paths, chunk_size, options):
+        """모든 행을 기록하는 로드 (기본/--bulk/--chunk-size 모드). 기록한 행이 있으면 True"""
+        created_count = 0
+        updated_count = 0
+
+        for csv_path in csv_paths:
+            if not csv_path.exists():
+                self.stderr.write(self.style.ERROR(f'CSV 파일을 찾을 수 없습니다: {csv_path}'))
+                continue
+
+            if len(csv_paths) > 1:
+                self.stdout.write(f'📄 로드 중: {csv_path}')
+
+            chunks = self.iter_records(csv_path, chunk_size or DEFAULT_CHUNK_SIZE)
+
+            if chunk_size:
+                created, updated = self.load_streaming(chunks, options['batch_size'])
+            elif options['bulk']:
+                created, updated = self.load_bulk(chunks, options['batch_size'])
+            else:
+                created, updated = self.load_rows(chunks)
+
+            created_count += created
+            updated_count += updated
+
+        if created_count or updated_count:
+            # 전체 로드는 출처를 기록하지 않고 값을 덮어쓰므로, 다음 증분 로드가 어떤 파일도 건너뛰지 않게 함
+            ChampionStatSource.objects.exclude(checksum='').update(checksum='')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 데이터 로드 완료! 새로 생성: {created_count}개, 업데이트: {updated_count}개'
+        ))
+        return bool(created_count or updated_count)
+
+    def load_rows(self, chunks):
+        """행 단위로 챔피언/통계를 생성 또는 업데이트 (기본 모드)"""
         created_count = 0
         updated_count = 0
-        
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                champion_name = row['챔피언']
-                total_picks = int(row['총 픽 횟수 (Total)'])
-                blue_first = int(row['블루 1픽 (Blue 1st)'])
-                red_first = int(row['레드 1픽 (Red 1st)'])
-                tier_score = float(row['Tier Score (가치 점수)'])
-                side_index_str = row['Side Index (진영 선호도)']
-                
-                side_value, side_pref = self.parse_side_preference(side_index_str)
-                
+
+        for records in chunks:
+            for champion_name, stat_values in records:
                 # 챔피언 생성 또는 가져오기
                 champion, champ_created = Champion.objects.get_or_create(name=champion_name)
-                
+
                 if champ_created:
                     self.stdout.write(f'  새 챔피언 생성: {champion_name}')
-                
+
                 # 챔피언 통계 생성 또는 업데이트
                 stat, stat_created = ChampionStat.objects.update_or_create(
                     champion=champion,
-                    defaults={
-                        'total_picks': total_picks,
-                        'blue_first_pick': blue_first,
-                        'red_first_pick': red_first,
-                        'tier_score': tier_score,
-                        'side_index': side_value,
-                        'side_preference': side_pref,
-                    }
+                    defaults=stat_values
                 )
-                
+
                 if stat_created:
                     created_count += 1
                 else:
                     updated_count += 1
-        
+
+        return created_count, updated_count
+
+    def load_bulk(self, chunks, batch_size):
+        """
+        배치 모드 로드.
+        챔피언 이름을 한 번에 조회하고, 없는 챔피언은 한 번에 생성한 뒤
+        ChampionStat을 충돌 시 UPDATE 하는 bulk_create로 upsert 합니다.
+        전체 과정은 하나의 트랜잭션에서 실행됩니다.
+        """
+        created_count = 0
+        updated_count = 0
+
+        with transaction.atomic():
+            for records in chunks:
+                created, updated = self.upsert_rows(records, batch_size)
+                created_count += created
+                updated_count += updated
+
+        return created_count, updated_count
+
+    def load_streaming(self, chunks, batch_size):
+        """
+        스트리밍 모드 로드.
+        chunk_size 행씩 읽어 청크마다 배치 upsert 후 커밋합니다.
+        """
+        created_count = 0
+        updated_count = 0
+
+        for records in chunks:
+            with transaction.atomic():
+                created, updated = self.upsert_rows(records, batch_size)
+            created_count += created
+            updated_count += updated
+
+        return created_count, updated_count
+
+    def upsert_rows(self, records, batch_size):
+        """파싱된 레코드들을 챔피언 일괄 조회/생성 후 ChampionStat으로 일괄 upsert"""
+        # 같은 챔피언이 여러 번 나오면 마지막 행을 사용 (기본 모드와 동일한 결과)
+        rows = dict(records)
+
+        if not rows:
+            return 0, 0
+
+        champion_ids = self.resolve_champions(rows.keys(), batch_size)
+
+        # 생성/업데이트 건수 계산을 위해 기존 통계 보유 여부 확인
+        existing_stat_ids = set(
+            ChampionStat.objects.filter(
+                champion_id__in=champion_ids.values()
+            ).values_list('champion_id', flat=True)
+        )
+
+        # ChampionStat 일괄 upsert
+        stats = [
+            ChampionStat(
+                champion_id=champion_ids[name],
+                content_hash=champion_stat_fingerprint(stat_values),
+                **stat_values
+            )
+            for name, stat_values in rows.items()
+        ]
+        self.bulk_upsert_stats(stats, batch_size)
+
+        updated_count = sum(1 for stat in stats if stat.champion_id in existing_stat_ids)
+        return len(stats) - updated_count, updated_count
+
+    def resolve_champions(self, names, batch_size):
+        """
+        챔피언 이름 목록을 {이름: id}로 변환합니다.
+        한 번의 쿼리로 조회하고, 없는 챔피언은 한 번에 생성합니다.
+        """
+        champion_ids = dict(
+            Champion.objects.filter(name__in=names).values_list('name', 'id')
+        )
+
+        missing = [name for name in names if name not in champion_ids]
+        if missing:
+            Champion.objects.bulk_create(
+                [Champion(name=name) for name in missing],
+                batch_size=batch_size,
+                ignore_conflicts=True,
+            )
+            champion_ids.update(
+                Champion.objects.filter(name__in=missing).values_list('name', 'id')
+            )
+            for name in missing:
+                self.stdout.write(f'  새 챔피언 생성: {name}')
+
+        return champion_ids
+
+    def bulk_upsert_stats(self, stats, batch_size, update_fields=UPSERT_FIELDS):
+        """champion 기준 충돌 시 UPDATE 하는 bulk_create로 ChampionStat upsert"""
+        ChampionStat.objects.bulk_create(
+            stats,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['champion'],
+            update_fields=update_fields,
+        )
+
+    # --- 증분(incremental) 로드 ---
+
+    def file_checksum(self, path):
+        """파일 전체의 SHA-256 체크섬 (고정 크기 블록 단위로 읽어 메모리 사용량 일정)"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def handle_incremental(self, csv_paths, chunk_size, batch_size, summary_path):
+        """증분 모드로 모든 파일을 로드하고 변경 요약을 출력. 추가/변경/삭제된 행이 있으면 True"""
+        summary = {'added': set(), 'changed': set(), 'unchanged': 0, 'removed': set(), 'skipped_files': []}
+
+        for csv_path in csv_paths:
+            if not csv_path.exists():
+                self.stderr.write(self.style.ERROR(f'CSV 파일을 찾을 수 없습니다: {csv_path}'))
+                continue
+            self.load_incremental(csv_path, chunk_size, batch_size, summary)
+
+        # 같은 실행에서 새로 추가된 챔피언은 '변경'에 중복 집계하지 않음
+        summary['changed'] -= summary['added']
+
         self.stdout.write(self.style.SUCCESS(
-            f'✅ 데이터 로드 완료! 새로 생성: {created_count}개, 업데이트: {updated_count}개'
+            f"✅ 증분 로드 완료! 추가: {len(summary['added'])}개, 변경: {len(summary['changed'])}개, "
+            f"유지: {summary['unchanged']}개, 삭제: {len(summary['removed'])}개, "
+            f"건너뛴 파일: {len(summary['skipped_files'])}개"
         ))
+        for key, label in (('added', '추가'), ('changed', '변경'), ('removed', '삭제')):
+            if summary[key]:
+                self.stdout.write(f"  {label}: {', '.join(sorted(summary[key]))}")
+
+        if summary_path:
+            with open(summary_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'added': sorted(summary['added']),
+                    'changed': sorted(summary['changed']),
+                    'unchanged': summary['unchanged'],
+                    'removed': sorted(summary['removed']),
+                    'skipped_files': summary['skipped_files'],
+                }, f, ensure_ascii=False, indent=2)
+
+        return bool(summary['added'] or summary['changed'] or summary['removed'])
+
+    def load_incremental(self, csv_path, chunk_size, batch_size, summary):
+        """
+        파일 하나를 증분 로드합니다.
+        파일 체크섬이 이전 로드와 같고 이 파일이 로드한 행이 DB에 그대로 남아 있으면 건너뛰고,
+        아니면 내용 지문이 달라진 행만 기록합니다.
+        이 파일에서 로드되었지만 더 이상 존재하지 않는 챔피언 통계는 삭제합니다.
+        """
+        checksum = self.file_checksum(csv_path)
+        source, _ = ChampionStatSource.objects.get_or_create(path=str(csv_path.resolve()))
+
+        # 다른 파일이 행을 가져갔거나 삭제했다면 체크섬이 같아도 다시 로드해야 함
+        if source.checksum == checksum and source.stats.count() == source.row_count:
+            self.stdout.write(f'  ⏭️ 변경 없음, 건너뜀: {csv_path}')
+            summary['skipped_files'].append(str(csv_path))
+            summary['unchanged'] += source.row_count
+            return
+
+        self.stdout.write(f'📄 증분 로드 중: {csv_path}')
+        seen_ids = set()
+
+        for records in self.iter_records(csv_path, chunk_size or DEFAULT_CHUNK_SIZE):
+            with transaction.atomic():
+                self.apply_changes(records, source, batch_size, seen_ids, summary)
+
+        with transaction.atomic():
+            removed = ChampionStat.objects.filter(source=source).exclude(champion_id__in=seen_ids)
+            summary['removed'].update(removed.values_list('champion__name', flat=True))
+            removed.delete()
+
+            source.checksum = checksum
+            source.row_count = len(seen_ids)
+            source.save()
+
+    def apply_changes(self, records, source, batch_size, seen_ids, summary):
+        """청크 하나의 레코드를 기존 지문과 비교하여 추가/변경된 행만 upsert"""
+        rows = dict(records)
+        if not rows:
+            return
+
+        champion_ids = self.resolve_champions(rows.keys(), batch_size)
+        existing = ChampionStat.objects.filter(
+            champion_id__in=champion_ids.values()
+        ).values_list('champion_id', 'content_hash', 'source_id')
+        existing_hashes = {champion_id: content_hash for champion_id, content_hash, _ in existing}
+
+        # 이 파일이 가져가는 행의 이전 출처는 더 이상 체크섬만으로 건너뛸 수 없음
+        previous_sources = {source_id for _, _, source_id in existing if source_id not in (None, source.pk)}
+        if previous_sources:
+            ChampionStatSource.objects.filter(pk__in=previous_sources).update(checksum='')
+
+        changed_stats = []
+        unchanged_ids = []
+        for name, stat_values in rows.items():
+            champion_id = champion_ids[name]
+            fingerprint = champion_stat_fingerprint(stat_values)
+            seen_ids.add(champion_id)
+
+            if champion_id not in existing_hashes:
+                summary['added'].add(name)
+            elif existing_hashes[champion_id] != fingerprint:
+                summary['changed'].add(name)
+            else:
+                summary['unchanged'] += 1
+                unchanged_ids.append(champion_id)
+                continue
 
+            changed_stats.append(ChampionStat(
+                champion_id=champion_id,
+                content_hash=fingerprint,
+                source=source,
+                **stat_values
+            ))
 
+        if changed_stats:
+            self.bulk_upsert_stats(changed_stats, batch_size, update_fields=UPSERT_FIELDS + ['source'])
 
+        # 값은 같지만 다른 파일(또는 이전 전체 로드)에서 온 행은 출처만 이 파일로 갱신
+        if unchanged_ids:
+            ChampionStat.objects.filter(
+                champion_id__in=unchanged_ids
+            ).exclude(source=source).update(source=source)
@@ -1,263 +1,607 @@
 """
 worlds_story.docx 파일에서 경기 스토리 데이터를 로드하는 Django management command
+
+경기/세트 문단은 두 가지 방법으로 찾습니다.
+- 앵커(MATCH_SPECS, FINALS_ANCHORS): worlds_story.docx의 경기별로 미리 정해 둔 문단 텍스트 (우선 적용)
+- 문서 구조(main.docx_text.parse_story_outline): "N경기: A vs B (최종 스코어 X:Y)" / "N세트 (팀 승):" 제목을 따라
+  앵커에 없는 경기를 담은 단계/지역/시즌별 문서도 읽습니다.
 """
-from django.core.management.base import BaseCommand
-from docx import Document
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from main.api_cache import STORIES, bump_version
+from main.docx_text import DEFAULT_CACHE_DIR, index_document
+from main.matchers import AnchorIndex, ChampionMatcher
 from main.models import MatchStory
-import re
+
+
+# 경기별 스토리 정의: 각 항목의 문자열은 docx 문단을 찾기 위한 앵커(문단에 포함된 텍스트)입니다.
+MATCH_SPECS = [
+    # === 8강 (Quarter Finals) ===
+
+    # 8강 1경기: Gen.G vs HLE (3:1)
+    {
+        'stage': 'QF',
+        'match_number': 1,
+        'team_a': 'Gen.G',
+        'team_b': 'Hanwha Life Esports',
+        'final_score': '3:1',
+        'overview': '8강 대진 추첨 결과',
+        'sets': [
+            {
+                'set_number': 1,
+                'winner': 'Gen.G',
+                'banpick': '한화생명은 \'딜라이트\' 유환중의 서포터 판테온',
+                'narrative': '한화생명은 초반 탑과 미드에서 다이브'
+            },
+            {
+                'set_number': 2,
+                'winner': 'Gen.G',
+                'banpick': '양 팀은 아지르-오리아나라는 0티어',
+                'narrative': '약 58분 51초'
+            },
+            {
+                'set_number': 3,
+                'winner': 'Hanwha Life Esports',
+                'banpick': '젠지의 이해하기 힘든 밴픽이 패배의 빌미',
+                'narrative': '한화생명은 젠지의 조합적 약점을 영리하게'
+            },
+            {
+                'set_number': 4,
+                'winner': 'Gen.G',
+                'banpick': '3세트의 실수를 만회하려는 듯',
+                'narrative': '\'기산테\'의, 기산테에 의한'
+            }
+        ]
+    },
+
+    # 8강 2경기: KT vs CFO (3:0)
+    {
+        'stage': 'QF',
+        'match_number': 2,
+        'team_a': 'kt Rolster',
+        'team_b': 'CTBC Flying Oyster',
+        'final_score': '3:0',
+        'overview': '이번 월즈의 다크호스로 꼽혔던 두 팀',
+        'sets': [
+            {
+                'set_number': 1,
+                'winner': 'kt Rolster',
+                'banpick': 'CFO는 KT의 에이스 \'비디디\'',
+                'narrative': 'KT는 초반 인베이드 설계와 바위 게'
+            },
+            {
+                'set_number': 2,
+                'winner': 'kt Rolster',
+                'banpick': 'CFO는 블루 진영의 이점을 살려 아지르',
+                'narrative': '24분 32초. KT는 2025 월즈 최단 시간'
+            },
+            {
+                'set_number': 3,
+                'winner': 'kt Rolster',
+                'banpick': 'KT는 사이온을 선픽하며 단단한 앞라인',
+                'narrative': '초반부터 우위를 점한 KT를 상대로'
+            }
+        ]
+    },
+
+    # 8강 3경기: G2 vs TES (1:3)
+    {
+        'stage': 'QF',
+        'match_number': 3,
+        'team_a': 'G2 Esports',
+        'team_b': 'Top Esports',
+        'final_score': '1:3',
+        'overview': '8강 유일의 비 LCK 팀 매치업',
+        'sets': [
+            {
+                'set_number': 1,
+                'winner': 'Top Esports',
+                'banpick': 'G2는 레드 진영에서 오리아나를 가져오는 정석적인',
+                'narrative': 'TES가 모든 라인에서 압도적인'
+            },
+            {
+                'set_number': 2,
+                'winner': 'G2 Esports',
+                'banpick': 'G2는 레드 진영에서 \'정글 문도\'',
+                'narrative': 'G2의 승부수가 완벽하게 적중'
+            },
+            {
+                'set_number': 3,
+                'winner': 'Top Esports',
+                'banpick': 'G2는 정글 아이번, 서포터 쓰레쉬',
+                'narrative': 'G2의 조커 픽들은 아무런 힘을 쓰지'
+            },
+            {
+                'set_number': 4,
+                'winner': 'Top Esports',
+                'banpick': 'G2는 마지막 승부수로 블루 1픽 드레이븐',
+                'narrative': '경기 초반은 G2의 변종 라인 스왑'
+            }
+        ]
+    },
+
+    # 8강 4경기: AL vs T1 (2:3)
+    {
+        'stage': 'QF',
+        'match_number': 4,
+        'team_a': "Anyone's Legend",
+        'team_b': 'T1',
+        'final_score': '2:3',
+        'overview': '\'LPL의 사신\'이라는 별명을 가진',
+        'sets': [
+            {
+                'set_number': 1,
+                'winner': 'T1',
+                'banpick': 'AL은 1픽으로 키아나를 선택하는 강수',
+                'narrative': '초반 상체 주도권을 내준 T1'
+            },
+            {
+                'set_number': 2,
+                'winner': "Anyone's Legend",
+                'banpick': 'AL은 \'카엘\' 김진홍의 시그니처 픽인 뽀삐',
+                'narrative': 'AL의 정글러 \'타잔\' 이승용이 빛났습니다'
+            },
+            {
+                'set_number': 3,
+                'winner': "Anyone's Legend",
+                'banpick': 'T1의 밴픽이 아쉬웠습니다. 상대에게 바드를',
+                'narrative': 'T1은 초반 블리츠크랭크의 그랩으로'
+            },
+            {
+                'set_number': 4,
+                'winner': 'T1',
+                'banpick': 'T1의 영리한 밴픽이 돋보였습니다. 돌진 조합',
+                'narrative': '구마유시의 카이사가 초반 교전에서'
+            },
+            {
+                'set_number': 5,
+                'winner': 'T1',
+                'banpick': 'AL은 징크스를 중심으로 후반 캐리',
+                'narrative': '5천 골드까지 뒤처지며 패색이 짙었던'
+            }
+        ]
+    },
+
+    # === 4강 (Semi Finals) ===
+
+    # 4강 1경기: Gen.G vs KT (1:3)
+    {
+        'stage': 'SF',
+        'match_number': 1,
+        'team_a': 'Gen.G',
+        'team_b': 'kt Rolster',
+        'final_score': '1:3',
+        'overview': '모두가 젠지의 압도적인 승리를 예상',
+        'sets': [
+            {
+                'set_number': 1,
+                'winner': 'kt Rolster',
+                'banpick': '젠지는 탈리야-바이-코르키로 강력한 돌진',
+                'narrative': '중반까지 젠지가 7천 골드 차이까지'
+            },
+            {
+                'set_number': 2,
+                'winner': 'Gen.G',
+                'banpick': '젠지는 신 짜오와 암베사-갈리오를 중심',
+                'narrative': '초반 교전에서 승리하며 기세를 올린'
+            },
+            {
+                'set_number': 3,
+                'winner': 'kt Rolster',
+                'banpick': 'KT는 아지르-오리아나를 모두 풀어주는 과감한',
+                'narrative': '그야말로 \'순수 체급\' 차이가'
+            },
+            {
+                'set_number': 4,
+                'winner': 'kt Rolster',
+                'banpick': '벼랑 끝에 몰린 젠지는 쵸비의 통산 첫 애니비아',
+                'narrative': '젠지의 애니비아가 힘을 발휘하기도'
+            }
+        ]
+    },
+
+    # 4강 2경기: TES vs T1 (0:3)
+    {
+        'stage': 'SF',
+        'match_number': 2,
+        'team_a': 'Top Esports',
+        'team_b': 'T1',
+        'final_score': '0:3',
+        'overview': 'LPL의 마지막 희망으로 남은',
+        'sets': [
+            {
+                'set_number': 1,
+                'winner': 'T1',
+                'banpick': 'TES는 오리아나를 풀어주고 아칼리로 카운터',
+                'narrative': '페이커의 오리아나는 \'노데스, 노플래시\''
+            },
+            {
+                'set_number': 2,
+                'winner': 'T1',
+                'banpick': 'T1은 니코-갈리오-카밀-자르반-카이사',
+                'narrative': 'T1의 날카로운 돌진이 TES의 핵심'
+            },
+            {
+                'set_number': 3,
+                'winner': 'T1',
+                'banpick': '마지막 희망을 건 TES는 \'재키러브\'',
+                'narrative': 'TES의 키아나가 초반 킬을 몰아먹으며'
+            }
+        ]
+    },
+]
+
+# 문서의 세트 제목에 쓰인 팀 약칭 -> MatchStory에 저장하는 팀 이름
+TEAM_ABBREVIATIONS = {
+    'GEN': 'Gen.G',
+    'HLE': 'Hanwha Life Esports',
+    'KT': 'kt Rolster',
+    'CFO': 'CTBC Flying Oyster',
+    'G2': 'G2 Esports',
+    'TES': 'Top Esports',
+    'AL': "Anyone's Legend",
+    'T1': 'T1',
+}
+
+# 결승전 스토리 (요약 형태) 앵커
+FINALS_ANCHORS = {
+    'kt_story': 'kt Rolster: LCK 정규시즌',
+    't1_story': 'T1: 반면 T1은',
+    'summary': '치열한 접전 끝에 소환사의 컵은',
+    'conclusion': '이번 우승은 선수 개개인에게도',
+    'overview': '2025 월드 챔피언십 결승은 두 팀의',
+}
+
+
+def iter_anchor_groups():
+    """경기별 앵커 묶음: ((stage, match_number), 앵커 목록)"""
+    for spec in MATCH_SPECS:
+        anchors = [spec['overview']]
+        for set_info in spec['sets']:
+            anchors += [set_info['banpick'], set_info['narrative']]
+        yield (spec['stage'], spec['match_number']), anchors
+    yield ('F', 1), list(FINALS_ANCHORS.values())
+
+
+def iter_anchors():
+    """MATCH_SPECS와 FINALS_ANCHORS에 정의된 모든 앵커 문자열"""
+    for _, anchors in iter_anchor_groups():
+        yield from anchors
 
 
 class Command(BaseCommand):
-    help = 'worlds_story.docx 파일에서 경기 스토리 데이터를 로드합니다.'
+    help = ('worlds_story.docx 등 스토리 문서에서 경기 스토리 데이터를 로드합니다. '
+            '미리 정의된 앵커 외에 문서 구조("N경기: A vs B (최종 스코어 X:Y)", "N세트 (팀 승):")로도 경기를 찾습니다.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            action='append',
+            dest='paths',
+            metavar='PATH_OR_GLOB',
+            help='스토리 문서(.docx) 경로, 폴더 또는 glob 패턴 (여러 번 지정 가능). '
+                 '지정하지 않으면 worlds_story.docx를 사용합니다.',
+        )
+        parser.add_argument(
+            '--jobs',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='문서 파싱에 사용할 프로세스 수 (기본값: CPU 코어 수). 1이면 현재 프로세스에서 순차 처리합니다.',
+        )
+        parser.add_argument(
+            '--strict',
+            action='store_true',
+            help='찾지 못했거나 여러 문단에 걸친 앵커가 있으면 데이터를 저장하지 않고 중단합니다.',
+        )
+        parser.add_argument(
+            '--prune',
+            action='store_true',
+            help='이번에 읽은 문서에 없는 경기의 스토리도 삭제합니다 (전체 문서를 다시 로드할 때). '
+                 '기본값은 읽은 경기 안에서 사라진 세트만 삭제합니다.',
+        )
+        parser.add_argument(
+            '--no-key-champions',
+            action='store_true',
+            help='밴픽/경기 서사에서 주요 챔피언을 자동 추출하지 않고 기존 key_champions 값을 유지합니다.',
+        )
+        parser.add_argument(
+            '--max-key-champions',
+            type=int,
+            default=10,
+            help='세트별로 저장할 주요 챔피언 최대 수 (언급 횟수 순, 기본값: 10)',
+        )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='파일 해시 기반 문단 캐시를 사용하지 않고 항상 docx를 다시 파싱합니다.',
+        )
+        parser.add_argument(
+            '--cache-dir',
+            default=DEFAULT_CACHE_DIR,
+            help=f'파싱된 문단 캐시 폴더 (기본값: {DEFAULT_CACHE_DIR})',
+        )
+        parser.add_argument(
+            '--extractor',
+            choices=['xml', 'python-docx'],
+            default='xml',
+            help='문단 추출 방식: word/document.xml 스트리밍 파싱(xml, 기본값) 또는 python-docx',
+        )
 
     def handle(self, *args, **options):
         self.stdout.write('경기 스토리 데이터 로드를 시작합니다...')
         
-        # docx 파일 읽기
-        doc = Document('worlds_story.docx')
-        paragraphs = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
+        doc_paths = self.resolve_paths(options['paths'])
+        if options['jobs'] < 1:
+            raise CommandError('--jobs는 1 이상이어야 합니다.')
         
-        # 기존 데이터 삭제
-        MatchStory.objects.all().delete()
+        # 문서별 앵커 색인 후 병합 (변경되지 않은 문서는 캐시에서 바로 로드)
+        index = self.index_documents(
+            doc_paths,
+            jobs=options['jobs'],
+            cache_dir=None if options['no_cache'] else options['cache_dir'],
+            extractor=options['extractor'],
+        )
+        problems = self.report_anchor_problems(index)
+        if problems and options['strict']:
+            raise CommandError(f'앵커 문제 {problems}건으로 로드를 중단합니다.')
         
         # 데이터 파싱 및 저장
-        stories = self.parse_stories(paragraphs)
-        
-        for story_data in stories:
-            MatchStory.objects.create(**story_data)
-            self.stdout.write(f"  저장: [{story_data['stage']}] {story_data['team_a']} vs {story_data['team_b']} - {story_data['set_number']}세트")
+        stories = self.parse_stories(index, self.outlines)
+        if not options['no_key_champions']:
+            self.extract_key_champions(stories, options['max_key_champions'])
+        created, updated, unchanged, deleted = self.save_stories(stories, prune=options['prune'])
         
-        self.stdout.write(self.style.SUCCESS(f'총 {len(stories)}개의 경기 스토리가 로드되었습니다.'))
+        self.stdout.write(self.style.SUCCESS(
+            f'총 {len(stories)}개의 경기 스토리가 로드되었습니다. '
+            f'(새로 생성: {created}개, 업데이트: {updated}개, 변경 없음: {unchanged}개, 삭제: {deleted}개)'
+        ))
 
-    def parse_stories(self, paragraphs):
-        """docx 내용을 파싱하여 스토리 데이터 리스트 반환"""
-        stories = []
+    def resolve_paths(self, patterns):
+        """--path 인자(파일, 폴더, glob 패턴)를 정렬된 docx 파일 목록으로 변환"""
+        if not patterns:
+            return ['worlds_story.docx']
         
-        # === 8강 (Quarter Finals) ===
+        paths = []
+        for pattern in patterns:
+            if os.path.isdir(pattern):
+                matched = sorted(glob.glob(os.path.join(pattern, '**', '*.docx'), recursive=True))
+            elif glob.has_magic(pattern):
+                matched = sorted(glob.glob(pattern, recursive=True))
+            else:
+                matched = [pattern]
+            # Word 임시 파일(~$문서.docx)은 제외
+            matched = [path for path in matched if not os.path.basename(path).startswith('~$')]
+            if not matched:
+                raise CommandError(f'경로와 일치하는 문서가 없습니다: {pattern}')
+            paths.extend(path for path in matched if path not in paths)
+        return paths
+
+    def index_documents(self, doc_paths, jobs, cache_dir, extractor):
+        """
+        문서마다 문단을 추출하고 앵커를 색인한 뒤 하나의 AnchorIndex로 병합합니다.
+        문서가 여러 개이고 jobs > 1이면 프로세스 풀에서 병렬로 처리합니다.
+        병합 순서는 항상 doc_paths 순서이므로 결과는 병렬 여부와 관계없이 같습니다.
+        """
+        anchors = list(iter_anchors())
+        args = [(path, anchors, cache_dir, extractor) for path in doc_paths]
+        started = time.perf_counter()
         
-        # 8강 1경기: Gen.G vs HLE (3:1)
-        stories.extend(self.create_match_stories(
-            stage='QF',
-            match_number=1,
-            team_a='Gen.G',
-            team_b='Hanwha Life Esports',
-            final_score='3:1',
-            match_overview=self.find_paragraph(paragraphs, '8강 대진 추첨 결과'),
-            sets=[
-                {
-                    'set_number': 1,
-                    'winner': 'Gen.G',
-                    'banpick': self.find_paragraph(paragraphs, '한화생명은 \'딜라이트\' 유환중의 서포터 판테온'),
-                    'narrative': self.find_paragraph(paragraphs, '한화생명은 초반 탑과 미드에서 다이브')
-                },
-                {
-                    'set_number': 2,
-                    'winner': 'Gen.G',
-                    'banpick': self.find_paragraph(paragraphs, '양 팀은 아지르-오리아나라는 0티어'),
-                    'narrative': self.find_paragraph(paragraphs, '약 58분 51초')
-                },
-                {
-                    'set_number': 3,
-                    'winner': 'Hanwha Life Esports',
-                    'banpick': self.find_paragraph(paragraphs, '젠지의 이해하기 힘든 밴픽이 패배의 빌미'),
-                    'narrative': self.find_paragraph(paragraphs, '한화생명은 젠지의 조합적 약점을 영리하게')
-                },
-                {
-                    'set_number': 4,
-                    'winner': 'Gen.G',
-                    'banpick': self.find_paragraph(paragraphs, '3세트의 실수를 만회하려는 듯'),
-                    'narrative': self.find_paragraph(paragraphs, '\'기산테\'의, 기산테에 의한')
-                }
-            ]
-        ))
+        if jobs > 1 and len(doc_paths) > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(doc_paths))) as executor:
+                results = list(executor.map(index_document, *zip(*args)))
+        else:
+            results = [index_document(*arg) for arg in args]
         
-        # 8강 2경기: KT vs CFO (3:0)
-        stories.extend(self.create_match_stories(
-            stage='QF',
-            match_number=2,
-            team_a='kt Rolster',
-            team_b='CTBC Flying Oyster',
-            final_score='3:0',
-            match_overview=self.find_paragraph(paragraphs, '이번 월즈의 다크호스로 꼽혔던 두 팀'),
-            sets=[
-                {
-                    'set_number': 1,
-                    'winner': 'kt Rolster',
-                    'banpick': self.find_paragraph(paragraphs, 'CFO는 KT의 에이스 \'비디디\''),
-                    'narrative': self.find_paragraph(paragraphs, 'KT는 초반 인베이드 설계와 바위 게')
-                },
-                {
-                    'set_number': 2,
-                    'winner': 'kt Rolster',
-                    'banpick': self.find_paragraph(paragraphs, 'CFO는 블루 진영의 이점을 살려 아지르'),
-                    'narrative': self.find_paragraph(paragraphs, '24분 32초. KT는 2025 월즈 최단 시간')
-                },
-                {
-                    'set_number': 3,
-                    'winner': 'kt Rolster',
-                    'banpick': self.find_paragraph(paragraphs, 'KT는 사이온을 선픽하며 단단한 앞라인'),
-                    'narrative': self.find_paragraph(paragraphs, '초반부터 우위를 점한 KT를 상대로')
-                }
-            ]
-        ))
+        index = AnchorIndex(anchors)
+        self.outlines = []
+        for result in results:
+            index.merge(result['found'])
+            self.outlines.extend(result['outline'])
+            cache_note = ', 캐시 사용' if result['cache_hit'] else ''
+            self.stdout.write(
+                f"  📄 {result['path']}: 문단 {result['paragraph_count']}개, "
+                f"{result['elapsed']:.3f}초{cache_note}"
+            )
         
-        # 8강 3경기: G2 vs TES (1:3)
-        stories.extend(self.create_match_stories(
-            stage='QF',
-            match_number=3,
-            team_a='G2 Esports',
-            team_b='Top Esports',
-            final_score='1:3',
-            match_overview=self.find_paragraph(paragraphs, '8강 유일의 비 LCK 팀 매치업'),
-            sets=[
-                {
-                    'set_number': 1,
-                    'winner': 'Top Esports',
-                    'banpick': self.find_paragraph(paragraphs, 'G2는 레드 진영에서 오리아나를 가져오는 정석적인'),
-                    'narrative': self.find_paragraph(paragraphs, 'TES가 모든 라인에서 압도적인')
-                },
-                {
-                    'set_number': 2,
-                    'winner': 'G2 Esports',
-                    'banpick': self.find_paragraph(paragraphs, 'G2는 레드 진영에서 \'정글 문도\''),
-                    'narrative': self.find_paragraph(paragraphs, 'G2의 승부수가 완벽하게 적중')
-                },
-                {
-                    'set_number': 3,
-                    'winner': 'Top Esports',
-                    'banpick': self.find_paragraph(paragraphs, 'G2는 정글 아이번, 서포터 쓰레쉬'),
-                    'narrative': self.find_paragraph(paragraphs, 'G2의 조커 픽들은 아무런 힘을 쓰지')
-                },
-                {
-                    'set_number': 4,
-                    'winner': 'Top Esports',
-                    'banpick': self.find_paragraph(paragraphs, 'G2는 마지막 승부수로 블루 1픽 드레이븐'),
-                    'narrative': self.find_paragraph(paragraphs, '경기 초반은 G2의 변종 라인 스왑')
-                }
-            ]
-        ))
+        if len(doc_paths) > 1:
+            self.stdout.write(f'  문서 {len(doc_paths)}개 색인 완료: {time.perf_counter() - started:.3f}초')
+        return index
+
+    def extract_key_champions(self, stories, limit):
+        """
+        밴픽 분석과 경기 서사에서 언급된 챔피언을 언급 횟수 순으로 key_champions에 채웁니다.
+        모든 챔피언 이름으로 만든 매처 하나로 각 텍스트를 한 번씩만 순회합니다.
+        """
+        matcher = ChampionMatcher.from_champion_tables()
+        max_length = MatchStory._meta.get_field('key_champions').max_length
         
-        # 8강 4경기: AL vs T1 (2:3)
-        stories.extend(self.create_match_stories(
-            stage='QF',
-            match_number=4,
-            team_a="Anyone's Legend",
-            team_b='T1',
-            final_score='2:3',
-            match_overview=self.find_paragraph(paragraphs, '\'LPL의 사신\'이라는 별명을 가진'),
-            sets=[
-                {
-                    'set_number': 1,
-                    'winner': 'T1',
-                    'banpick': self.find_paragraph(paragraphs, 'AL은 1픽으로 키아나를 선택하는 강수'),
-                    'narrative': self.find_paragraph(paragraphs, '초반 상체 주도권을 내준 T1')
-                },
-                {
-                    'set_number': 2,
-                    'winner': "Anyone's Legend",
-                    'banpick': self.find_paragraph(paragraphs, 'AL은 \'카엘\' 김진홍의 시그니처 픽인 뽀삐'),
-                    'narrative': self.find_paragraph(paragraphs, 'AL의 정글러 \'타잔\' 이승용이 빛났습니다')
-                },
-                {
-                    'set_number': 3,
-                    'winner': "Anyone's Legend",
-                    'banpick': self.find_paragraph(paragraphs, 'T1의 밴픽이 아쉬웠습니다. 상대에게 바드를'),
-                    'narrative': self.find_paragraph(paragraphs, 'T1은 초반 블리츠크랭크의 그랩으로')
-                },
-                {
-                    'set_number': 4,
-                    'winner': 'T1',
-                    'banpick': self.find_paragraph(paragraphs, 'T1의 영리한 밴픽이 돋보였습니다. 돌진 조합'),
-                    'narrative': self.find_paragraph(paragraphs, '구마유시의 카이사가 초반 교전에서')
-                },
-                {
-                    'set_number': 5,
-                    'winner': 'T1',
-                    'banpick': self.find_paragraph(paragraphs, 'AL은 징크스를 중심으로 후반 캐리'),
-                    'narrative': self.find_paragraph(paragraphs, '5천 골드까지 뒤처지며 패색이 짙었던')
-                }
-            ]
-        ))
+        for story_data in stories:
+            ranked = matcher.rank(story_data['banpick_analysis'], story_data['game_narrative'])
+            names = []
+            for slug in ranked[:limit]:
+                name = matcher.display_name(slug)
+                # 필드 길이를 넘지 않는 범위에서만 추가
+                if len(','.join(names + [name])) > max_length:
+                    break
+                names.append(name)
+            story_data['key_champions'] = ','.join(names)
+
+    def save_stories(self, stories, prune=False):
+        """
+        (stage, match_number, set_number) 기준으로 MatchStory를 upsert 합니다.
+        하나의 트랜잭션에서 실행되므로 조회 중인 페이지/API는 이전 데이터 또는 새 데이터 전체만 보게 됩니다.
+        내용이 같은 행은 건드리지 않아 created_at/updated_at이 유지되고,
+        이번에 읽은 경기(stage, match_number)에서 사라진 세트는 삭제합니다.
+        다른 경기의 스토리는 그대로 두며, prune=True이면 읽지 않은 경기의 스토리도 삭제합니다.
+        """
+        groups = {(story['stage'], story['match_number']) for story in stories}
+        with transaction.atomic():
+            existing_stories = MatchStory.objects.select_for_update()
+            if not prune:
+                existing_stories = existing_stories.filter(
+                    stage__in={stage for stage, _ in groups},
+                    match_number__in={number for _, number in groups},
+                )
+            existing = {
+                (story.stage, story.match_number, story.set_number): story
+                for story in existing_stories
+                if prune or (story.stage, story.match_number) in groups
+            }
+            
+            to_create = []
+            to_update = []
+            update_fields = set()
+            unchanged = 0
+            now = timezone.now()
+            
+            for story_data in stories:
+                key = (story_data['stage'], story_data['match_number'], story_data['set_number'])
+                story = existing.pop(key, None)
+                
+                if story is None:
+                    to_create.append(MatchStory(**story_data))
+                else:
+                    changed = [field for field, value in story_data.items() if getattr(story, field) != value]
+                    if not changed:
+                        unchanged += 1
+                        continue
+                    for field in changed:
+                        setattr(story, field, story_data[field])
+                    story.updated_at = now
+                    update_fields.update(changed)
+                    to_update.append(story)
+                
+                self.stdout.write(f"  저장: [{story_data['stage']}] {story_data['team_a']} vs {story_data['team_b']} - {story_data['set_number']}세트")
+            
+            MatchStory.objects.bulk_create(to_create)
+            if to_update:
+                MatchStory.objects.bulk_update(to_update, sorted(update_fields) + ['updated_at'])
+            
+            # 문서에 더 이상 없는 세트 삭제 (prune이 아니면 이번에 읽은 경기 안에서만)
+            deleted = 0
+            if existing:
+                deleted, _ = MatchStory.objects.filter(pk__in=[story.pk for story in existing.values()]).delete()
+            
+            # bulk 작업은 시그널을 보내지 않으므로 스토리 API 캐시를 직접 무효화 (커밋 후 적용)
+            if to_create or to_update or deleted:
+                bump_version(STORIES)
         
-        # === 4강 (Semi Finals) ===
+        return len(to_create), len(to_update), unchanged, deleted
+
+    def resolved_groups(self, index):
+        """앵커를 하나 이상 찾은 경기 (stage, match_number) 집합 (하나도 없으면 문서 구조로만 찾음)"""
+        return {key for key, anchors in iter_anchor_groups() if any(index.found[anchor] for anchor in anchors)}
+
+    def report_anchor_problems(self, index):
+        """
+        찾지 못한 앵커와 여러 문단에서 발견된 앵커를 경고로 출력하고 문제 건수를 반환합니다.
+        앵커를 하나도 찾지 못한 경기는 이번 문서 묶음에 없는 것으로 보고 문제로 세지 않습니다.
+        """
+        resolved = self.resolved_groups(index)
+        missing = [
+            anchor
+            for key, anchors in iter_anchor_groups() if key in resolved
+            for anchor in anchors if not index.found[anchor]
+        ]
+        ambiguous = index.ambiguous()
         
-        # 4강 1경기: Gen.G vs KT (1:3)
-        stories.extend(self.create_match_stories(
-            stage='SF',
-            match_number=1,
-            team_a='Gen.G',
-            team_b='kt Rolster',
-            final_score='1:3',
-            match_overview=self.find_paragraph(paragraphs, '모두가 젠지의 압도적인 승리를 예상'),
-            sets=[
-                {
-                    'set_number': 1,
-                    'winner': 'kt Rolster',
-                    'banpick': self.find_paragraph(paragraphs, '젠지는 탈리야-바이-코르키로 강력한 돌진'),
-                    'narrative': self.find_paragraph(paragraphs, '중반까지 젠지가 7천 골드 차이까지')
-                },
-                {
-                    'set_number': 2,
-                    'winner': 'Gen.G',
-                    'banpick': self.find_paragraph(paragraphs, '젠지는 신 짜오와 암베사-갈리오를 중심'),
-                    'narrative': self.find_paragraph(paragraphs, '초반 교전에서 승리하며 기세를 올린')
-                },
-                {
-                    'set_number': 3,
-                    'winner': 'kt Rolster',
-                    'banpick': self.find_paragraph(paragraphs, 'KT는 아지르-오리아나를 모두 풀어주는 과감한'),
-                    'narrative': self.find_paragraph(paragraphs, '그야말로 \'순수 체급\' 차이가')
-                },
-                {
-                    'set_number': 4,
-                    'winner': 'kt Rolster',
-                    'banpick': self.find_paragraph(paragraphs, '벼랑 끝에 몰린 젠지는 쵸비의 통산 첫 애니비아'),
-                    'narrative': self.find_paragraph(paragraphs, '젠지의 애니비아가 힘을 발휘하기도')
-                }
-            ]
-        ))
+        for anchor in missing:
+            self.stderr.write(self.style.WARNING(f'  ⚠️ 앵커를 찾을 수 없음: {anchor!r}'))
+        for anchor, found in ambiguous.items():
+            self.stderr.write(self.style.WARNING(
+                f'  ⚠️ 앵커가 여러 문단에 있음 (첫 번째 사용): {anchor!r} -> {", ".join(found)}'
+            ))
+        return len(missing) + len(ambiguous)
+
+    def parse_stories(self, index, outlines=()):
+        """
+        앵커 색인으로 MATCH_SPECS의 문단을 찾고, 앵커가 없는 경기는 문서 구조(outlines)에서 가져와
+        스토리 데이터 리스트를 반환합니다. 같은 세트가 여러 문서에 있으면 먼저 지정한 문서를 사용합니다.
+        """
+        stories = []
+        resolved = self.resolved_groups(index)
         
-        # 4강 2경기: TES vs T1 (0:3)
-        stories.extend(self.create_match_stories(
-            stage='SF',
-            match_number=2,
-            team_a='Top Esports',
-            team_b='T1',
-            final_score='0:3',
-            match_overview=self.find_paragraph(paragraphs, 'LPL의 마지막 희망으로 남은'),
-            sets=[
-                {
-                    'set_number': 1,
-                    'winner': 'T1',
-                    'banpick': self.find_paragraph(paragraphs, 'TES는 오리아나를 풀어주고 아칼리로 카운터'),
-                    'narrative': self.find_paragraph(paragraphs, '페이커의 오리아나는 \'노데스, 노플래시\'')
-                },
-                {
-                    'set_number': 2,
-                    'winner': 'T1',
-                    'banpick': self.find_paragraph(paragraphs, 'T1은 니코-갈리오-카밀-자르반-카이사'),
-                    'narrative': self.find_paragraph(paragraphs, 'T1의 날카로운 돌진이 TES의 핵심')
-                },
-                {
-                    'set_number': 3,
-                    'winner': 'T1',
-                    'banpick': self.find_paragraph(paragraphs, '마지막 희망을 건 TES는 \'재키러브\''),
-                    'narrative': self.find_paragraph(paragraphs, 'TES의 키아나가 초반 킬을 몰아먹으며')
-                }
-            ]
-        ))
+        for spec in MATCH_SPECS:
+            if (spec['stage'], spec['match_number']) not in resolved:
+                continue
+            stories.extend(self.create_match_stories(
+                stage=spec['stage'],
+                match_number=spec['match_number'],
+                team_a=spec['team_a'],
+                team_b=spec['team_b'],
+                final_score=spec['final_score'],
+                match_overview=index.get(spec['overview']),
+                sets=[
+                    {
+                        'set_number': set_info['set_number'],
+                        'winner': set_info['winner'],
+                        'banpick': index.get(set_info['banpick']),
+                        'narrative': index.get(set_info['narrative']),
+                    }
+                    for set_info in spec['sets']
+                ]
+            ))
         
         # === 결승 (Finals) ===
-        stories.extend(self.create_finals_story(paragraphs))
+        if ('F', 1) in resolved:
+            stories.extend(self.create_finals_story(index))
+        
+        # === 문서 구조로 찾은 경기 ===
+        keys = {(story['stage'], story['match_number'], story['set_number']) for story in stories}
+        for outline in outlines:
+            for story in self.create_outline_stories(outline):
+                key = (story['stage'], story['match_number'], story['set_number'])
+                if key not in keys:
+                    keys.add(key)
+                    stories.append(story)
+        
+        # 앵커도 문서 구조도 없어 건너뛴 경기 (저장된 스토리는 --prune 없이는 유지됨)
+        found = {(stage, match_number) for stage, match_number, _ in keys}
+        for stage, match_number in (key for key, _ in iter_anchor_groups()):
+            if (stage, match_number) not in found:
+                self.stderr.write(self.style.WARNING(
+                    f'  ⚠️ 문서에서 찾지 못해 건너뜀: [{stage}] {match_number}경기'
+                ))
         
         return stories
 
-    def find_paragraph(self, paragraphs, start_text):
-        """특정 텍스트로 시작하는 문단 찾기"""
-        for p in paragraphs:
-            if start_text in p:
-                return p
-        return ''
+    def create_outline_stories(self, outline):
+        """parse_story_outline 결과(경기 하나)를 스토리 데이터 리스트로 변환"""
+        return self.create_match_stories(
+            stage=outline['stage'],
+            match_number=outline['match_number'],
+            team_a=outline['team_a'],
+            team_b=outline['team_b'],
+            final_score=outline['final_score'],
+            match_overview=outline['overview'],
+            sets=[
+                {
+                    'set_number': set_info['set_number'],
+                    'winner': self.resolve_winner(set_info['winner'], outline['team_a'], outline['team_b']),
+                    'banpick': set_info['banpick'],
+                    'narrative': set_info['narrative'],
+                }
+                for set_info in outline['sets']
+            ],
+        )
+
+    def resolve_winner(self, label, team_a, team_b):
+        """세트 제목의 승리 팀 표기(약칭 또는 이름)를 경기 제목의 팀 이름으로 변환"""
+        for team in (team_a, team_b):
+            if TEAM_ABBREVIATIONS.get(label.upper()) == team or label.lower() == team.lower():
+                return team
+        # 약칭이 팀 이름의 앞부분인 경우 (예: 'Gen' -> 'Gen.G')
+        for team in (team_a, team_b):
+            if team.lower().startswith(label.lower()):
+                return team
+        self.stderr.write(self.style.WARNING(f'  ⚠️ 승리 팀을 알 수 없음: {label!r} ({team_a} vs {team_b})'))
+        return label
 
     def create_match_stories(self, stage, match_number, team_a, team_b, final_score, match_overview, sets):
         """경기 스토리 데이터 리스트 생성"""
@@ -277,14 +621,14 @@ class Command(BaseCommand):
             })
         return stories
 
-    def create_finals_story(self, paragraphs):
+    def create_finals_story(self, index):
         """결승전 스토리 생성 (요약 형태)"""
-        kt_story = self.find_paragraph(paragraphs, 'kt Rolster: LCK 정규시즌')
-        t1_story = self.find_paragraph(paragraphs, 'T1: 반면 T1은')
-        summary = self.find_paragraph(paragraphs, '치열한 접전 끝에 소환사의 컵은')
-        conclusion = self.find_paragraph(paragraphs, '이번 우승은 선수 개개인에게도')
+        kt_story = index.get(FINALS_ANCHORS['kt_story'])
+        t1_story = index.get(FINALS_ANCHORS['t1_story'])
+        summary = index.get(FINALS_ANCHORS['summary'])
+        conclusion = index.get(FINALS_ANCHORS['conclusion'])
         
-        overview = self.find_paragraph(paragraphs, '2025 월드 챔피언십 결승은 두 팀의')
+        overview = index.get(FINALS_ANCHORS['overview'])
         
         return [{
             'stage': 'F',
@@ -0,0 +1,407 @@
+import datetime
+import re
+from pathlib import Path
+from openpyxl import load_workbook
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from django.db import transaction
+from main.models import Champion, Match, MatchStory, PBContext, PickBan, Player, Team
+from main.serializers import rebuild_match_snapshots
+
+
+DEFAULT_WORKBOOK = '벤픽정리_전처리안됨.xlsx'
+
+# 워크북 컬럼명
+STAGE_COLUMN = '단계'
+MATCH_COLUMN = '매치'
+SET_COLUMN = '세트'
+WINNER_COLUMN = '승리'
+# 선택 컬럼: 경기 날짜, 진영 (없으면 --default-date / '매치'의 팀 순서를 사용)
+DATE_COLUMN = '날짜'
+BLUE_COLUMN = '블루'
+RED_COLUMN = '레드'
+# 선택 컬럼: 픽 컬럼명 + 접미사 (예: 'BP1 선수')
+PLAYER_COLUMN_SUFFIX = '선수'
+
+# 벤픽 컬럼 형식: 진영(B/R) + 유형(B=벤/P=픽) + 번호 (예: BB1, RP5)
+# 워크북의 컬럼 순서가 실제 벤픽 순서이므로 컬럼 위치로 order(1~20)를 정합니다.
+ACTION_COLUMN_PATTERN = re.compile(r'^([BR])([BP])(\d+)$')
+ACTION_TYPE = {'B': 'BAN', 'P': 'PICK'}
+
+# '매치' 셀 형식: "GEN vs HLE" (앞 팀이 블루 진영)
+MATCH_PATTERN = re.compile(r'^\s*(.+?)\s+vs\.?\s+(.+?)\s*$', re.IGNORECASE)
+
+# 단계 라벨 -> 코드 (모델 선택지 라벨 + 스토리 단계 라벨 + 코드 자체)
+STAGE_LABEL_TO_CODE = {label: code for code, label in Match.stage_choices}
+STAGE_LABEL_TO_CODE.update({label: code for code, label in MatchStory.STAGE_CHOICES})
+STAGE_LABEL_TO_CODE.update({code: code for code, _ in Match.stage_choices})
+
+# 워크북에서 쓰인 줄임말 -> 챔피언 이름
+CHAMPION_ALIASES = {
+    '블리츠': '블리츠크랭크',
+    '트페': '트위스티드 페이트',
+    '케틀': '케이틀린',
+    '문도박사': '문도 박사',
+}
+
+
+class Command(BaseCommand):
+    help = '벤픽정리 워크북(xlsx)에서 경기(세트)별 벤픽 20개와 PB 맥락을 로드합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            help=f'로드할 xlsx 파일 경로 (기본값: BASE_DIR/{DEFAULT_WORKBOOK})',
+        )
+        parser.add_argument(
+            '--sheet',
+            help='읽을 시트 이름 (기본값: 첫 번째 시트)',
+        )
+        parser.add_argument(
+            '--default-date',
+            type=datetime.date.fromisoformat,
+            metavar='YYYY-MM-DD',
+            help="'날짜' 컬럼이 없고 같은 시리즈의 기존 경기도 없을 때 사용할 경기 날짜",
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=50,
+            help='한 트랜잭션에서 처리할 경기(세트) 수 (기본값: 50)',
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options['path'] or Path(settings.BASE_DIR) / DEFAULT_WORKBOOK)
+        if not path.exists():
+            raise CommandError(f'워크북 파일을 찾을 수 없습니다: {path}')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size는 1 이상이어야 합니다.')
+
+        self.default_date = options['default_date']
+        self.load_caches()
+
+        summary = {'matches_created': 0, 'matches_updated': 0, 'actions_created': 0,
+                   'actions_updated': 0, 'actions_unchanged': 0}
+
+        batch = []
+        for game in self.iter_games(path, options['sheet']):
+            batch.append(game)
+            if len(batch) >= options['batch_size']:
+                self.load_batch(batch, summary)
+                batch = []
+        if batch:
+            self.load_batch(batch, summary)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 벤픽 로드 완료! 경기 생성: {summary['matches_created']}개, "
+            f"경기 업데이트: {summary['matches_updated']}개, "
+            f"벤픽 생성: {summary['actions_created']}개, "
+            f"벤픽 업데이트: {summary['actions_updated']}개, "
+            f"변경 없음: {summary['actions_unchanged']}개"
+        ))
+        if self.skipped_count:
+            self.stderr.write(self.style.WARNING(f'⚠️ 건너뛴 행: {self.skipped_count}개'))
+
+    # --- 워크북 읽기 ---
+
+    def iter_games(self, path, sheet_name):
+        """
+        워크북을 읽기 전용(스트리밍) 모드로 열어 세트 한 행씩 dict로 반환합니다.
+        '단계'/'매치' 셀은 시리즈의 첫 행에만 있으므로 빈 셀은 윗 행의 값을 이어받습니다.
+        """
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+            rows = worksheet.iter_rows(values_only=True)
+
+            header = [str(cell).strip() if cell is not None else '' for cell in next(rows, ())]
+            columns = {name: index for index, name in enumerate(header) if name}
+            for required in (STAGE_COLUMN, MATCH_COLUMN, SET_COLUMN, WINNER_COLUMN):
+                if required not in columns:
+                    raise CommandError(f"필수 컬럼이 없습니다: '{required}' ({path})")
+
+            actions = self.parse_action_columns(header, columns)
+            if not actions:
+                raise CommandError(f'벤픽 컬럼(BB1, RP1 등)을 찾을 수 없습니다: {path}')
+
+            carried = {STAGE_COLUMN: None, MATCH_COLUMN: None, DATE_COLUMN: None}
+            for line, row in enumerate(rows, start=2):
+                if not any(cell not in (None, '') for cell in row):
+                    continue
+                # 새 시리즈가 시작되면 이전 시리즈의 날짜를 이어받지 않음
+                if cell_value(row, columns[MATCH_COLUMN]) not in (None, ''):
+                    carried[DATE_COLUMN] = None
+                for name in carried:
+                    value = cell_value(row, columns.get(name))
+                    if value not in (None, ''):
+                        carried[name] = value
+
+                game = self.parse_row(line, row, columns, carried, actions)
+                if game is None:
+                    self.skipped_count += 1
+                    continue
+                yield game
+        finally:
+            workbook.close()
+
+    def parse_action_columns(self, header, columns):
+        """벤픽 컬럼 목록 [(컬럼 위치, 진영, 유형, 선수 컬럼 위치)]을 워크북 순서대로 반환"""
+        actions = []
+        for index, name in enumerate(header):
+            matched = ACTION_COLUMN_PATTERN.match(name)
+            if not matched:
+                continue
+            side, action, _ = matched.groups()
+            player_index = columns.get(f'{name} {PLAYER_COLUMN_SUFFIX}', columns.get(f'{name}{PLAYER_COLUMN_SUFFIX}'))
+            actions.append((index, side, ACTION_TYPE[action], player_index))
+        return actions
+
+    def parse_row(self, line, row, columns, carried, actions):
+        """한 행을 검증하여 경기 dict로 변환 (잘못된 행은 경고 후 None)"""
+        def reject(reason):
+            self.stderr.write(self.style.WARNING(f'  {line}행 건너뜀: {reason}'))
+
+        def cell(name):
+            return cell_value(row, columns.get(name))
+
+        stage_label = str(carried[STAGE_COLUMN] or '').strip()
+        stage = STAGE_LABEL_TO_CODE.get(stage_label)
+        if stage is None:
+            return reject(f"알 수 없는 단계 '{stage_label}'")
+
+        matched = MATCH_PATTERN.match(str(carried[MATCH_COLUMN] or ''))
+        if not matched:
+            return reject(f"'매치' 형식이 올바르지 않음 '{carried[MATCH_COLUMN]}'")
+        teams = matched.groups()
+
+        # 진영 컬럼이 있으면 사용, 없으면 '매치'에 먼저 적힌 팀을 블루 진영으로 간주
+        blue = str(cell(BLUE_COLUMN) or teams[0]).strip()
+        red = str(cell(RED_COLUMN) or (teams[1] if blue == teams[0] else teams[0])).strip()
+        if {blue, red} != set(teams):
+            return reject(f"진영 팀({blue}/{red})이 매치({' vs '.join(teams)})와 다름")
+
+        try:
+            set_number = int(float(cell(SET_COLUMN)))
+        except (TypeError, ValueError):
+            return reject(f"세트 번호가 올바르지 않음 '{cell(SET_COLUMN)}'")
+
+        winner = str(cell(WINNER_COLUMN) or '').strip()
+        if winner not in teams:
+            return reject(f"승리 팀 '{winner}'이 매치 팀이 아님")
+
+        match_date = carried[DATE_COLUMN]
+        if isinstance(match_date, datetime.datetime):
+            match_date = match_date.date()
+        elif match_date is not None:
+            try:
+                match_date = datetime.date.fromisoformat(str(match_date).strip())
+            except ValueError:
+                return reject(f"날짜 형식이 올바르지 않음 '{match_date}'")
+
+        game_actions = []
+        for order, (index, side, pb_type, player_index) in enumerate(actions, start=1):
+            champion = str(cell_value(row, index) or '').strip()
+            if not champion:
+                return reject(f'{order}번째 벤픽 칸이 비어 있음')
+            player = str(cell_value(row, player_index) or '').strip()
+            game_actions.append({
+                'order': order,
+                'team': blue if side == 'B' else red,
+                'pb_type': pb_type,
+                'champion': CHAMPION_ALIASES.get(champion, champion),
+                'player': player if pb_type == 'PICK' else '',
+            })
+
+        return {
+            'line': line,
+            'stage': stage,
+            'blue': blue,
+            'red': red,
+            'set_number': set_number,
+            'winner': winner,
+            'match_date': match_date,
+            'actions': game_actions,
+        }
+
+    # --- 이름 캐시 ---
+
+    def load_caches(self):
+        """팀/선수/챔피언/기존 경기를 한 번씩 조회하여 메모리 캐시로 보관"""
+        self.skipped_count = 0
+        self.team_ids = dict(Team.objects.values_list('name', 'id'))
+        self.champion_ids = dict(Champion.objects.values_list('name', 'id'))
+        self.player_ids = {
+            (team_id, name): player_id
+            for player_id, team_id, name in Player.objects.values_list('id', 'team_id', 'name')
+        }
+        # (단계, 팀 쌍, 세트) -> Match, (단계, 팀 쌍) -> 시리즈 날짜/단계 내 시리즈 번호
+        self.matches = {}
+        self.series_dates = {}
+        self.series_numbers = {}
+        for match in Match.objects.order_by('match_date', 'set_number', 'pk'):
+            series = (match.stage, frozenset((match.team_a_id, match.team_b_id)))
+            self.matches[series + (match.set_number,)] = match
+            self.series_dates.setdefault(series, match.match_date)
+            if match.match_number is not None:
+                self.series_numbers.setdefault(series, match.match_number)
+
+    def series_number(self, series):
+        """시리즈의 단계 내 번호 (새 시리즈는 단계의 마지막 번호 + 1, bulk_create는 save()를 거치지 않음)"""
+        if series not in self.series_numbers:
+            stage = series[0]
+            self.series_numbers[series] = 1 + max(
+                (number for (s, _), number in self.series_numbers.items() if s == stage), default=0
+            )
+        return self.series_numbers[series]
+
+    def resolve_names(self, cache, model, names, label):
+        """캐시에 없는 이름만 한 번에 생성하고 캐시에 추가 (name이 unique인 모델용)"""
+        missing = sorted({name for name in names if name not in cache})
+        if missing:
+            model.objects.bulk_create([model(name=name) for name in missing], ignore_conflicts=True)
+            cache.update(model.objects.filter(name__in=missing).values_list('name', 'id'))
+            for name in missing:
+                self.stdout.write(f'  새 {label} 생성: {name}')
+
+    def resolve_players(self, games):
+        """(팀 id, 선수 이름) 캐시에 없는 선수를 한 번에 생성"""
+        wanted = {
+            (self.team_ids[action['team']], action['player'])
+            for game in games for action in game['actions'] if action['player']
+        }
+        missing = [key for key in wanted if key not in self.player_ids]
+        if not missing:
+            return
+        Player.objects.bulk_create([Player(team_id=team_id, name=name) for team_id, name in missing])
+        team_ids = {team_id for team_id, _ in missing}
+        self.player_ids.update(
+            ((team_id, name), player_id)
+            for player_id, team_id, name in Player.objects.filter(team_id__in=team_ids).values_list('id', 'team_id', 'name')
+        )
+
+    # --- 저장 ---
+
+    def load_batch(self, games, summary):
+        """
+        경기(세트) 묶음을 하나의 트랜잭션으로 저장합니다.
+        이름은 캐시로 변환하고, 기존 벤픽은 (경기, 순서) 기준으로 비교해 바뀐 행만 갱신하므로
+        이미 작성된 PB 맥락(스토리텔링)은 유지됩니다.
+        """
+        games = self.drop_duplicate_games(games)
+        with transaction.atomic():
+            self.resolve_names(
+                self.team_ids, Team, [name for game in games for name in (game['blue'], game['red'])], '팀',
+            )
+            self.resolve_names(
+                self.champion_ids, Champion, [a['champion'] for game in games for a in game['actions']], '챔피언',
+            )
+            self.resolve_players(games)
+
+            matches = self.save_matches(games, summary)
+            if not matches:
+                return
+
+            existing = {
+                (pick_ban.match_id, pick_ban.order): pick_ban
+                for pick_ban in PickBan.objects.filter(match__in=[match for match, _ in matches])
+            }
+            to_create = []
+            to_update = []
+            for match, game in matches:
+                for action in game['actions']:
+                    team_id = self.team_ids[action['team']]
+                    values = {
+                        'team_id': team_id,
+                        'champion_id': self.champion_ids[action['champion']],
+                        'pb_type': action['pb_type'],
+                        'player_id': self.player_ids.get((team_id, action['player'])),
+                    }
+                    pick_ban = existing.get((match.id, action['order']))
+                    if pick_ban is None:
+                        to_create.append(PickBan(match=match, order=action['order'], **values))
+                    elif any(getattr(pick_ban, field) != value for field, value in values.items()):
+                        for field, value in values.items():
+                            setattr(pick_ban, field, value)
+                        to_update.append(pick_ban)
+                    else:
+                        summary['actions_unchanged'] += 1
+
+            # SQLite/PostgreSQL은 bulk_create 후 pk가 채워지므로 맥락 행을 바로 만들 수 있음
+            PickBan.objects.bulk_create(to_create)
+            PickBan.objects.bulk_update(to_update, ['team', 'champion', 'pb_type', 'player'])
+            PBContext.objects.bulk_create(
+                [PBContext(pick_ban=pick_ban, story_keyword='') for pick_ban in to_create],
+                ignore_conflicts=True,
+            )
+            summary['actions_created'] += len(to_create)
+            summary['actions_updated'] += len(to_update)
+
+            # bulk 작업은 시그널을 보내지 않으므로 이 묶음 경기의 API 스냅샷을 직접 다시 생성
+            rebuild_match_snapshots([match.pk for match, _ in matches])
+
+    def drop_duplicate_games(self, games):
+        """
+        같은 경기(단계, 팀 쌍, 세트 번호)가 묶음 안에 여러 번 있으면 마지막 행만 사용합니다.
+        그대로 bulk_create 하면 유일 제약 위반(IntegrityError)으로 묶음 전체가 롤백되므로 미리 걸러 경고하며,
+        묶음이 다를 때 뒤 행이 앞 행을 덮어쓰는 것과 같은 결과입니다.
+        """
+        latest = {}
+        for game in games:
+            key = (game['stage'], frozenset((game['blue'], game['red'])), game['set_number'])
+            if key in latest:
+                self.stderr.write(self.style.WARNING(
+                    f"  {latest[key]['line']}행 무시: {game['line']}행과 같은 경기(세트)입니다 (뒤 행 사용)"
+                ))
+                self.skipped_count += 1
+                del latest[key]
+            latest[key] = game
+        return list(latest.values())
+
+    def save_matches(self, games, summary):
+        """경기(세트)를 (단계, 팀 쌍, 세트 번호) 기준으로 생성/갱신하고 [(Match, game)]을 반환"""
+        to_create = []
+        to_update = []
+        matches = []
+        for game in games:
+            blue_id, red_id = self.team_ids[game['blue']], self.team_ids[game['red']]
+            series = (game['stage'], frozenset((blue_id, red_id)))
+            match_date = game['match_date'] or self.series_dates.get(series) or self.default_date
+            if match_date is None:
+                self.stderr.write(self.style.WARNING(
+                    f"  {game['line']}행 건너뜀: 경기 날짜를 알 수 없음 ('날짜' 컬럼 또는 --default-date 필요)"
+                ))
+                self.skipped_count += 1
+                continue
+            self.series_dates.setdefault(series, match_date)
+
+            values = {
+                'match_date': match_date,
+                'team_a_id': blue_id,
+                'team_b_id': red_id,
+                'winner_id': self.team_ids[game['winner']],
+            }
+            key = series + (game['set_number'],)
+            match = self.matches.get(key)
+            if match is None:
+                match = Match(
+                    stage=game['stage'], set_number=game['set_number'],
+                    match_number=self.series_number(series), **values
+                )
+                self.matches[key] = match
+                to_create.append(match)
+            elif any(getattr(match, field) != value for field, value in values.items()):
+                for field, value in values.items():
+                    setattr(match, field, value)
+                to_update.append(match)
+            matches.append((match, game))
+
+        Match.objects.bulk_create(to_create)
+        Match.objects.bulk_update(to_update, ['match_date', 'team_a', 'team_b', 'winner'])
+        summary['matches_created'] += len(to_create)
+        summary['matches_updated'] += len(to_update)
+        return matches
+
+
+def cell_value(row, index):
+    """행에서 컬럼 위치의 값 (컬럼이 없거나 행이 짧으면 None)"""
+    return row[index] if index is not None and index < len(row) else None
@@ -0,0 +1,104 @@
+import csv
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from django.db import models, transaction
+from main.api_cache import SERIES_STATS, bump_version
+from main.models import SeriesStat
+
+
+DEFAULT_CSV = 'series_stats.csv'
+
+# 키 컬럼과 통계 컬럼 (CSV 헤더 = 모델 필드명)
+KEY_FIELDS = ['stage', 'match_number']
+STAT_FIELDS = [
+    f'{prefix}_{side}' for _, prefix in SeriesStat.VIZ_CATEGORIES for side in ('a', 'b')
+]
+STAGE_CODES = {code for code, _ in SeriesStat._meta.get_field('stage').choices}
+
+
+class Command(BaseCommand):
+    help = 'series_stats.csv 파일에서 경기(시리즈)별 통계(킬, 타워, 드래곤, 바론, 골드)를 로드합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            help=f'로드할 CSV 파일 경로 (기본값: BASE_DIR/{DEFAULT_CSV})',
+        )
+        parser.add_argument(
+            '--rejects',
+            metavar='PATH',
+            help='파싱할 수 없는 행(파일, 줄 번호, 단계, 경기 번호, 사유)을 CSV로 저장합니다.',
+        )
+
+    def handle(self, *args, **options):
+        csv_path = Path(options['path'] or Path(settings.BASE_DIR) / DEFAULT_CSV)
+        if not csv_path.exists():
+            raise CommandError(f'CSV 파일을 찾을 수 없습니다: {csv_path}')
+
+        stats = []
+        rejects = []
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.DictReader(f)
+            missing = [field for field in KEY_FIELDS + STAT_FIELDS if field not in (reader.fieldnames or [])]
+            if missing:
+                raise CommandError(f"필수 컬럼이 없습니다: {', '.join(missing)} ({csv_path})")
+
+            # 잘못된 행은 전체를 중단하지 않고 거부 행으로 보고한 뒤 건너뜀
+            for line, row in enumerate(reader, start=2):
+                try:
+                    stats.append(self.parse_row(row))
+                except ValueError as e:
+                    rejects.append([csv_path, line, cell(row, 'stage'), cell(row, 'match_number'), str(e)])
+                    self.stderr.write(self.style.WARNING(f'  ⚠️ 거부: {csv_path}:{line} - {e}'))
+
+        existing = set(SeriesStat.objects.values_list('stage', 'match_number'))
+        with transaction.atomic():
+            SeriesStat.objects.bulk_create(
+                stats,
+                update_conflicts=True,
+                unique_fields=KEY_FIELDS,
+                update_fields=STAT_FIELDS,
+            )
+            # bulk upsert는 시그널을 보내지 않으므로 통계 캐시를 직접 무효화
+            bump_version(SERIES_STATS)
+
+        updated_count = sum(1 for stat in stats if (stat.stage, stat.match_number) in existing)
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 시리즈 통계 로드 완료! 새로 생성: {len(stats) - updated_count}개, 업데이트: {updated_count}개'
+        ))
+        if rejects:
+            if options['rejects']:
+                with open(options['rejects'], 'w', encoding='utf-8', newline='') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(['file', 'line', 'stage', 'match_number', 'reason'])
+                    writer.writerows(rejects)
+            self.stderr.write(self.style.WARNING(
+                f'⚠️ 파싱할 수 없어 건너뛴 행: {len(rejects)}개'
+                + (f' (상세: {options["rejects"]})' if options['rejects'] else '')
+            ))
+
+    def parse_row(self, row):
+        """CSV 한 행을 SeriesStat으로 변환 (값이 잘못되거나 비어 있으면 ValueError)"""
+        stage = cell(row, 'stage')
+        if stage not in STAGE_CODES:
+            raise ValueError(f"알 수 없는 단계 '{stage}'")
+        try:
+            match_number = int(cell(row, 'match_number'))
+        except ValueError:
+            raise ValueError(f"'match_number' 값이 올바르지 않음: {row.get('match_number')!r}") from None
+
+        values = {}
+        for field in STAT_FIELDS:
+            cast = float if isinstance(SeriesStat._meta.get_field(field), models.FloatField) else int
+            try:
+                values[field] = cast(cell(row, field))
+            except ValueError:
+                raise ValueError(f"'{field}' 값이 올바르지 않음: {row.get(field)!r}") from None
+
+        return SeriesStat(stage=stage, match_number=match_number, **values)
+
+
+def cell(row, field):
+    """행의 값 (앞뒤 공백 제거). csv.DictReader는 짧은 행의 빈 칸을 None으로 채우므로 빈 문자열로 취급"""
+    return (row.get(field) or '').strip()
@@ -0,0 +1,35 @@
+import time
+from django.core.management.base import BaseCommand
+from main.models import Match, MatchDataSnapshot
+from main.serializers import rebuild_match_snapshots
+
+
+class Command(BaseCommand):
+    help = 'match_data_api가 응답하는 경기별 JSON 스냅샷(MatchDataSnapshot)을 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--match',
+            type=int,
+            action='append',
+            dest='match_ids',
+            metavar='MATCH_ID',
+            help='다시 만들 경기 id (여러 번 지정 가능, 기본값: 전체 경기)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 직렬화/저장할 경기 수 (기본값: 500)',
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        match_ids = options['match_ids'] or list(Match.objects.values_list('pk', flat=True))
+
+        rebuilt = rebuild_match_snapshots(match_ids, batch_size=options['batch_size'])
+        # 전체 재생성 시 더 이상 없는 경기의 스냅샷은 CASCADE로 지워지므로 따로 정리할 필요 없음
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ 스냅샷 {rebuilt}개 생성 ({time.perf_counter() - started:.2f}초, '
+            f'전체 {MatchDataSnapshot.objects.count()}개)'
+        ))
@@ -0,0 +1,59 @@
+import json
+import time
+from collections import Counter
+from django.core.management.base import BaseCommand, CommandError
+from main.draft_validation import find_draft_violations
+
+
+class Command(BaseCommand):
+    help = '벤픽(PickBan) 데이터의 무결성(벤/픽 개수, 순서, 중복 챔피언, 벤의 선수 지정 등)을 검사합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--match',
+            type=int,
+            action='append',
+            dest='match_ids',
+            metavar='MATCH_ID',
+            help='검사할 경기 id (여러 번 지정 가능, 기본값: 전체 경기)',
+        )
+        parser.add_argument(
+            '--json',
+            metavar='PATH',
+            help="위반 보고서를 JSON 파일로 저장합니다 ('-'이면 표준 출력)",
+        )
+        parser.add_argument(
+            '--strict',
+            action='store_true',
+            help='위반 항목이 있으면 오류 코드로 종료합니다 (CI/배포 전 검사용).',
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        report = find_draft_violations(options['match_ids'])
+        report['elapsed'] = round(time.perf_counter() - started, 3)
+
+        if options['json'] == '-':
+            self.stdout.write(json.dumps(report, ensure_ascii=False, indent=2))
+        else:
+            if options['json']:
+                with open(options['json'], 'w', encoding='utf-8') as f:
+                    json.dump(report, f, ensure_ascii=False, indent=2)
+            self.print_summary(report)
+
+        if report['violation_count'] and options['strict']:
+            raise CommandError(f"벤픽 무결성 위반 {report['violation_count']}건")
+
+    def print_summary(self, report):
+        """검사 항목별 위반 건수 출력"""
+        summary = (
+            f"경기 {report['checked_matches']}개 / 벤픽 {report['checked_actions']}개 검사 "
+            f"({report['elapsed']}초)"
+        )
+        if not report['violation_count']:
+            self.stdout.write(self.style.SUCCESS(f'✅ 위반 없음: {summary}'))
+            return
+
+        self.stdout.write(self.style.WARNING(f"⚠️ 위반 {report['violation_count']}건: {summary}"))
+        for check, count in Counter(v['check'] for v in report['violations']).items():
+            self.stdout.write(f'  {check}: {count}건')
@@ -0,0 +1,219 @@
+"""
+여러 문자열 패턴을 한 번의 텍스트 순회로 찾는 다중 패턴 매처 (Aho-Corasick 자동자)
+"""
+from collections import deque
+
+
+class MultiPatternMatcher:
+    """
+    Aho-Corasick 자동자 기반 다중 패턴 매처.
+    패턴 수와 관계없이 텍스트를 한 번만 순회하며 모든 등장 위치를 찾습니다.
+
+    사용 예:
+        matcher = MultiPatternMatcher(['아지르', '오리아나'])
+        matcher.find_all('아지르-오리아나 구도')  # [(0, 0), (4, 1)]
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            if pattern:
+                self._add(pattern, index)
+        self._build_failure_links()
+
+    def _add(self, pattern, index):
+        """트라이에 패턴 추가"""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(index)
+
+    def _build_failure_links(self):
+        """BFS로 실패 링크를 계산하고 출력 목록을 병합"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text):
+        """텍스트에서 (시작 위치, 패턴 인덱스)를 등장 순서대로 반환"""
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self.patterns
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                yield position - len(patterns[index]) + 1, index
+
+    def find_all(self, text):
+        """텍스트의 모든 매칭을 (시작 위치, 패턴 인덱스) 리스트로 반환"""
+        return list(self.iter_matches(text))
+
+
+class AnchorIndex:
+    """
+    앵커 문자열 -> 앵커를 포함하는 문단 목록.
+    모든 앵커로 다중 패턴 자동자를 만들어 문단 전체를 한 번만 순회하며 매칭합니다.
+    여러 문서의 색인 결과를 merge()로 합칠 수 있으며, 먼저 추가된 문서의 문단이 우선합니다.
+    """
+
+    def __init__(self, anchors):
+        self.anchors = list(dict.fromkeys(anchors))
+        # 앵커 -> [(출처, 문단 번호, 문단 텍스트), ...]
+        self.found = {anchor: [] for anchor in self.anchors}
+        self._matcher = None
+
+    def add_document(self, paragraphs, source=''):
+        """문서 하나의 문단을 순회하며 앵커 위치를 기록"""
+        if self._matcher is None:
+            self._matcher = MultiPatternMatcher(self.anchors)
+
+        for paragraph_index, paragraph in enumerate(paragraphs):
+            matched_here = set()
+            for _, anchor_index in self._matcher.iter_matches(paragraph):
+                if anchor_index not in matched_here:
+                    matched_here.add(anchor_index)
+                    self.found[self.anchors[anchor_index]].append((source, paragraph_index, paragraph))
+        return self
+
+    def merge(self, found):
+        """다른 색인의 found(dict)를 뒤에 이어 붙임"""
+        for anchor, matches in found.items():
+            self.found.setdefault(anchor, []).extend(matches)
+
+    def get(self, anchor):
+        """앵커를 포함하는 첫 번째 문단 (없으면 빈 문자열)"""
+        matches = self.found.get(anchor)
+        return matches[0][2] if matches else ''
+
+    def missing(self):
+        """어느 문단에서도 찾지 못한 앵커 목록"""
+        return [anchor for anchor in self.anchors if not self.found[anchor]]
+
+    def ambiguous(self):
+        """두 개 이상의 문단에서 발견된 앵커 -> 위치('출처#문단 번호') 목록"""
+        return {
+            anchor: [f'{source}#{paragraph_index}' for source, paragraph_index, _ in matches]
+            for anchor, matches in self.found.items()
+            if len(matches) > 1
+        }
+
+
+def _is_hangul(char):
+    return '가' <= char <= '힣'
+
+
+def _is_word_char(char):
+    return char.isascii() and char.isalnum()
+
+
+class ChampionMatcher:
+    """
+    텍스트에서 챔피언 언급을 찾는 매처.
+    한글 이름/별칭과 영문 이름(대소문자 무시)을 하나의 자동자로 만들어 텍스트를 한 번만 순회합니다.
+
+    - 같은 위치에서 여러 이름이 겹치면 가장 긴 이름을 사용합니다 ('자르반4세' > '자르반').
+    - 한글 이름은 앞 글자가 한글이 아닐 때만 인정합니다 (뒤에는 조사가 붙을 수 있음).
+    - 영문 이름은 앞뒤가 영문/숫자가 아닐 때만 인정합니다.
+    - 불용어('바이퍼' 등)로 시작하는 위치는 챔피언으로 세지 않습니다.
+    """
+
+    def __init__(self, aliases, stopwords=(), display_names=None):
+        # aliases: {별칭: 챔피언 키}, display_names: {챔피언 키: 표시 이름} (없는 키는 키 자체를 표시)
+        self.display_names = display_names or {}
+        self.keys = []
+        patterns = []
+        for alias, key in aliases.items():
+            patterns.append(alias.lower())
+            self.keys.append(key)
+        for stopword in stopwords:
+            patterns.append(stopword.lower())
+            self.keys.append(None)
+        self._matcher = MultiPatternMatcher(patterns)
+
+    @classmethod
+    def from_champion_tables(cls):
+        """
+        champion_filters의 한글/영문 이름 표로 매처 생성 (챔피언 키는 파일명).
+        표시 이름은 영문 표시 이름, 없으면 한글 이름(champion_filename으로 같은 파일명이 됨)을 사용합니다.
+        """
+        from main.templatetags.champion_filters import (
+            CHAMPION_NAME_STOPWORDS, ENGLISH_DISPLAY_NAME, ENGLISH_FILENAME_MAP,
+            KOREAN_ALIASES, KOREAN_TO_ENGLISH_FILENAME,
+        )
+        aliases = {}
+        for slug, display_name in ENGLISH_DISPLAY_NAME.items():
+            aliases[display_name] = slug
+            aliases[slug] = slug
+        aliases.update(
+            (name, slug) for name, slug in ENGLISH_FILENAME_MAP.items() if slug in ENGLISH_DISPLAY_NAME
+        )
+        aliases.update(KOREAN_TO_ENGLISH_FILENAME)
+        aliases.update(KOREAN_ALIASES)
+
+        display_names = {slug: korean for korean, slug in reversed(KOREAN_TO_ENGLISH_FILENAME.items())}
+        display_names.update(ENGLISH_DISPLAY_NAME)
+        return cls(aliases, CHAMPION_NAME_STOPWORDS, display_names)
+
+    def display_name(self, key):
+        """챔피언 키의 표시 이름 (MatchStory.key_champions 저장 형식)"""
+        return self.display_names.get(key, key)
+
+    def iter_mentions(self, text):
+        """텍스트의 챔피언 언급을 등장 순서대로 (시작 위치, 챔피언 키)로 반환"""
+        text = text.lower()
+        patterns = self._matcher.patterns
+
+        # 시작 위치별 가장 긴 매칭만 남김
+        longest = {}
+        for start, index in self._matcher.iter_matches(text):
+            if start not in longest or len(patterns[index]) > len(patterns[longest[start]]):
+                longest[start] = index
+
+        covered_until = 0
+        for start in sorted(longest):
+            index = longest[start]
+            end = start + len(patterns[index])
+            if start < covered_until:
+                continue
+            covered_until = end
+
+            key = self.keys[index]
+            if key is None:
+                continue
+            before = text[start - 1] if start else ''
+            if _is_hangul(patterns[index][0]):
+                if before and _is_hangul(before):
+                    continue
+            else:
+                after = text[end] if end < len(text) else ''
+                if (before and _is_word_char(before)) or (after and _is_word_char(after)):
+                    continue
+            yield start, key
+
+    def rank(self, *texts):
+        """여러 텍스트에서 언급 횟수가 많은 순(같으면 먼저 등장한 순)으로 챔피언 키 목록 반환"""
+        counts = {}
+        for text in texts:
+            for _, key in self.iter_mentions(text or ''):
+                counts[key] = counts.get(key, 0) + 1
+        # dict는 삽입(첫 등장) 순서를 유지하므로 안정 정렬로 동률 시 첫 등장 순서가 유지됨
+        return sorted(counts, key=counts.get, reverse=True)
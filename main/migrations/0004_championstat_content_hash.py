@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:25
+
+import hashlib
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# 이 마이그레이션 시점의 지문 계산 방식 (main.models가 바뀌어도 결과가 달라지지 않도록 복사해 둠)
+CHAMPION_STAT_FIELDS = [
+    'total_picks',
+    'blue_first_pick',
+    'red_first_pick',
+    'tier_score',
+    'side_index',
+    'side_preference',
+]
+
+
+def champion_stat_fingerprint(values):
+    payload = json.dumps([values[field] for field in CHAMPION_STAT_FIELDS], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def backfill_content_hash(apps, schema_editor):
+    """기존 ChampionStat 행의 내용 지문을 채웁니다."""
+    ChampionStat = apps.get_model('main', 'ChampionStat')
+    stats = list(ChampionStat.objects.all())
+    for stat in stats:
+        stat.content_hash = champion_stat_fingerprint(
+            {field: getattr(stat, field) for field in CHAMPION_STAT_FIELDS}
+        )
+    ChampionStat.objects.bulk_update(stats, ['content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0003_matchstory_key_champions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChampionStatSource',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(max_length=500, unique=True, verbose_name='파일 경로')),
+                ('checksum', models.CharField(blank=True, max_length=64, verbose_name='파일 체크섬 (SHA-256)')),
+                ('row_count', models.IntegerField(default=0, verbose_name='행 수')),
+                ('loaded_at', models.DateTimeField(auto_now=True, verbose_name='마지막 로드 시각')),
+            ],
+            options={
+                'verbose_name': '챔피언 통계 원본 파일',
+                'verbose_name_plural': '챔피언 통계 원본 파일 목록',
+            },
+        ),
+        migrations.AddField(
+            model_name='championstat',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=40, verbose_name='내용 지문'),
+        ),
+        migrations.AddField(
+            model_name='championstat',
+            name='source',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='stats', to='main.championstatsource', verbose_name='원본 파일'),
+        ),
+        migrations.RunPython(backfill_content_hash, migrations.RunPython.noop),
+    ]
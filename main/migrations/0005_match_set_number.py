@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0004_championstat_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='match',
+            name='set_number',
+            field=models.IntegerField(default=1, verbose_name='세트 번호'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:35
+
+from django.db import migrations, models
+
+
+def backfill_match_number(apps, schema_editor):
+    """
+    단계별로 시리즈(두 팀)를 첫 경기 날짜 순으로 번호 매깁니다.
+    기존 index 뷰는 세트(행)마다 번호를 올렸지만, 여기서는 같은 시리즈의 세트가 모두 같은 번호를 가집니다
+    (MatchStory의 stage별 match_number와 같은 기준).
+    """
+    Match = apps.get_model('main', 'Match')
+    series_numbers = {}
+    stage_counts = {}
+    matches = list(Match.objects.order_by('match_date', 'set_number', 'pk'))
+    for match in matches:
+        series = (match.stage, frozenset((match.team_a_id, match.team_b_id)))
+        if series not in series_numbers:
+            stage_counts[match.stage] = stage_counts.get(match.stage, 0) + 1
+            series_numbers[series] = stage_counts[match.stage]
+        match.match_number = series_numbers[series]
+    Match.objects.bulk_update(matches, ['match_number'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0005_match_set_number'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='match',
+            name='match_number',
+            field=models.IntegerField(blank=True, null=True, verbose_name='단계 내 시리즈 번호'),
+        ),
+        migrations.RunPython(backfill_match_number, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_match_match_number'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatchDataSnapshot',
+            fields=[
+                ('match', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='data_snapshot', serialize=False, to='main.match', verbose_name='경기')),
+                ('payload', models.TextField(verbose_name='응답 JSON')),
+                ('built_at', models.DateTimeField(auto_now=True, verbose_name='생성 시각')),
+            ],
+            options={
+                'verbose_name': '경기 데이터 스냅샷',
+                'verbose_name_plural': '경기 데이터 스냅샷 목록',
+            },
+        ),
+    ]
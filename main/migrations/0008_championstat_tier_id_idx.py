@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0007_matchdatasnapshot'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='championstat',
+            index=models.Index(fields=['-tier_score', '-id'], name='championstat_tier_id_idx'),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:41
+
+from django.db import migrations, models
+
+
+# 마이그레이션 시점의 시리즈 통계 (series_stats.csv와 같은 값을 고정해 둠)
+SERIES_STAT_FIELDS = (
+    'stage', 'match_number', 'series_score_a', 'series_score_b', 'kills_a', 'kills_b',
+    'towers_a', 'towers_b', 'dragons_a', 'dragons_b', 'barons_a', 'barons_b', 'gold_a', 'gold_b',
+)
+SERIES_STAT_ROWS = [
+    ('QF', 1, 3, 1, 74, 65, 30, 26, 11, 10, 4, 3, 296.2, 287.4),
+    ('QF', 2, 3, 0, 70, 28, 26, 6, 11, 2, 2, 0, 179.2, 146.0),
+    ('QF', 3, 1, 3, 38, 65, 16, 26, 5, 11, 1, 3, 210.5, 232.8),
+    ('QF', 4, 2, 3, 76, 73, 25, 35, 9, 17, 2, 3, 322.5, 328.6),
+    ('SF', 1, 1, 3, 48, 66, 22, 31, 7, 16, 4, 3, 262.8, 281.6),
+    ('SF', 2, 3, 0, 70, 27, 22, 7, 11, 1, 3, 0, 178.6, 147.6),
+    ('F', 1, 2, 3, 77, 89, 23, 37, 12, 15, 3, 4, 325.7, 350.0),
+]
+
+
+def seed_series_stats(apps, schema_editor):
+    """
+    기존에 views.py에 하드코딩되어 있던 통계를 옮겨 담습니다.
+    마이그레이션은 언제 실행해도 같은 결과여야 하므로 CSV를 읽지 않고 위에 고정한 값을 씁니다.
+    이후 추가/수정은 load_series_stats 명령으로 로드합니다.
+    """
+    SeriesStat = apps.get_model('main', 'SeriesStat')
+    SeriesStat.objects.bulk_create([
+        SeriesStat(**dict(zip(SERIES_STAT_FIELDS, row))) for row in SERIES_STAT_ROWS
+    ], ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0008_championstat_tier_id_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeriesStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stage', models.CharField(choices=[('QF', '8강'), ('SF', '4강'), ('F', '결승')], max_length=5, verbose_name='경기 단계')),
+                ('match_number', models.IntegerField(verbose_name='경기 번호')),
+                ('series_score_a', models.IntegerField(default=0, verbose_name='세트 스코어 A')),
+                ('series_score_b', models.IntegerField(default=0, verbose_name='세트 스코어 B')),
+                ('kills_a', models.IntegerField(default=0, verbose_name='킬 A')),
+                ('kills_b', models.IntegerField(default=0, verbose_name='킬 B')),
+                ('towers_a', models.IntegerField(default=0, verbose_name='타워 A')),
+                ('towers_b', models.IntegerField(default=0, verbose_name='타워 B')),
+                ('dragons_a', models.IntegerField(default=0, verbose_name='드래곤 A')),
+                ('dragons_b', models.IntegerField(default=0, verbose_name='드래곤 B')),
+                ('barons_a', models.IntegerField(default=0, verbose_name='바론 A')),
+                ('barons_b', models.IntegerField(default=0, verbose_name='바론 B')),
+                ('gold_a', models.FloatField(default=0, verbose_name='골드 A (천)')),
+                ('gold_b', models.FloatField(default=0, verbose_name='골드 B (천)')),
+            ],
+            options={
+                'verbose_name': '시리즈 통계',
+                'verbose_name_plural': '시리즈 통계 목록',
+                'ordering': ['stage', 'match_number'],
+                'unique_together': {('stage', 'match_number')},
+            },
+        ),
+        migrations.RunPython(seed_series_stats, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,6 @@
+import hashlib
+import json
+
 from django.db import models
 
 # 1. 챔피언 (Champion) 모델: 벤픽 대상
@@ -70,8 +73,32 @@ class Match(models.Model):
     team_a = models.ForeignKey(Team, on_delete=models.PROTECT, related_name='home_matches', verbose_name='Team A')
     team_b = models.ForeignKey(Team, on_delete=models.PROTECT, related_name='away_matches', verbose_name='Team B')
     winner = models.ForeignKey(Team, on_delete=models.PROTECT, related_name='won_matches', verbose_name='승리 팀')
+    set_number = models.IntegerField(default=1, verbose_name='세트 번호')  # 시리즈 내 세트 번호 (1~5)
+    # 단계 내 시리즈 번호 (경기 스토리 URL의 match_number). 비어 있으면 저장 시 계산
+    # 번호는 행(세트)마다가 아니라 시리즈(단계 + 두 팀)마다 매깁니다: 같은 시리즈의 세트는 모두 같은 번호를 가지며,
+    # 예전 index 뷰가 세트마다 1씩 올리던 번호와 달리 MatchStory(stage, match_number)와 일치합니다.
+    match_number = models.IntegerField(null=True, blank=True, verbose_name='단계 내 시리즈 번호')
     # match_url = models.URLField(verbose_name='경기 영상/하이라이트 URL', null=True, blank=True)
     
+    def save(self, *args, **kwargs):
+        if self.match_number is None:  # 번호를 지정해 저장하면(로더 등) 추가 쿼리 없음
+            self.match_number = self.next_match_number()
+        super().save(*args, **kwargs)
+
+    def next_match_number(self):
+        """같은 시리즈(단계 + 두 팀)의 기존 번호, 없으면 단계 내 마지막 번호 + 1 (집계 쿼리 1번)"""
+        same_series = (
+            models.Q(team_a=self.team_a_id, team_b=self.team_b_id)
+            | models.Q(team_a=self.team_b_id, team_b=self.team_a_id)
+        )
+        numbers = Match.objects.filter(stage=self.stage).exclude(pk=self.pk).aggregate(
+            series=models.Max('match_number', filter=same_series),
+            last=models.Max('match_number'),
+        )
+        if numbers['series'] is not None:
+            return numbers['series']
+        return (numbers['last'] or 0) + 1
+
     def __str__(self):
         return f"[{self.stage}] {self.team_a.name} vs {self.team_b.name} ({self.match_date})"
     
@@ -138,6 +165,57 @@ class PBContext(models.Model):
 
 
 # 5. 챔피언 통계 (ChampionStat) 모델: 사전 챔피언십 분석 데이터
+# 지문(fingerprint) 계산에 사용하는 통계 필드 목록
+CHAMPION_STAT_FIELDS = [
+    'total_picks',
+    'blue_first_pick',
+    'red_first_pick',
+    'tier_score',
+    'side_index',
+    'side_preference',
+]
+
+
+# 지문 계산 전 값을 모델 필드 타입으로 맞춤 (5와 5.0, numpy 정수 등이 같은 지문이 되도록)
+CHAMPION_STAT_TYPES = {
+    'total_picks': int,
+    'blue_first_pick': int,
+    'red_first_pick': int,
+    'tier_score': float,
+    'side_index': float,
+    'side_preference': str,
+}
+
+
+def champion_stat_fingerprint(values):
+    """
+    통계 필드 값(dict)으로 행 단위 내용 지문(SHA-1)을 계산합니다.
+    값이 같으면 항상 같은 지문이 나오므로 변경 여부 판단에 사용합니다.
+    """
+    payload = json.dumps(
+        [CHAMPION_STAT_TYPES[field](values[field]) for field in CHAMPION_STAT_FIELDS], ensure_ascii=False
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class ChampionStatSource(models.Model):
+    """
+    챔피언 통계를 로드한 CSV 파일 정보.
+    파일 체크섬을 저장하여 변경되지 않은 파일은 재로드를 건너뜁니다.
+    """
+    path = models.CharField(max_length=500, unique=True, verbose_name='파일 경로')
+    checksum = models.CharField(max_length=64, blank=True, verbose_name='파일 체크섬 (SHA-256)')
+    row_count = models.IntegerField(default=0, verbose_name='행 수')
+    loaded_at = models.DateTimeField(auto_now=True, verbose_name='마지막 로드 시각')
+
+    def __str__(self):
+        return self.path
+
+    class Meta:
+        verbose_name = '챔피언 통계 원본 파일'
+        verbose_name_plural = '챔피언 통계 원본 파일 목록'
+
+
 class ChampionStat(models.Model):
     """
     2025 월드 챔피언십 사전 분석 데이터 (prechampions.csv 기반).
@@ -170,12 +248,33 @@ class ChampionStat(models.Model):
         default='BALANCED',
         verbose_name='진영 선호도'
     )
+    # 증분 로드용 메타데이터
+    content_hash = models.CharField(max_length=40, blank=True, verbose_name='내용 지문')
+    source = models.ForeignKey(
+        ChampionStatSource,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='stats',
+        verbose_name='원본 파일'
+    )
+    
+    def save(self, *args, **kwargs):
+        # 관리자 페이지 등에서 수정해도 지문이 항상 현재 값과 일치하도록 유지
+        self.content_hash = champion_stat_fingerprint(
+            {field: getattr(self, field) for field in CHAMPION_STAT_FIELDS}
+        )
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'content_hash'}
+        super().save(*args, **kwargs)
     
     def __str__(self):
         return f"{self.champion.name} - Tier: {self.tier_score}, Side: {self.get_side_preference_display()}"
     
     class Meta:
         ordering = ['-tier_score']
+        # champion_stats_api 키셋 페이지네이션 (tier_score, id 내림차순)
+        indexes = [models.Index(fields=['-tier_score', '-id'], name='championstat_tier_id_idx')]
         verbose_name = '챔피언 통계'
         verbose_name_plural = '챔피언 통계 목록'
 
@@ -233,4 +332,77 @@ class MatchStory(models.Model):
     def get_stage_order(self):
         """정렬을 위한 단계 순서 반환"""
         order = {'QF': 1, 'SF': 2, 'F': 3}
-        return order.get(self.stage, 0)
\ No newline at end of file
+        return order.get(self.stage, 0)
+
+# 7. 경기 데이터 스냅샷 (MatchDataSnapshot) 모델: match_data_api의 읽기 모델
+class MatchDataSnapshot(models.Model):
+    """
+    경기별로 미리 직렬화해 둔 match_data_api 응답 JSON.
+    벤픽/맥락/경기/이름이 바뀌면 signals 또는 rebuild_match_snapshots 명령으로 다시 만들어지며,
+    API는 기본 키 조회 한 번으로 이 문자열을 그대로 응답합니다.
+    """
+    match = models.OneToOneField(
+        Match,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='data_snapshot',
+        verbose_name='경기'
+    )
+    payload = models.TextField(verbose_name='응답 JSON')
+    built_at = models.DateTimeField(auto_now=True, verbose_name='생성 시각')
+    
+    def __str__(self):
+        return f"{self.match} 스냅샷 ({self.built_at})"
+    
+    class Meta:
+        verbose_name = '경기 데이터 스냅샷'
+        verbose_name_plural = '경기 데이터 스냅샷 목록'
+
+
+# 8. 시리즈 통계 (SeriesStat) 모델: 경기 스토리 상세 페이지의 비교 차트 데이터
+class SeriesStat(models.Model):
+    """
+    경기(시리즈) 전체의 팀별 누적 통계. (a: MatchStory.team_a, b: MatchStory.team_b)
+    series_stats.csv를 load_series_stats 명령으로 로드합니다.
+    """
+    # 차트 항목 라벨, 필드 접두사 (표시 순서대로)
+    VIZ_CATEGORIES = [
+        ('SERIES SCORE', 'series_score'),
+        ('TOTAL KILLS', 'kills'),
+        ('TOWERS', 'towers'),
+        ('DRAGONS', 'dragons'),
+        ('BARONS', 'barons'),
+        ('GOLD (k)', 'gold'),
+    ]
+    
+    stage = models.CharField(max_length=5, choices=MatchStory.STAGE_CHOICES, verbose_name='경기 단계')
+    match_number = models.IntegerField(verbose_name='경기 번호')
+    
+    series_score_a = models.IntegerField(default=0, verbose_name='세트 스코어 A')
+    series_score_b = models.IntegerField(default=0, verbose_name='세트 스코어 B')
+    kills_a = models.IntegerField(default=0, verbose_name='킬 A')
+    kills_b = models.IntegerField(default=0, verbose_name='킬 B')
+    towers_a = models.IntegerField(default=0, verbose_name='타워 A')
+    towers_b = models.IntegerField(default=0, verbose_name='타워 B')
+    dragons_a = models.IntegerField(default=0, verbose_name='드래곤 A')
+    dragons_b = models.IntegerField(default=0, verbose_name='드래곤 B')
+    barons_a = models.IntegerField(default=0, verbose_name='바론 A')
+    barons_b = models.IntegerField(default=0, verbose_name='바론 B')
+    gold_a = models.FloatField(default=0, verbose_name='골드 A (천)')
+    gold_b = models.FloatField(default=0, verbose_name='골드 B (천)')
+    
+    def viz_data(self):
+        """상세 페이지 차트용 [{category, left, right}, ...] 목록"""
+        return [
+            {'category': label, 'left': getattr(self, f'{prefix}_a'), 'right': getattr(self, f'{prefix}_b')}
+            for label, prefix in self.VIZ_CATEGORIES
+        ]
+    
+    def __str__(self):
+        return f"[{self.get_stage_display()}] {self.match_number}경기 통계"
+    
+    class Meta:
+        ordering = ['stage', 'match_number']
+        unique_together = ('stage', 'match_number')
+        verbose_name = '시리즈 통계'
+        verbose_name_plural = '시리즈 통계 목록'
@@ -0,0 +1,309 @@
+"""
+API 응답(JSON) 직렬화.
+모델 인스턴스를 만들지 않고 values() 프로젝션으로 필요한 컬럼만 조회하여 dict를 조립합니다.
+"""
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Q
+
+from main.api_cache import bump_version, match_group
+from main.models import ChampionStat, Match, MatchDataSnapshot, MatchStory, PBContext, PickBan
+
+# 분류 라벨 코드 -> 표시 이름 (get_story_label_display()와 동일)
+STORY_LABEL_DISPLAY = dict(PBContext.story_label_choices)
+STAGE_DISPLAY = dict(Match.stage_choices)
+
+# PBContext가 없는 벤픽의 기본 스토리 정보
+EMPTY_STORY_CONTEXT = {
+    'label': STORY_LABEL_DISPLAY['NONE'],
+    'keyword': '',
+    'comment': '',
+    'intensity': 0,
+}
+
+PICK_BAN_FIELDS = (
+    'order', 'pb_type', 'team__name', 'champion__name', 'player__name',
+    # 역방향 1:1 관계는 LEFT OUTER JOIN이므로 맥락이 없으면 pick_ban_id가 None
+    'pbcontext__pick_ban_id', 'pbcontext__story_label', 'pbcontext__story_keyword',
+    'pbcontext__expert_comment', 'pbcontext__emotional_intensity',
+)
+
+
+def serialize_pick_ban(row):
+    """PickBan values() 한 행 -> API의 pick_bans 항목 (맥락이 없으면 기본값, 예외 없음)"""
+    if row['pbcontext__pick_ban_id'] is None:
+        story_context = dict(EMPTY_STORY_CONTEXT)
+    else:
+        story_context = {
+            'label': STORY_LABEL_DISPLAY.get(row['pbcontext__story_label'], row['pbcontext__story_label']),
+            'keyword': row['pbcontext__story_keyword'],
+            'comment': row['pbcontext__expert_comment'],
+            'intensity': row['pbcontext__emotional_intensity'],
+        }
+    return {
+        'order': row['order'],
+        'type': row['pb_type'],
+        'team': row['team__name'],
+        'champion': row['champion__name'],
+        'player': row['player__name'],
+        'story_context': story_context,
+    }
+
+
+def match_data_payloads(match_ids):
+    """
+    여러 경기의 match_data_api 응답 dict를 쿼리 2번(경기 1번 + 벤픽/맥락 1번)으로 만듭니다.
+    반환값: {경기 id: 응답 dict} (없는 경기는 제외)
+    """
+    matches = (
+        Match.objects.filter(pk__in=match_ids)
+        .values('id', 'stage', 'match_date', 'team_a__name', 'team_b__name', 'winner__name')
+    )
+    payloads = {
+        match['id']: {
+            'match_info': {
+                'id': match['id'],
+                'stage': STAGE_DISPLAY.get(match['stage'], match['stage']),
+                'date': match['match_date'].strftime('%Y-%m-%d'),
+                'team_a': match['team_a__name'],
+                'team_b': match['team_b__name'],
+                'winner': match['winner__name'],
+            },
+            'pick_bans': [],
+        }
+        for match in matches
+    }
+    if not payloads:
+        return payloads
+
+    pick_bans = (
+        PickBan.objects.filter(match_id__in=payloads)
+        .order_by('match_id', 'order')
+        .values('match_id', *PICK_BAN_FIELDS)
+    )
+    for row in pick_bans:
+        payloads[row['match_id']]['pick_bans'].append(serialize_pick_ban(row))
+    return payloads
+
+
+def match_data_payload(match_id):
+    """한 경기의 match_data_api 응답 dict (경기가 없으면 None)"""
+    return match_data_payloads([match_id]).get(match_id)
+
+
+def rebuild_match_snapshots(match_ids, batch_size=500):
+    """
+    경기별 응답 JSON을 다시 직렬화하여 MatchDataSnapshot에 upsert 하고 해당 경기의 캐시 버전을 올립니다
+    (없는/삭제된 경기도 버전을 올림).
+    JsonResponse와 같은 인코더를 사용하므로 저장된 문자열을 그대로 응답할 수 있습니다.
+    반환값: 다시 만든 스냅샷 수
+    """
+    match_ids = list(dict.fromkeys(match_ids))
+    rebuilt = 0
+    for start in range(0, len(match_ids), batch_size):
+        batch = match_ids[start:start + batch_size]
+        payloads = match_data_payloads(batch)
+        MatchDataSnapshot.objects.bulk_create(
+            [
+                MatchDataSnapshot(match_id=match_id, payload=json.dumps(payload, cls=DjangoJSONEncoder))
+                for match_id, payload in payloads.items()
+            ],
+            update_conflicts=True,
+            unique_fields=['match'],
+            update_fields=['payload', 'built_at'],
+        )
+        rebuilt += len(payloads)
+        # 요청된 모든 경기의 응답 캐시 무효화 (트랜잭션 안이면 커밋 후).
+        # 삭제된 경기는 payload가 없지만, 버전을 올려야 캐시된 본문/ETag 대신 404를 응답함
+        bump_version(*[match_group(match_id) for match_id in batch])
+    return rebuilt
+
+
+# --- 챔피언 통계 API ---
+
+# 응답 필드 -> values() 경로 (side_preference는 코드에서 표시 이름으로 변환)
+CHAMPION_STAT_API_FIELDS = {
+    'name': 'champion__name',
+    'total_picks': 'total_picks',
+    'blue_first_pick': 'blue_first_pick',
+    'red_first_pick': 'red_first_pick',
+    'tier_score': 'tier_score',
+    'side_index': 'side_index',
+    'side_preference': 'side_preference',
+    'side_preference_code': 'side_preference',
+}
+SIDE_PREFERENCE_DISPLAY = dict(ChampionStat.SIDE_PREFERENCE_CHOICES)
+# 한 페이지 최대 행 수
+MAX_CHAMPION_STATS_LIMIT = 500
+
+
+def parse_champion_stats_fields(value):
+    """?fields= 값을 응답 필드 목록으로 변환 (없으면 전체, 알 수 없는 필드는 ValueError)"""
+    if not value:
+        return list(CHAMPION_STAT_API_FIELDS)
+    fields = list(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+    unknown = [field for field in fields if field not in CHAMPION_STAT_API_FIELDS]
+    if unknown or not fields:
+        raise ValueError(
+            f"알 수 없는 필드: {', '.join(unknown) or value} (사용 가능: {', '.join(CHAMPION_STAT_API_FIELDS)})"
+        )
+    return fields
+
+
+def encode_champion_stats_cursor(tier_score, stat_id):
+    return f'{tier_score!r}:{stat_id}'
+
+
+def decode_champion_stats_cursor(cursor):
+    """'tier_score:id' 커서를 (tier_score, id)로 변환 (형식이 틀리면 ValueError)"""
+    tier_score, _, stat_id = cursor.rpartition(':')
+    try:
+        return float(tier_score), int(stat_id)
+    except ValueError:
+        raise ValueError(f'잘못된 커서: {cursor}') from None
+
+
+def champion_stats_page(fields, after=None, limit=None):
+    """
+    챔피언 통계를 (tier_score 내림차순, id 내림차순)으로 정렬해 요청한 필드만 values()로 조회합니다.
+    after 커서 다음 행부터 limit개를 반환하며 (키셋 페이지네이션, OFFSET 없음),
+    total_count는 별도 count() 쿼리 없이 가져온 행 수입니다.
+    """
+    paths = {'id', 'tier_score', *(CHAMPION_STAT_API_FIELDS[field] for field in fields)}
+    stats = ChampionStat.objects.order_by('-tier_score', '-id').values(*paths)
+    if after is not None:
+        tier_score, stat_id = after
+        stats = stats.filter(Q(tier_score__lt=tier_score) | Q(tier_score=tier_score, id__lt=stat_id))
+
+    rows = list(stats[:limit + 1] if limit else stats)
+    next_cursor = None
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_champion_stats_cursor(rows[-1]['tier_score'], rows[-1]['id'])
+
+    champions = []
+    for row in rows:
+        champion = {field: row[CHAMPION_STAT_API_FIELDS[field]] for field in fields}
+        if 'side_preference' in champion:
+            champion['side_preference'] = SIDE_PREFERENCE_DISPLAY.get(row['side_preference'], row['side_preference'])
+        champions.append(champion)
+
+    data = {'champions': champions, 'total_count': len(champions)}
+    if limit:
+        data['next_cursor'] = next_cursor
+    return data
+
+
+# --- 경기 스토리 API ---
+
+STORY_API_FIELDS = (
+    'id', 'stage', 'match_number', 'set_number', 'team_a', 'team_b', 'winner', 'final_score',
+    'match_overview', 'banpick_analysis', 'game_narrative',
+)
+STORY_ORDERING = ('stage', 'match_number', 'set_number')
+STORY_STAGE_DISPLAY = dict(MatchStory.STAGE_CHOICES)
+# 스트리밍 시 DB에서 한 번에 가져오는 행 수 / 한 페이지 최대 행 수
+STORY_CHUNK_SIZE = 100
+MAX_STORIES_LIMIT = 500
+
+
+def serialize_story(row):
+    """MatchStory values() 한 행 -> API의 stories 항목"""
+    return {
+        'id': row['id'],
+        'stage': row['stage'],
+        'stage_display': STORY_STAGE_DISPLAY.get(row['stage'], row['stage']),
+        **{field: row[field] for field in STORY_API_FIELDS[2:]},
+    }
+
+
+def encode_story_cursor(stage, match_number, set_number):
+    return f'{stage}:{match_number}:{set_number}'
+
+
+def decode_story_cursor(cursor):
+    """'stage:match_number:set_number' 커서를 튜플로 변환 (형식이 틀리면 ValueError)"""
+    try:
+        stage, match_number, set_number = cursor.split(':')
+        return stage, int(match_number), int(set_number)
+    except ValueError:
+        raise ValueError(f'잘못된 커서: {cursor}') from None
+
+
+def story_page(after=None, limit=None):
+    """
+    (stage, match_number, set_number) 순서의 스토리 QuerySet과 다음 페이지 커서를 반환합니다.
+    after 커서 다음 행부터 limit개 (키셋 페이지네이션, unique_together 인덱스 사용).
+    다음 커서는 정렬 키 컬럼만 limit+1행 조회하여 긴 본문을 읽기 전에 계산합니다.
+    """
+    stories = MatchStory.objects.order_by(*STORY_ORDERING)
+    if after is not None:
+        stage, match_number, set_number = after
+        stories = stories.filter(
+            Q(stage__gt=stage)
+            | Q(stage=stage, match_number__gt=match_number)
+            | Q(stage=stage, match_number=match_number, set_number__gt=set_number)
+        )
+    if not limit:
+        return stories, None
+
+    keys = list(stories.values_list(*STORY_ORDERING)[:limit + 1])
+    next_cursor = encode_story_cursor(*keys[limit - 1]) if len(keys) > limit else None
+    return stories[:limit], next_cursor
+
+
+def iter_story_json(stories, next_cursor=None, paginated=False):
+    """스토리를 청크 단위로 읽으며 {"stories": [...], "total_count": N} JSON을 조각으로 반환"""
+    yield '{"stories": ['
+    count = 0
+    for row in stories.values(*STORY_API_FIELDS).iterator(chunk_size=STORY_CHUNK_SIZE):
+        yield (', ' if count else '') + json.dumps(serialize_story(row), cls=DjangoJSONEncoder)
+        count += 1
+    # total_count는 count() 쿼리 없이 보낸 행 수로 계산
+    tail = {'total_count': count}
+    if paginated:
+        tail['next_cursor'] = next_cursor
+    yield '], ' + json.dumps(tail)[1:]
+
+
+def iter_story_ndjson(stories):
+    """스토리를 한 줄에 하나씩 JSON으로 반환 (NDJSON)"""
+    for row in stories.values(*STORY_API_FIELDS).iterator(chunk_size=STORY_CHUNK_SIZE):
+        yield json.dumps(serialize_story(row), cls=DjangoJSONEncoder) + '\n'
+
+
+# --- 홈페이지 차트 집계 ---
+
+TOP_TIER_LIMIT = 10
+FIRST_PICK_LIMIT = 8
+
+
+def champion_stats_summary():
+    """
+    홈페이지 차트 3종의 집계 (챔피언 수와 관계없이 응답 크기 일정, 쿼리 2번).
+    - top_tier: tier_score 상위 10개 챔피언
+    - side_preference: 진영 선호도별 챔피언 수 (GROUP BY side_preference, 모든 선택지 포함)
+    - first_pick: tier_score 상위 8개 챔피언의 블루/레드 1픽 수
+    """
+    top = list(
+        ChampionStat.objects.order_by('-tier_score', '-id')
+        .values('champion__name', 'tier_score', 'blue_first_pick', 'red_first_pick')[:TOP_TIER_LIMIT]
+    )
+    counts = dict(
+        ChampionStat.objects.order_by().values_list('side_preference').annotate(count=Count('pk'))
+    )
+    return {
+        'top_tier': [
+            {'name': row['champion__name'], 'tier_score': row['tier_score']} for row in top
+        ],
+        'side_preference': [
+            {'code': code, 'label': label, 'count': counts.get(code, 0)}
+            for code, label in ChampionStat.SIDE_PREFERENCE_CHOICES
+        ],
+        'first_pick': [
+            {'name': row['champion__name'], 'blue_first_pick': row['blue_first_pick'], 'red_first_pick': row['red_first_pick']}
+            for row in top[:FIRST_PICK_LIMIT]
+        ],
+        'total_count': sum(counts.values()),
+    }
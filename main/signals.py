@@ -0,0 +1,88 @@
+"""
+원본 행이 바뀌면 경기 데이터 스냅샷(MatchDataSnapshot)을 다시 만들고 API 캐시 버전을 올리는 시그널.
+스냅샷은 트랜잭션이 커밋된 뒤에 만들어지므로 롤백된 변경은 반영되지 않습니다.
+bulk_create/bulk_update/QuerySet.update()는 시그널을 보내지 않으므로,
+일괄 로드 후에는 rebuild_match_snapshots / bump_version을 직접 호출해야 합니다.
+"""
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from main.api_cache import CHAMPIONS, SERIES_STATS, STORIES, bump_version
+from main.models import (
+    Champion, ChampionStat, Match, MatchStory, PBContext, PickBan, Player, SeriesStat, Team,
+)
+from main.serializers import rebuild_match_snapshots
+
+
+def schedule_rebuild(match_ids):
+    """커밋 후 해당 경기들의 스냅샷을 다시 생성"""
+    match_ids = [match_id for match_id in match_ids if match_id is not None]
+    if match_ids:
+        transaction.on_commit(lambda: rebuild_match_snapshots(match_ids))
+
+
+@receiver([post_save, post_delete], sender=Match)
+def rebuild_for_match(sender, instance, raw=False, **kwargs):
+    if not raw:
+        schedule_rebuild([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=PickBan)
+def rebuild_for_pick_ban(sender, instance, raw=False, **kwargs):
+    if not raw:
+        schedule_rebuild([instance.match_id])
+
+
+@receiver([post_save, post_delete], sender=PBContext)
+def rebuild_for_pb_context(sender, instance, raw=False, **kwargs):
+    if not raw:
+        match_id = PickBan.objects.filter(pk=instance.pick_ban_id).values_list('match_id', flat=True).first()
+        schedule_rebuild([match_id])
+
+
+@receiver(post_save, sender=Team)
+def rebuild_for_team(sender, instance, created=False, raw=False, **kwargs):
+    # 새 팀은 아직 어느 경기에도 쓰이지 않음
+    if raw or created:
+        return
+    schedule_rebuild(Match.objects.filter(
+        Q(team_a=instance) | Q(team_b=instance) | Q(winner=instance) | Q(pickban__team=instance)
+    ).values_list('pk', flat=True).distinct())
+
+
+@receiver(post_save, sender=Champion)
+def rebuild_for_champion(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    # 챔피언 통계 API는 챔피언 이름을 포함
+    bump_version(CHAMPIONS)
+    if created:
+        return
+    schedule_rebuild(PickBan.objects.filter(champion=instance).values_list('match_id', flat=True).distinct())
+
+
+@receiver(post_save, sender=Player)
+def rebuild_for_player(sender, instance, created=False, raw=False, **kwargs):
+    if raw or created:
+        return
+    schedule_rebuild(PickBan.objects.filter(player=instance).values_list('match_id', flat=True).distinct())
+
+
+@receiver([post_save, post_delete], sender=ChampionStat)
+def bump_champions(sender, raw=False, **kwargs):
+    if not raw:
+        bump_version(CHAMPIONS)
+
+
+@receiver([post_save, post_delete], sender=MatchStory)
+def bump_stories(sender, raw=False, **kwargs):
+    if not raw:
+        bump_version(STORIES)
+
+
+@receiver([post_save, post_delete], sender=SeriesStat)
+def bump_series_stats(sender, raw=False, **kwargs):
+    if not raw:
+        bump_version(SERIES_STATS)
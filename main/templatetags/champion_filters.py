@@ -91,6 +91,85 @@ ENGLISH_FILENAME_MAP = {
     'jarvan': 'jarvaniv',
 }
 
+# 파일명 → 영문 표시 이름 (MatchStory.key_champions 저장 형식, 예: 'jarvaniv' → 'Jarvan IV')
+ENGLISH_DISPLAY_NAME = {
+    'ryze': 'Ryze',
+    'yone': 'Yone',
+    'ambessa': 'Ambessa',
+    'galio': 'Galio',
+    'kaisa': 'Kaisa',
+    'rumble': 'Rumble',
+    'ksante': 'KSante',
+    'aurora': 'Aurora',
+    'renekton': 'Renekton',
+    'wukong': 'Wukong',
+    'sion': 'Sion',
+    'jarvaniv': 'Jarvan IV',
+    'orianna': 'Orianna',
+    'nautilus': 'Nautilus',
+    'aatrox': 'Aatrox',
+    'corki': 'Corki',
+    'vi': 'Vi',
+    'ornn': 'Ornn',
+    'taliyah': 'Taliyah',
+    'ezreal': 'Ezreal',
+    'xinzhao': 'XinZhao',
+    'varus': 'Varus',
+    'rakan': 'Rakan',
+    'neeko': 'Neeko',
+    'poppy': 'Poppy',
+    'sivir': 'Sivir',
+    'skarner': 'Skarner',
+    'azir': 'Azir',
+    'ashe': 'Ashe',
+    'pantheon': 'Pantheon',
+    'alistar': 'Alistar',
+    'anivia': 'Anivia',
+    'bard': 'Bard',
+    'blitzcrank': 'Blitzcrank',
+    'caitlyn': 'Caitlyn',
+    'camille': 'Camille',
+    'cassiopeia': 'Cassiopeia',
+    'draven': 'Draven',
+    'drmundo': 'DrMundo',
+    'gwen': 'Gwen',
+    'hwei': 'Hwei',
+    'ivern': 'Ivern',
+    'jinx': 'Jinx',
+    'kalista': 'Kalista',
+    'karma': 'Karma',
+    'mel': 'Mel',
+    'mordekaiser': 'Mordekaiser',
+    'nidalee': 'Nidalee',
+    'nocturne': 'Nocturne',
+    'qiyana': 'Qiyana',
+    'renata': 'Renata',
+    'reksai': 'RekSai',
+    'sejuani': 'Sejuani',
+    'smolder': 'Smolder',
+    'syndra': 'Syndra',
+    'thresh': 'Thresh',
+    'trundle': 'Trundle',
+    'viego': 'Viego',
+    'viktor': 'Viktor',
+    'ziggs': 'Ziggs',
+    'zoe': 'Zoe',
+    'akali': 'Akali',
+}
+
+# 경기 서사에서 쓰이는 추가 한글 표기 → 파일명
+KOREAN_ALIASES = {
+    '자르반': 'jarvaniv',
+    '신 짜오': 'xinzhao',
+    '문도 박사': 'drmundo',
+}
+
+# 챔피언 이름으로 시작하지만 챔피언이 아닌 단어 (선수 닉네임, 일반 명사 등)
+CHAMPION_NAME_STOPWORDS = [
+    '바이퍼',  # 선수 'Viper' (바이)
+    '오른쪽', '오른손', '오른편',  # 오른 (Ornn)
+]
+
 @register.filter
 def champion_filename(champion_name):
     """
@@ -1,3 +1,848 @@
-from django.test import TestCase
+import csv
+import datetime
+import gzip
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import warnings
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import CacheKeyWarning
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .draft_validation import DUPLICATE_CHAMPION, PLAYER_ON_BAN, find_draft_violations
+from .models import (
+    CHAMPION_STAT_FIELDS, Champion, ChampionStat, Match, MatchStory, PBContext, PickBan, Player, SeriesStat, Team,
+    champion_stat_fingerprint,
+)
+from .api_cache import CODE_VERSION, get_version, match_group
+from .docx_text import extract_paragraphs
+from .matchers import ChampionMatcher
+from .management.commands.export_static import brotli
+from .serializers import match_data_payload, rebuild_match_snapshots
+from .templatetags.champion_filters import ENGLISH_DISPLAY_NAME, KOREAN_TO_ENGLISH_FILENAME, champion_filename
+
+
+# 테스트는 개발 서버가 쓰는 BASE_DIR/.cache/api 파일 캐시를 지우거나 공유하지 않도록 로컬 메모리 캐시 사용
+TEST_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'tests'}}
+# 설정된(운영) 캐시 설정 - 프로세스 간 공유 테스트에서 위치만 임시 폴더로 바꿔 사용
+CONFIGURED_CACHE = settings.CACHES['default']
+
+# 다른 프로세스에서 그룹 버전을 올리는 스크립트 (argv: 캐시 폴더, 그룹)
+BUMP_VERSION_SCRIPT = '''
+import os, sys
+import django
+from django.test.utils import override_settings
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'myoneproject.settings')
+django.setup()
+from django.conf import settings
+with override_settings(CACHES={'default': {**settings.CACHES['default'], 'LOCATION': sys.argv[1]}}):
+    from main.api_cache import bump_version
+    bump_version(sys.argv[2])
+'''
+
+CHAMPION_CSV_HEADER = [
+    '챔피언', '총 픽 횟수 (Total)', '블루 1픽 (Blue 1st)', '레드 1픽 (Red 1st)',
+    'Tier Score (가치 점수)', 'Side Index (진영 선호도)',
+]
+
+
+def write_champion_csv(path, rows):
+    """prechampions.csv 형식의 CSV 작성 (rows: 헤더를 뺀 행 목록)"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CHAMPION_CSV_HEADER)
+        writer.writerows(rows)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class MatchDataApiTests(TestCase):
+    """match_data_api 응답 형식, 쿼리 수, 스냅샷 갱신 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        blue = Team.objects.create(name='GEN')
+        red = Team.objects.create(name='HLE')
+        player = Player.objects.create(name='Chovy', team=blue)
+        cls.match = Match.objects.create(
+            match_date=datetime.date(2025, 10, 28), stage='QF',
+            team_a=blue, team_b=red, winner=blue,
+        )
+        champions = Champion.objects.bulk_create([Champion(name=f'챔피언{i}') for i in range(1, 21)])
+        pick_bans = PickBan.objects.bulk_create([
+            PickBan(
+                match=cls.match, order=order, champion=champion,
+                team=blue if order % 2 else red,
+                pb_type='BAN' if order <= 10 else 'PICK',
+                player=player if order == 11 else None,
+            )
+            for order, champion in enumerate(champions, start=1)
+        ])
+        # 절반만 맥락을 작성 (나머지는 맥락 없음)
+        PBContext.objects.bulk_create([
+            PBContext(pick_ban=pick_ban, story_label='META_BAN', story_keyword=f'키워드{pick_ban.order}')
+            for pick_ban in pick_bans[:10]
+        ])
+
+    def setUp(self):
+        cache.clear()
+
+    def test_payload_uses_two_queries(self):
+        with self.assertNumQueries(2):
+            data = match_data_payload(self.match.pk)
+
+        self.assertEqual(data['match_info'], {
+            'id': self.match.pk, 'stage': '8강', 'date': '2025-10-28',
+            'team_a': 'GEN', 'team_b': 'HLE', 'winner': 'GEN',
+        })
+        self.assertEqual([pb['order'] for pb in data['pick_bans']], list(range(1, 21)))
+
+    def test_api_serves_snapshot_with_one_query(self):
+        rebuild_match_snapshots([self.match.pk])
+        url = reverse('match_data_api', args=[self.match.pk])
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json(), match_data_payload(self.match.pk))
+
+        # 두 번째 요청은 응답 캐시에서 처리
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+    def test_snapshot_rebuilt_after_context_change(self):
+        self.client.get(reverse('match_data_api', args=[self.match.pk]))  # 스냅샷 생성
+        context = PBContext.objects.get(pick_ban__match=self.match, pick_ban__order=1)
+        context.story_keyword = '수정된 키워드'
+        with self.captureOnCommitCallbacks(execute=True):
+            context.save()
+
+        data = self.client.get(reverse('match_data_api', args=[self.match.pk])).json()
+        self.assertEqual(data['pick_bans'][0]['story_context']['keyword'], '수정된 키워드')
+
+    def test_story_context_with_and_without_pbcontext(self):
+        data = self.client.get(reverse('match_data_api', args=[self.match.pk])).json()
+        with_context, without_context = data['pick_bans'][0], data['pick_bans'][10]
+
+        self.assertEqual(with_context['story_context'], {
+            'label': '메타 벤', 'keyword': '키워드1', 'comment': None, 'intensity': 0,
+        })
+        self.assertEqual(without_context['player'], 'Chovy')
+        self.assertEqual(without_context['story_context'], {
+            'label': '분류 없음', 'keyword': '', 'comment': '', 'intensity': 0,
+        })
+
+    def test_missing_match_returns_404_without_version_key(self):
+        for _ in range(2):
+            response = self.client.get(reverse('match_data_api', args=[self.match.pk + 1]))
+            self.assertEqual(response.status_code, 404)
+            self.assertFalse(response.has_header('ETag'))
+        # 없는 id 요청은 만료되지 않는 버전 키를 만들지 않음
+        self.assertIsNone(get_version(match_group(self.match.pk + 1), create=False))
+
+    def test_deleted_match_returns_404_instead_of_cached_body(self):
+        url = reverse('match_data_api', args=[self.match.pk])
+        self.client.get(url)  # 첫 응답이 경기 버전을 만듦
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, headers={'if-none-match': etag}).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Match.objects.get(pk=self.match.pk).delete()
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self.client.get(url, headers={'if-none-match': etag}).status_code, 404)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class IndexViewTests(TestCase):
+    """index 뷰의 쿼리 수와 Match.match_number(시리즈 단위 번호) 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teams = Team.objects.bulk_create([Team(name=name) for name in ['GEN', 'HLE', 'T1', 'KT', 'G2']])
+
+    def create_match(self, team_a, team_b, set_number=1, day=1, stage='QF'):
+        return Match.objects.create(
+            match_date=datetime.date(2025, 10, day), stage=stage, set_number=set_number,
+            team_a=team_a, team_b=team_b, winner=team_a,
+        )
+
+    def test_match_number_is_per_series(self):
+        gen, hle, t1, kt, _ = self.teams
+        with self.assertNumQueries(2):  # 번호 집계 1번 + INSERT
+            first = self.create_match(gen, hle)
+        second_set = self.create_match(hle, gen, set_number=2)  # 진영이 바뀌어도 같은 시리즈
+        other = self.create_match(t1, kt, day=2)
+        semifinal = self.create_match(gen, t1, day=3, stage='SF')
+
+        self.assertEqual([first.match_number, second_set.match_number], [1, 1])
+        self.assertEqual(other.match_number, 2)
+        self.assertEqual(semifinal.match_number, 1)
+        with self.assertNumQueries(1):  # 번호를 지정하면 집계 없이 INSERT만
+            Match.objects.create(
+                match_date=datetime.date(2025, 10, 4), stage='QF', match_number=3,
+                team_a=kt, team_b=hle, winner=kt,
+            )
+
+    def test_index_uses_one_query(self):
+        gen, hle, t1, kt, g2 = self.teams
+        for day, (team_a, team_b) in enumerate([(gen, hle), (t1, kt), (g2, gen), (hle, t1), (kt, g2), (gen, t1)], 1):
+            for set_number in (1, 2):
+                self.create_match(team_a, team_b, set_number=set_number, day=day)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('index'))
+
+        recent = response.context['recent_matches']
+        self.assertEqual(len(recent), 5)  # 세트가 아니라 시리즈 단위
+        self.assertEqual([m['story_match_number'] for m in recent], [6, 5, 4, 3, 2])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ApiCacheTests(TestCase):
+    """API 응답 캐시와 시그널 기반 무효화 검증"""
+
+    def setUp(self):
+        cache.clear()
+        self.stat = ChampionStat.objects.create(
+            champion=Champion.objects.create(name='아지르'),
+            total_picks=10, blue_first_pick=3, red_first_pick=2,
+            tier_score=7.5, side_index=0.2, side_preference='BALANCED',
+        )
+
+    def test_cached_until_stat_changes(self):
+        url = reverse('champion_stats_api')
+        self.assertEqual(self.client.get(url).json()['champions'][0]['total_picks'], 10)
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        self.stat.total_picks = 11
+        with self.captureOnCommitCallbacks(execute=True):
+            self.stat.save()
+
+        self.assertEqual(self.client.get(url).json()['champions'][0]['total_picks'], 11)
+
+    def test_conditional_get_returns_304_until_stat_changes(self):
+        url = reverse('champion_stats_api')
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, headers={'if-none-match': etag})
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.stat.save()
+        response = self.client.get(url, headers={'if-none-match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_version_bumped_by_another_process_is_seen(self):
+        # 관리 명령이 별도 프로세스에서 올린 버전을 서버가 볼 수 있어야 함 (설정된 캐시 백엔드를 임시 폴더로)
+        with tempfile.TemporaryDirectory() as location, \
+                override_settings(CACHES={'default': {**CONFIGURED_CACHE, 'LOCATION': location}}):
+            before = get_version('process-test')
+            subprocess.run(
+                [sys.executable, '-c', BUMP_VERSION_SCRIPT, location, 'process-test'],
+                cwd=settings.BASE_DIR, check=True,
+            )
+            self.assertGreater(get_version('process-test'), before)
+
+    def test_loader_command_invalidates_cached_body(self):
+        url = reverse('champion_stats_api')
+        self.assertEqual(self.client.get(url).json()['champions'][0]['total_picks'], 10)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'stats.csv')
+            write_champion_csv(path, [['아지르', 12, 3, 2, 7.5, '0.20 (균형)']])
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command('load_champion_stats', path=[path], bulk=True, stdout=StringIO())
+
+        self.assertEqual(self.client.get(url).json()['champions'][0]['total_picks'], 12)
+
+    def test_noop_incremental_load_keeps_etag(self):
+        url = reverse('champion_stats_api')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'stats.csv')
+            write_champion_csv(path, [['아지르', 10, 3, 2, 7.5, '0.20 (균형)']])
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command('load_champion_stats', path=[path], incremental=True, stdout=StringIO())
+            etag = self.client.get(url)['ETag']
+
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command('load_champion_stats', path=[path], incremental=True, stdout=StringIO())
+        self.assertEqual(self.client.get(url)['ETag'], etag)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ChampionStatsApiTests(TestCase):
+    """champion_stats_api 필드 선택/키셋 페이지네이션과 요약 집계 API 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for i, tier_score in enumerate([9.0, 8.0, 8.0, 7.0, 6.5]):
+            ChampionStat.objects.create(
+                champion=Champion.objects.create(name=f'챔피언{i}'),
+                total_picks=i, blue_first_pick=i, red_first_pick=i,
+                tier_score=tier_score, side_index=0.0, side_preference='BLUE_PREF',
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_fields_projection(self):
+        data = self.client.get(reverse('champion_stats_api'), {'fields': 'name,side_preference'}).json()
+        self.assertEqual(data['champions'][0], {'name': '챔피언0', 'side_preference': '블루 선호'})
+        self.assertEqual(data['total_count'], 5)
+        self.assertNotIn('next_cursor', data)
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get(reverse('champion_stats_api'), {'fields': 'name,password'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_summary_aggregates(self):
+        url = reverse('champion_stats_summary_api')
+        with self.assertNumQueries(2):
+            data = self.client.get(url).json()
+
+        self.assertEqual([c['name'] for c in data['top_tier']], ['챔피언0', '챔피언2', '챔피언1', '챔피언3', '챔피언4'])
+        self.assertEqual(len(data['first_pick']), 5)
+        counts = {s['code']: s['count'] for s in data['side_preference']}
+        self.assertEqual(counts['BLUE_PREF'], 5)
+        self.assertEqual(sum(counts.values()), data['total_count'])
+        self.assertEqual(len(counts), len(ChampionStat.SIDE_PREFERENCE_CHOICES))
+
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+    def test_keyset_pagination_visits_every_row_once(self):
+        url = reverse('champion_stats_api')
+        names, params = [], {'fields': 'name', 'limit': 2}
+        while True:
+            with self.assertNumQueries(1):
+                data = self.client.get(url, params).json()
+            names += [champion['name'] for champion in data['champions']]
+            if not data['next_cursor']:
+                break
+            params['after'] = data['next_cursor']
+        # 같은 tier_score(8.0)는 id 내림차순
+        self.assertEqual(names, ['챔피언0', '챔피언2', '챔피언1', '챔피언3', '챔피언4'])
+
+    def test_cursor_cache_keys_are_memcached_safe(self):
+        url = reverse('champion_stats_api')
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', CacheKeyWarning)
+            first = self.client.get(url, {'fields': 'name,tier_score', 'limit': 2}).json()
+            second = self.client.get(url, {'fields': 'name,tier_score', 'limit': 2, 'after': first['next_cursor']})
+        self.assertEqual(second.status_code, 200)
+
+        # 필드 순서만 다른 요청은 같은 캐시 항목을 쓰고, 본문 필드는 API 정의 순서
+        with self.assertNumQueries(0):
+            data = self.client.get(url, {'fields': 'tier_score,name', 'limit': 2}).json()
+        self.assertEqual(data, first)
+        self.assertEqual(list(data['champions'][0]), ['name', 'tier_score'])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class MatchStoriesApiTests(TestCase):
+    """match_stories_api 스트리밍/NDJSON/키셋 페이지네이션 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for stage, match_number, set_number in [('QF', 1, 1), ('QF', 1, 2), ('SF', 1, 1), ('F', 1, 1)]:
+            MatchStory.objects.create(
+                stage=stage, match_number=match_number, set_number=set_number,
+                team_a='GEN', team_b='HLE', winner='GEN',
+                banpick_analysis='분석', game_narrative='서사',
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_stream_matches_cached_response(self):
+        url = reverse('match_stories_api')
+        cached = self.client.get(url).content
+        streamed = b''.join(self.client.get(url, {'stream': '1'}).streaming_content)
+        self.assertEqual(streamed, cached)
+
+    def test_ndjson_keyset_pages(self):
+        url = reverse('match_stories_api')
+        keys, params = [], {'format': 'ndjson', 'limit': 3}
+        while True:
+            response = self.client.get(url, params)
+            lines = b''.join(response.streaming_content).decode().splitlines()
+            keys += [(story['stage'], story['set_number']) for story in map(json.loads, lines)]
+            if not response.has_header('X-Next-Cursor'):
+                break
+            params['after'] = response['X-Next-Cursor']
+        self.assertEqual(keys, [('F', 1), ('QF', 1), ('QF', 2), ('SF', 1)])
+
+    def test_deleted_story_is_not_answered_with_304(self):
+        url = reverse('match_stories_api')
+        response = self.client.get(url)
+        self.assertFalse(response.has_header('Last-Modified'))
+        self.assertTrue(response['ETag'].strip('"').startswith(CODE_VERSION))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            MatchStory.objects.get(stage='QF', set_number=2).delete()
+        response = self.client.get(url, headers={'if-none-match': response['ETag']})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['stories']), 3)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class LoadChampionStatsTests(TestCase):
+    """load_champion_stats 청크/증분/일괄 로드 검증"""
+
+    ROWS = [
+        ['라이즈', 6, 4, 1, 13.2, '0.67 (블루 선호)'],
+        ['요네', 5, 4, 1, 12.2, '0.60 (블루 선호)'],
+        ['알리스타', 1, 0, 1, 5, '-1.00 (레드 필수)'],
+    ]
+
+    def setUp(self):
+        cache.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def csv_path(self, name, rows=ROWS):
+        path = os.path.join(self.tmp.name, name)
+        write_champion_csv(path, rows)
+        return path
+
+    def load(self, *paths, **options):
+        """명령 실행 후 --summary-json 요약(증분 모드) 반환"""
+        summary_path = os.path.join(self.tmp.name, 'summary.json')
+        if options.get('incremental'):
+            options['summary_json'] = summary_path
+        call_command('load_champion_stats', path=list(paths), stdout=StringIO(), stderr=StringIO(), **options)
+        if options.get('incremental'):
+            with open(summary_path, encoding='utf-8') as f:
+                return json.load(f)
+
+    def test_fingerprint_does_not_depend_on_chunk_boundaries(self):
+        # 알리스타만 들어 있는 청크는 tier_score가 정수 5로 추론됨
+        self.load(self.csv_path('a.csv'), incremental=True, chunk_size=1)
+        summary = self.load(self.csv_path('b.csv'), incremental=True)
+        self.assertEqual(summary['changed'], [])
+        self.assertEqual(summary['unchanged'], 3)
+        self.assertEqual(ChampionStat.objects.get(champion__name='알리스타').tier_score, 5.0)
+
+    def test_unchanged_file_is_reloaded_after_another_file_took_its_rows(self):
+        a = self.csv_path('a.csv')
+        b = self.csv_path('b.csv')
+        self.load(a, incremental=True)
+        self.load(b, incremental=True)  # B가 모든 행의 출처가 됨
+        summary = self.load(self.csv_path('b.csv', self.ROWS[1:]), incremental=True)
+        self.assertEqual(summary['removed'], ['라이즈'])
+
+        summary = self.load(a, incremental=True)
+        self.assertEqual(summary['skipped_files'], [])
+        self.assertEqual(summary['added'], ['라이즈'])
+        self.assertTrue(ChampionStat.objects.filter(champion__name='라이즈').exists())
+
+    def test_unchanged_file_is_skipped(self):
+        a = self.csv_path('a.csv')
+        self.load(a, incremental=True)
+        summary = self.load(a, incremental=True)
+        self.assertEqual(summary['skipped_files'], [a])
+        self.assertEqual(summary['unchanged'], 3)
+
+
+    def test_glob_paths_gzip_and_rejects_file(self):
+        self.csv_path('a.csv', self.ROWS[:2] + [
+            ['', 1, 0, 1, 3.0, '0.10 (블루 선호)'],
+            ['갈리오', 'x', 0, 1, 3.0, '0.10 (블루 선호)'],
+            ['렐', 1, 0, 1, 3.0, '0.10 (알 수 없음)'],
+        ])
+        plain = self.csv_path('b.csv', self.ROWS[2:])
+        with open(plain, 'rb') as f, gzip.open(plain + '.gz', 'wb') as out:
+            out.write(f.read())
+        os.remove(plain)
+        rejects_path = os.path.join(self.tmp.name, 'rejects.out')
+
+        self.load(os.path.join(self.tmp.name, '*.csv*'), chunk_size=2, rejects=rejects_path)
+
+        self.assertEqual(
+            set(ChampionStat.objects.values_list('champion__name', flat=True)), {'라이즈', '요네', '알리스타'}
+        )
+        with open(rejects_path, encoding='utf-8', newline='') as f:
+            rejects = list(csv.DictReader(f))
+        # 청크가 나뉘어도 줄 번호는 파일 기준 (헤더가 1번째 줄)
+        self.assertEqual([(r['line'], r['champion']) for r in rejects], [('4', ''), ('5', '갈리오'), ('6', '렐')])
+        self.assertEqual(
+            [r['reason'] for r in rejects],
+            ['챔피언 이름 없음', '숫자 아님: 총 픽 횟수 (Total)', '형식 오류: Side Index (진영 선호도)'],
+        )
+
+    def test_bulk_mode_upserts_like_row_mode(self):
+        self.load(self.csv_path('a.csv', self.ROWS[:2]))
+        stdout = StringIO()
+        changed = [['라이즈', 7, 5, 2, 14.0, '0.40 (블루 선호)']] + self.ROWS[1:]
+        call_command('load_champion_stats', path=[self.csv_path('b.csv', changed)], bulk=True, batch_size=2,
+                     stdout=stdout, stderr=StringIO())
+
+        self.assertIn('새로 생성: 1개, 업데이트: 2개', stdout.getvalue())
+        self.assertIn('새 챔피언 생성: 알리스타', stdout.getvalue())
+        stat = ChampionStat.objects.get(champion__name='라이즈')
+        self.assertEqual((stat.total_picks, stat.tier_score, stat.side_preference), (7, 14.0, 'BLUE_PREF'))
+        # bulk upsert도 증분 모드가 비교하는 내용 지문을 함께 기록
+        for stat in ChampionStat.objects.all():
+            self.assertEqual(
+                stat.content_hash,
+                champion_stat_fingerprint({field: getattr(stat, field) for field in CHAMPION_STAT_FIELDS}),
+            )
+
+
+@override_settings(CACHES=TEST_CACHES)
+class LoadSeriesStatsTests(TestCase):
+    """load_series_stats 거부 행 처리 검증"""
+
+    def test_short_and_invalid_rows_are_rejected_not_fatal(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'series.csv')
+            rejects_path = os.path.join(tmp, 'rejects.csv')
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(
+                    'stage,match_number,series_score_a,series_score_b,kills_a,kills_b,towers_a,towers_b,'
+                    'dragons_a,dragons_b,barons_a,barons_b,gold_a,gold_b\n'
+                    'QF,1,3,1,80,65,30,26,11,10,4,3,296.2,287.4\n'
+                    'QF,2,3,0\n'  # 짧은 행: 나머지 칸은 None
+                    'SF,1,1,3,x,66,22,31,7,16,4,3,262.8,281.6\n'
+                )
+            stderr = StringIO()
+            call_command('load_series_stats', path=path, rejects=rejects_path, stdout=StringIO(), stderr=stderr)
+
+            with open(rejects_path, encoding='utf-8', newline='') as f:
+                rejects = list(csv.DictReader(f))
+
+        self.assertEqual(SeriesStat.objects.get(stage='QF', match_number=1).kills_a, 80)
+        self.assertEqual(
+            [(r['line'], r['stage'], r['match_number']) for r in rejects], [('3', 'QF', '2'), ('4', 'SF', '1')]
+        )
+        self.assertIn("'kills_a' 값이 올바르지 않음: None", rejects[0]['reason'])
+        self.assertIn('건너뛴 행: 2개', stderr.getvalue())
+
+def write_story_docx(path, paragraphs):
+    """문단 목록으로 스토리 문서(.docx) 작성"""
+    from docx import Document
+    document = Document()
+    for text in paragraphs:
+        document.add_paragraph(text)
+    document.save(path)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class LoadMatchStoriesTests(TestCase):
+    """load_match_stories 앵커/문서 구조 기반 스토리 추출과 저장 검증"""
+
+    EXTRA_DOCUMENT = [
+        '2. 4강: 추가 시즌 문서',
+        '2.4. 3경기: T1 vs Gen.G (최종 스코어 2:1)',
+        '2.4.1. 경기 총평',
+        '가상의 추가 경기입니다.',
+        '2.4.2. 세트별 분석',
+        '1세트 (GEN 승):',
+        '밴픽 전략 분석: 젠지는 아지르를 선픽했습니다.',
+        '경기 흐름 및 핵심 서사: 쵸비의 아지르가 경기를 지배했습니다.',
+        '2세트 (T1 승):',
+        '밴픽 전략 분석: T1은 오리아나를 가져왔습니다.',
+        '경기 흐름 및 핵심 서사: 페이커의 오리아나가 한타를 정리했습니다.',
+    ]
+
+    def setUp(self):
+        cache.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def load(self, *paths, **options):
+        """명령 실행 후 stderr(경고) 반환"""
+        stderr = StringIO()
+        call_command(
+            'load_match_stories', path=list(paths), jobs=1, no_cache=True,
+            stdout=StringIO(), stderr=stderr, **options
+        )
+        return stderr.getvalue()
+
+    def test_outline_matches_anchor_specs(self):
+        from main.management.commands.load_match_stories import Command
+        command = Command(stdout=StringIO(), stderr=StringIO())
+        index = command.index_documents(['worlds_story.docx'], jobs=1, cache_dir=None, extractor='xml')
+        anchor_stories = {
+            (story['stage'], story['match_number'], story['set_number']): story
+            for story in command.parse_stories(index)
+        }
+        outline_stories = [story for outline in command.outlines for story in command.create_outline_stories(outline)]
+
+        self.assertEqual(len(outline_stories), 23)  # 결승 요약을 뺀 8강/4강 전 세트
+        for story in outline_stories:
+            self.assertEqual(story, anchor_stories[(story['stage'], story['match_number'], story['set_number'])])
+
+    def test_extra_document_adds_matches_beyond_anchors(self):
+        extra = os.path.join(self.tmp.name, 'extra.docx')
+        write_story_docx(extra, self.EXTRA_DOCUMENT)
+        self.load('worlds_story.docx', extra, strict=True)
+
+        self.assertEqual(MatchStory.objects.filter(stage='QF').count(), 16)
+        added = MatchStory.objects.filter(stage='SF', match_number=3).order_by('set_number')
+        self.assertEqual([(s.winner, s.final_score) for s in added], [('Gen.G', '2:1'), ('T1', '2:1')])
+        self.assertEqual(added[0].match_overview, '가상의 추가 경기입니다.')
+        self.assertTrue(added[1].game_narrative.startswith('경기 흐름 및 핵심 서사: 페이커'))
+
+    def test_single_document_load_keeps_other_matches(self):
+        self.load('worlds_story.docx')
+        total = MatchStory.objects.count()
+        extra = os.path.join(self.tmp.name, 'extra.docx')
+        write_story_docx(extra, self.EXTRA_DOCUMENT)
+
+        warnings_output = self.load(extra)
+        self.assertEqual(MatchStory.objects.count(), total + 2)
+        # 이번 문서에 없는 경기마다 경고 (저장된 스토리는 유지)
+        self.assertIn('문서에서 찾지 못해 건너뜀: [QF] 1경기', warnings_output)
+        self.assertIn('문서에서 찾지 못해 건너뜀: [F] 1경기', warnings_output)
+
+        # 읽은 경기 안에서 사라진 세트만 삭제
+        write_story_docx(extra, self.EXTRA_DOCUMENT[:-3])
+        self.load(extra)
+        self.assertEqual(MatchStory.objects.filter(stage='SF', match_number=3).count(), 1)
+        self.assertEqual(MatchStory.objects.count(), total + 1)
+
+        # --prune은 읽지 않은 경기의 스토리도 삭제
+        self.load(extra, prune=True)
+        self.assertEqual(MatchStory.objects.count(), 1)
+
+    def test_every_matcher_champion_has_display_name(self):
+        matcher = ChampionMatcher.from_champion_tables()
+        for slug in {key for key in matcher.keys if key is not None}:
+            self.assertIn(slug, ENGLISH_DISPLAY_NAME)
+            # 저장된 표시 이름은 export/템플릿에서 같은 파일명으로 돌아와야 함
+            self.assertEqual(champion_filename(matcher.display_name(slug)), slug)
+
+        # 영문 표시 이름이 없는 챔피언은 한글 이름으로 저장 (KeyError로 로드가 중단되지 않음)
+        with mock.patch.dict(KOREAN_TO_ENGLISH_FILENAME, {'신챔피언': 'newchamp'}):
+            matcher = ChampionMatcher.from_champion_tables()
+            self.assertEqual(matcher.rank('신챔피언이 나왔습니다.'), ['newchamp'])
+            self.assertEqual(matcher.display_name('newchamp'), '신챔피언')
+
+    def test_document_without_anchors_is_not_an_anchor_problem(self):
+        extra = os.path.join(self.tmp.name, 'extra.docx')
+        write_story_docx(extra, self.EXTRA_DOCUMENT)
+        self.load(extra, strict=True)
+        self.assertEqual(MatchStory.objects.count(), 2)
+
+    def test_xml_extractor_matches_python_docx(self):
+        from docx import Document
+        path = os.path.join(self.tmp.name, 'runs.docx')
+        document = Document()
+        paragraph = document.add_paragraph('1세트 ')
+        paragraph.add_run('(T1 승)').bold = True
+        paragraph.add_run(':')
+        document.add_paragraph('   ')
+        document.add_paragraph('탭\t문단')
+        document.save(path)
+
+        for source in (path, 'worlds_story.docx'):
+            self.assertEqual(extract_paragraphs(source, 'xml'), extract_paragraphs(source, 'python-docx'))
+        self.assertEqual(extract_paragraphs(path), ['1세트 (T1 승):', '탭\t문단'])
+
+    def test_strict_stops_on_partially_found_anchors(self):
+        partial = os.path.join(self.tmp.name, 'partial.docx')
+        write_story_docx(partial, [
+            '8강 대진 추첨 결과 젠지와 한화생명이 만났습니다.',
+            "한화생명은 '딜라이트' 유환중의 서포터 판테온을 꺼냈습니다.",
+        ])
+        with self.assertRaises(CommandError):
+            self.load(partial, strict=True)
+        self.assertFalse(MatchStory.objects.exists())
+
+
+@override_settings(CACHES=TEST_CACHES)
+class LoadPickbansTests(TestCase):
+    """load_pickbans 워크북 가져오기와 벤픽 무결성 검사(find_draft_violations/validate_drafts) 검증"""
+
+    # 실제 벤픽 진행 순서 (워크북의 컬럼 순서가 order 1~20)
+    ACTION_COLUMNS = [
+        'BB1', 'RB1', 'BB2', 'RB2', 'BB3', 'RB3', 'BP1', 'RP1', 'RP2', 'BP2',
+        'BP3', 'RP3', 'RB4', 'BB4', 'RB5', 'BB5', 'RP4', 'BP4', 'BP5', 'RP5',
+    ]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'pickbans.xlsx')
+
+    def write_workbook(self, rows):
+        from openpyxl import Workbook
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.append(['단계', '매치', '세트', '승리', '날짜', *self.ACTION_COLUMNS, 'BP1 선수'])
+        for row in rows:
+            worksheet.append(row)
+        workbook.save(self.path)
+
+    def draft(self, offset=0):
+        names = [f'챔피언{i + offset}' for i in range(1, 21)]
+        names[0] = '트페'  # 줄임말은 챔피언 이름으로 변환
+        return names
+
+    def load(self):
+        stdout, stderr = StringIO(), StringIO()
+        call_command('load_pickbans', path=self.path, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_import_carries_series_cells_and_keeps_contexts(self):
+        self.write_workbook([
+            ['8강', 'GEN vs HLE', 1, 'GEN', '2025-10-28', *self.draft(), 'Chovy'],
+            [None, None, 2, 'HLE', None, *self.draft(20), 'Chovy'],
+            [None, None, 3, 'T1', None, *self.draft(40), None],  # 승리 팀이 매치 팀이 아님
+        ])
+        stdout, stderr = self.load()
+
+        self.assertIn('경기 생성: 2개', stdout)
+        self.assertIn('4행 건너뜀', stderr)
+        matches = list(Match.objects.order_by('set_number'))
+        self.assertEqual([(m.set_number, m.match_number, m.match_date) for m in matches],
+                         [(1, 1, datetime.date(2025, 10, 28)), (2, 1, datetime.date(2025, 10, 28))])
+        self.assertEqual([m.winner.name for m in matches], ['GEN', 'HLE'])
+        first = PickBan.objects.select_related('champion', 'team').get(match=matches[0], order=1)
+        self.assertEqual((first.champion.name, first.team.name, first.pb_type), ('트위스티드 페이트', 'GEN', 'BAN'))
+        self.assertEqual(PickBan.objects.get(match=matches[0], order=7).player.name, 'Chovy')
+        self.assertEqual(PBContext.objects.count(), 40)
+        self.assertEqual(find_draft_violations()['violation_count'], 0)
+
+        # 다시 로드해도 작성해 둔 맥락은 유지되고, 바뀐 칸만 갱신
+        PBContext.objects.filter(pick_ban=first).update(story_keyword='메타 벤')
+        self.write_workbook([
+            ['8강', 'GEN vs HLE', 1, 'GEN', '2025-10-28', *self.draft()[:19], '새챔피언', 'Chovy'],
+            [None, None, 2, 'HLE', None, *self.draft(20), 'Chovy'],
+        ])
+        stdout, _ = self.load()
+        self.assertIn('벤픽 업데이트: 1개, 변경 없음: 39개', stdout)
+        self.assertEqual(PBContext.objects.get(pick_ban=first).story_keyword, '메타 벤')
+
+    def test_duplicate_set_rows_use_last_row(self):
+        self.write_workbook([
+            ['8강', 'GEN vs HLE', 1, 'GEN', '2025-10-28', *self.draft(), 'Chovy'],
+            [None, None, 1, 'HLE', None, *self.draft(20), 'Chovy'],  # 같은 세트가 한 번 더
+        ])
+        stdout, stderr = self.load()
+
+        self.assertIn('2행 무시: 3행과 같은 경기(세트)', stderr)
+        match = Match.objects.get()
+        self.assertEqual(match.winner.name, 'HLE')
+        self.assertEqual(PickBan.objects.get(match=match, order=2).champion.name, '챔피언22')
+        self.assertEqual(PickBan.objects.filter(match=match).count(), 20)
+
+    def test_draft_violations_are_reported(self):
+        self.write_workbook([['8강', 'GEN vs HLE', 1, 'GEN', '2025-10-28', *self.draft(), 'Chovy']])
+        self.load()
+        match = Match.objects.get()
+        PickBan.objects.filter(match=match, order=2).update(
+            champion=PickBan.objects.get(match=match, order=1).champion,
+            player=Player.objects.get(name='Chovy'),
+        )
+
+        report = find_draft_violations([match.pk])
+        self.assertEqual(sorted(v['check'] for v in report['violations']), [DUPLICATE_CHAMPION, PLAYER_ON_BAN])
+        self.assertEqual(report['checked_actions'], 20)
+        with self.assertRaises(CommandError):
+            call_command('validate_drafts', strict=True, stdout=StringIO())
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ExportStaticTests(TestCase):
+    """export_static 증분 생성/병렬 렌더링/게시/압축 사본/해시 스타일시트 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for set_number, winner in ((1, 'Gen.G'), (2, 'T1')):
+            MatchStory.objects.create(
+                stage='QF', match_number=1, set_number=set_number, team_a='Gen.G', team_b='T1',
+                winner=winner, final_score='1:1', banpick_analysis=f'{set_number}세트 밴픽',
+                game_narrative=f'{set_number}세트 서사', key_champions='아지르, 오리아나',
+            )
+        ChampionStat.objects.create(
+            champion=Champion.objects.create(name='아지르'), total_picks=3, blue_first_pick=1,
+            red_first_pick=0, tier_score=9.0, side_index=0.5, side_preference='BLUE_PREF',
+        )
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def export(self, output='docs', **options):
+        stdout = StringIO()
+        call_command('export_static', output=os.path.join(self.tmp.name, output),
+                     stdout=stdout, stderr=StringIO(), **options)
+        return stdout.getvalue()
+
+    def read(self, *parts, mode='r'):
+        with open(os.path.join(self.tmp.name, *parts), mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as f:
+            return f.read()
+
+    def test_export_publishes_pages_with_hashed_css_and_compressed_copies(self):
+        self.assertIn('재생성 3개, 건너뜀 0개', self.export())
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['docs'])  # 스테이징/이전/잠금 폴더가 남지 않음
+
+        css_dir = os.path.join(self.tmp.name, 'docs', 'static', 'css')
+        stylesheet = next(name for name in os.listdir(css_dir) if name.endswith('.css'))
+        self.assertRegex(stylesheet, r'^site\.[0-9a-f]{12}\.css$')
+        page = self.read('docs', 'stories', 'QF', '1', 'index.html')
+        self.assertIn(f'../../../static/css/{stylesheet}', page)
+        self.assertIn('2세트 서사', page)
+
+        for suffix, decompress in (('.gz', gzip.decompress), ('.br', brotli and brotli.decompress)):
+            if decompress is None:
+                continue
+            copy = self.read('docs', 'stories', 'QF', '1', 'index.html' + suffix, mode='rb')
+            self.assertEqual(decompress(copy).decode('utf-8'), page)
+
+    def test_unchanged_pages_are_skipped_and_changed_pages_rebuilt(self):
+        self.export()
+        page_path = os.path.join(self.tmp.name, 'docs', 'champions', 'index.html')
+        mtime = os.stat(page_path).st_mtime_ns
+
+        self.assertIn('재생성 0개, 건너뜀 3개, 삭제 0개', self.export())
+        self.assertEqual(os.stat(page_path).st_mtime_ns, mtime)
+
+        MatchStory.objects.filter(set_number=2).update(game_narrative='바뀐 서사')
+        MatchStory.objects.create(
+            stage='SF', match_number=1, set_number=1, team_a='T1', team_b='KT', winner='T1',
+            banpick_analysis='밴픽', game_narrative='서사',
+        )
+        self.assertIn('재생성 2개, 건너뜀 2개, 삭제 0개', self.export())
+        self.assertIn('바뀐 서사', self.read('docs', 'stories', 'QF', '1', 'index.html'))
+        self.assertEqual(os.stat(page_path).st_mtime_ns, mtime)
+
+        MatchStory.objects.filter(stage='SF').delete()
+        self.assertIn('삭제 1개', self.export())
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, 'docs', 'stories', 'SF')))
+
+    def test_parallel_render_matches_sequential(self):
+        self.export('sequential', jobs=1)
+        self.export('parallel', jobs=2)
+        for directory, _, filenames in os.walk(os.path.join(self.tmp.name, 'sequential')):
+            rel_dir = os.path.relpath(directory, os.path.join(self.tmp.name, 'sequential'))
+            for filename in filenames:
+                self.assertEqual(
+                    self.read('parallel', rel_dir, filename, mode='rb'),
+                    self.read('sequential', rel_dir, filename, mode='rb'),
+                    os.path.join(rel_dir, filename),
+                )
+
+    def test_running_export_holds_lock(self):
+        self.export()
+        before = self.read('docs', 'champions', 'index.html')
+        os.mkdir(os.path.join(self.tmp.name, '.docs-export.lock'))
+        ChampionStat.objects.update(tier_score=1.0)
+        with self.assertRaises(CommandError):
+            self.export()
+        self.assertEqual(self.read('docs', 'champions', 'index.html'), before)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, '.docs-staging')))
@@ -14,6 +14,7 @@ urlpatterns = [
     # 4. 챔피언 통계 페이지 및 API
     path('champions/', views.champion_stats, name='champion_stats'),
     path('api/champions/', views.champion_stats_api, name='champion_stats_api'),
+    path('api/champions/summary/', views.champion_stats_summary_api, name='champion_stats_summary_api'),
     
     # 5. 경기 스토리 페이지 및 API
     path('stories/', views.match_stories, name='match_stories'),
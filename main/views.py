@@ -1,41 +1,83 @@
+import hashlib
 import json
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import HttpResponse, JsonResponse, Http404
+from django.http import HttpResponse, JsonResponse, Http404, StreamingHttpResponse
 from django.views import View
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 # 새로 추가된 모델을 import 합니다.
-from .models import Match, PickBan, PBContext, ChampionStat, Champion, MatchStory 
+from .models import Match, ChampionStat, Champion, MatchStory, MatchDataSnapshot, SeriesStat
+from .api_cache import CHAMPIONS, SERIES_STATS, STORIES, cached_body, group_etag, json_body, match_group
+from .serializers import (
+    CHAMPION_STAT_API_FIELDS, MAX_CHAMPION_STATS_LIMIT, MAX_STORIES_LIMIT, STORY_ORDERING, champion_stats_page, champion_stats_summary,
+    decode_champion_stats_cursor, decode_story_cursor, iter_story_json, iter_story_ndjson,
+    parse_champion_stats_fields, rebuild_match_snapshots, story_page,
+)
+
+
+# --- 조건부 GET 검증자 (ETag) ---
+# 본문을 만들기 전에 계산되어 If-None-Match가 맞으면 304로 응답합니다.
+# ETag는 코드 버전과 데이터 그룹 버전(api_cache)이라 DB를 조회하지 않고, 데이터가 바뀌면 시그널/로더가 버전을 올립니다.
+# Last-Modified(updated_at 최댓값)는 행이 삭제되어도 바뀌지 않아 오래된 304를 낼 수 있으므로 쓰지 않습니다.
+# Cache-Control: no-cache로 브라우저/CDN이 보관한 응답을 쓰기 전에 항상 재검증하게 합니다.
+
+def champions_etag(request, *args, **kwargs):
+    return group_etag(CHAMPIONS)
+
+
+def stories_etag(request, *args, **kwargs):
+    return group_etag(STORIES)
+
+
+def story_detail_etag(request, *args, **kwargs):
+    return group_etag(STORIES, SERIES_STATS)
+
+
+def match_etag(request, match_id, *args, **kwargs):
+    # URL의 id로 버전 키를 만들지 않음 (없는 경기 요청이 캐시를 채우지 않게, 버전은 cached_body가 만듦)
+    return group_etag(match_group(match_id), create=False)
+
+
+def stories_condition(view):
+    return cache_control(no_cache=True)(
+        condition(etag_func=stories_etag)(view)
+    )
+
+
+def story_detail_condition(view):
+    return cache_control(no_cache=True)(
+        condition(etag_func=story_detail_etag)(view)
+    )
+
+
+def champions_condition(view):
+    return cache_control(no_cache=True)(condition(etag_func=champions_etag)(view))
+
+
+def match_condition(view):
+    return cache_control(no_cache=True)(condition(etag_func=match_etag)(view))
 
 
 # 1. 인덱스 페이지 뷰 (메인 화면)
 def index(request):
-    # 최근 5개의 경기를 가져와 메인 페이지에 표시할 수 있습니다.
-    recent_matches = Match.objects.all().order_by('-match_date')[:5]
-    
-    # Match와 MatchStory 매핑 (stage별 match_number 계산)
-    stage_match_count = {}
-    all_matches = Match.objects.all().order_by('match_date')
-    match_story_map = {}
-    
-    for match in all_matches:
-        stage = match.stage
-        if stage not in stage_match_count:
-            stage_match_count[stage] = 0
-        stage_match_count[stage] += 1
-        match_story_map[match.id] = {
-            'stage': stage,
-            'match_number': stage_match_count[stage]
-        }
+    # 최근 5개 시리즈(각 시리즈의 1세트)를 가져와 메인 페이지에 표시합니다.
+    # 스토리 번호(stage별 match_number)는 Match에 저장되어 있으므로 전체 경기를 순회하지 않고,
+    # 팀 정보는 select_related로 같은 쿼리에서 함께 가져옵니다.
+    recent_matches = (
+        Match.objects.filter(set_number=1)
+        .select_related('team_a', 'team_b', 'winner')
+        .order_by('-match_date')[:5]
+    )
     
     # recent_matches에 story 정보 및 팀 로고 추가
     matches_with_story = []
     for match in recent_matches:
-        story_info = match_story_map.get(match.id, {})
         matches_with_story.append({
             'match': match,
-            'story_stage': story_info.get('stage', ''),
-            'story_match_number': story_info.get('match_number', 0),
-            'team_a_logo': get_team_logo(match.team_a.name if match.team_a else ''),
-            'team_b_logo': get_team_logo(match.team_b.name if match.team_b else ''),
+            'story_stage': match.stage,
+            'story_match_number': match.match_number or 0,
+            'team_a_logo': get_team_logo(match.team_a.name),
+            'team_b_logo': get_team_logo(match.team_b.name),
         })
     
     context = {
@@ -64,60 +106,29 @@ def match_visualization(request, match_id):
 
 
 # 3. 데이터 시각화 API 뷰 (JSON 응답) - 프로젝트의 핵심 데이터 제공
+@match_condition
 def match_data_api(request, match_id):
     """
     특정 경기의 벤픽 데이터와 PBContext(스토리텔링) 메타데이터를 JSON 형태로 제공합니다.
+    미리 직렬화된 스냅샷(MatchDataSnapshot)을 기본 키 조회 한 번으로 읽어 그대로 응답하며,
+    스냅샷이 아직 없으면 만들어 저장한 뒤 응답합니다. 응답 본문은 경기별 버전 캐시에 보관됩니다.
     """
-    try:
-        match = Match.objects.get(pk=match_id)
-        
-        # 벤/픽 데이터 조회: 
-        # PickBan을 가져오면서 ForeignKey 및 OneToOneField 관계인 모델들을 미리 조인(prefetch_related/select_related)하여
-        # 데이터베이스 쿼리 횟수를 최적화합니다.
-        pickbans_queryset = PickBan.objects.filter(match=match).select_related(
-            'champion', 
-            'team', 
-            'player', 
-            'pbcontext' # PBContext(스토리)를 함께 가져옴
-        ).order_by('order')
-        
-        # JSON 데이터 구조 정의
-        data = {
-            'match_info': {
-                'id': match.id,
-                'stage': match.get_stage_display(),
-                'date': match.match_date.strftime('%Y-%m-%d'),
-                'team_a': match.team_a.name,
-                'team_b': match.team_b.name,
-                'winner': match.winner.name,
-            },
-            'pick_bans': []
-        }
-        
-        # 벤/픽 데이터를 순회하며 스토리텔링 정보를 결합
-        for pb in pickbans_queryset:
-            pb_data = {
-                'order': pb.order,
-                'type': pb.pb_type,
-                'team': pb.team.name,
-                'champion': pb.champion.name,
-                'player': pb.player.name if pb.player else None,
-                # 스토리텔링 메타데이터 (PBContext)
-                'story_context': {
-                    # get_story_label_display()는 models.py에서 정의한 Choices의 두 번째 값(읽기 쉬운 라벨)을 가져옵니다.
-                    'label': pb.pbcontext.get_story_label_display() if hasattr(pb, 'pbcontext') else '분류 없음',
-                    'keyword': pb.pbcontext.story_keyword if hasattr(pb, 'pbcontext') else '',
-                    'comment': pb.pbcontext.expert_comment if hasattr(pb, 'pbcontext') else '',
-                    'intensity': pb.pbcontext.emotional_intensity if hasattr(pb, 'pbcontext') else 0,
-                }
-            }
-            data['pick_bans'].append(pb_data)
-
-        return JsonResponse(data, safe=False)
-
-    except Match.DoesNotExist:
+    payload = cached_body(
+        match_group(match_id), 'data', lambda: match_data_snapshot(match_id), create_version=False
+    )
+    if payload is None:
         # 경기가 없을 경우 404 상태 코드와 에러 메시지를 반환
         return JsonResponse({'error': '해당 경기를 찾을 수 없습니다.'}, status=404)
+    return HttpResponse(payload, content_type='application/json')
+
+
+def match_data_snapshot(match_id):
+    """경기 스냅샷 JSON (없으면 만들어 저장, 경기가 없으면 None)"""
+    payload = MatchDataSnapshot.objects.filter(pk=match_id).values_list('payload', flat=True).first()
+    # 없는 경기는 다시 만들지 않음 (rebuild_match_snapshots가 요청마다 버전을 올리지 않게)
+    if payload is None and Match.objects.filter(pk=match_id).exists() and rebuild_match_snapshots([match_id]):
+        payload = MatchDataSnapshot.objects.values_list('payload', flat=True).get(pk=match_id)
+    return payload
 
 
 # --- 기존 함수 유지 ---
@@ -144,6 +155,7 @@ def api_example(request):
 
 # --- 챔피언 통계 관련 뷰 ---
 
+@champions_condition
 def champion_stats(request):
     """
     챔피언 통계 페이지 뷰.
@@ -180,31 +192,45 @@ def champion_stats(request):
     return render(request, 'main/champion_stats.html', context=context)
 
 
+@champions_condition
 def champion_stats_api(request):
     """
     챔피언 통계 API 엔드포인트.
-    JSON 형태로 모든 챔피언 통계 데이터를 반환합니다.
+    JSON 형태로 챔피언 통계 데이터를 tier_score 내림차순으로 반환합니다.
+
+    쿼리 파라미터:
+    - fields: 응답에 포함할 필드 (쉼표 구분, 예: name,tier_score). 없으면 전체 필드. 순서와 상관없이 API 필드 정의 순서로 반환
+    - limit: 한 페이지 행 수 (최대 500). 지정하면 응답에 다음 페이지용 next_cursor 포함
+    - after: 이전 응답의 next_cursor (키셋 페이지네이션)
+
+    응답 본문은 챔피언 그룹 버전 캐시에 보관되며, ChampionStat/Champion이 바뀌면 무효화됩니다.
     """
-    stats = ChampionStat.objects.select_related('champion').all()
-    
-    data = {
-        'champions': [
-            {
-                'name': stat.champion.name,
-                'total_picks': stat.total_picks,
-                'blue_first_pick': stat.blue_first_pick,
-                'red_first_pick': stat.red_first_pick,
-                'tier_score': stat.tier_score,
-                'side_index': stat.side_index,
-                'side_preference': stat.get_side_preference_display(),
-                'side_preference_code': stat.side_preference,
-            }
-            for stat in stats
-        ],
-        'total_count': stats.count(),
-    }
-    
-    return JsonResponse(data)
+    try:
+        fields = parse_champion_stats_fields(request.GET.get('fields', ''))
+        fields.sort(key=list(CHAMPION_STAT_API_FIELDS).index)
+        cursor = request.GET.get('after', '')
+        after = decode_champion_stats_cursor(cursor) if cursor else None
+        limit = request.GET.get('limit')
+        limit = min(int(limit), MAX_CHAMPION_STATS_LIMIT) if limit else None
+        if limit is not None and limit < 1:
+            raise ValueError('limit은 1 이상이어야 합니다.')
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    # 캐시 키: 정렬·검증된 필드 목록 + 원본 커서 문자열의 해시 (공백/길이 제한 없는 안전한 키, 필드 순서만 다른 요청은 같은 항목 공유)
+    cache_name = hashlib.sha1(f"{','.join(fields)}|{cursor}|{limit}".encode()).hexdigest()
+    payload = cached_body(CHAMPIONS, cache_name, lambda: json_body(champion_stats_page(fields, after, limit)))
+    return HttpResponse(payload, content_type='application/json')
+
+@champions_condition
+def champion_stats_summary_api(request):
+    """
+    홈페이지 차트용 챔피언 통계 집계 API.
+    tier_score 상위 10개, 진영 선호도별 챔피언 수, 상위 8개의 1픽 비교를 DB에서 집계하여 반환합니다.
+    응답 본문은 챔피언 그룹 버전 캐시에 보관되며, ChampionStat/Champion이 바뀌면 무효화됩니다.
+    """
+    payload = cached_body(CHAMPIONS, 'summary', lambda: json_body(champion_stats_summary()))
+    return HttpResponse(payload, content_type='application/json')
 
 
 # --- 경기 스토리 관련 뷰 ---
@@ -252,6 +278,7 @@ def get_match_keywords(stage, match_number):
     return MATCH_KEYWORDS.get((stage, match_number), [])
 
 
+@stories_condition
 def match_stories(request):
     """
     경기 스토리 목록 페이지.
@@ -290,87 +317,24 @@ def match_stories(request):
     return render(request, 'main/match_stories.html', context=context)
 
 
+@story_detail_condition
 def match_story_detail(request, stage, match_number):
     """
     특정 경기의 상세 스토리 페이지.
     """
-    stories = MatchStory.objects.filter(
+    # 스토리는 한 번만 평가하고, 시리즈 통계는 (stage, match_number)별 캐시에서 읽습니다.
+    stories = list(MatchStory.objects.filter(
         stage=stage, 
         match_number=match_number
-    ).order_by('set_number')
+    ).order_by('set_number'))
     
-    if not stories.exists():
+    if not stories:
         raise Http404("해당 경기 스토리를 찾을 수 없습니다.")
     
-    first_story = stories.first()
-    
-    # [데이터 정의] 경기별 통계 시각화 데이터
-    viz_data_map = {
-        # === 8강 (Quarterfinals) ===
-        "QF_1": [
-            {"category": "SERIES SCORE", "left": 3, "right": 1},
-            {"category": "TOTAL KILLS",  "left": 74, "right": 65},
-            {"category": "TOWERS",       "left": 30, "right": 26},
-            {"category": "DRAGONS",      "left": 11, "right": 10},
-            {"category": "BARONS",       "left": 4, "right": 3},
-            {"category": "GOLD (k)",     "left": 296.2, "right": 287.4}
-        ],
-        "QF_2": [
-            {"category": "SERIES SCORE", "left": 3, "right": 0},
-            {"category": "TOTAL KILLS",  "left": 70, "right": 28},
-            {"category": "TOWERS",       "left": 26, "right": 6},
-            {"category": "DRAGONS",      "left": 11, "right": 2},
-            {"category": "BARONS",       "left": 2, "right": 0},
-            {"category": "GOLD (k)",     "left": 179.2, "right": 146.0}
-        ],
-        "QF_3": [
-            {"category": "SERIES SCORE", "left": 1, "right": 3},
-            {"category": "TOTAL KILLS",  "left": 38, "right": 65},
-            {"category": "TOWERS",       "left": 16, "right": 26},
-            {"category": "DRAGONS",      "left": 5, "right": 11},
-            {"category": "BARONS",       "left": 1, "right": 3},
-            {"category": "GOLD (k)",     "left": 210.5, "right": 232.8}
-        ],
-        "QF_4": [
-            {"category": "SERIES SCORE", "left": 2, "right": 3},
-            {"category": "TOTAL KILLS",  "left": 76, "right": 73},
-            {"category": "TOWERS",       "left": 25, "right": 35},
-            {"category": "DRAGONS",      "left": 9, "right": 17},
-            {"category": "BARONS",       "left": 2, "right": 3},
-            {"category": "GOLD (k)",     "left": 322.5, "right": 328.6}
-        ],
-
-        # === 4강 (Semifinals) ===
-        "SF_1": [
-            {"category": "SERIES SCORE", "left": 1, "right": 3},
-            {"category": "TOTAL KILLS",  "left": 48, "right": 66},
-            {"category": "TOWERS",       "left": 22, "right": 31},
-            {"category": "DRAGONS",      "left": 7, "right": 16},
-            {"category": "BARONS",       "left": 4, "right": 3},
-            {"category": "GOLD (k)",     "left": 262.8, "right": 281.6}
-        ],
-        "SF_2": [
-            {"category": "SERIES SCORE", "left": 3, "right": 0},
-            {"category": "TOTAL KILLS",  "left": 70, "right": 27},
-            {"category": "TOWERS",       "left": 22, "right": 7},
-            {"category": "DRAGONS",      "left": 11, "right": 1},
-            {"category": "BARONS",       "left": 3, "right": 0},
-            {"category": "GOLD (k)",     "left": 178.6, "right": 147.6}
-        ],
-
-        # === 결승 (Finals) ===
-        "F_1": [
-            {"category": "SERIES SCORE", "left": 2, "right": 3},
-            {"category": "TOTAL KILLS",  "left": 77, "right": 89},
-            {"category": "TOWERS",       "left": 23, "right": 37},
-            {"category": "DRAGONS",      "left": 12, "right": 15},
-            {"category": "BARONS",       "left": 3, "right": 4},
-            {"category": "GOLD (k)",     "left": 325.7, "right": 350.0}
-        ],
-    }
-
-    match_key = f"{stage}_{match_number}"
-    current_viz_data = viz_data_map.get(match_key, [])
+    first_story = stories[0]
+    current_viz_data = cached_body(
+        SERIES_STATS, f'{stage}_{match_number}', lambda: get_series_viz_data(stage, match_number)
+    )
     
     context = {
         'title': f'{first_story.get_stage_display()} - {first_story.team_a} vs {first_story.team_b}',
@@ -390,32 +354,56 @@ def match_story_detail(request, stage, match_number):
     return render(request, 'main/match_story_detail.html', context=context)
 
 
+def get_series_viz_data(stage, match_number):
+    """시리즈 통계 차트 데이터 (통계가 없으면 빈 리스트)"""
+    stat = SeriesStat.objects.filter(stage=stage, match_number=match_number).first()
+    return stat.viz_data() if stat else []
+
+
+@stories_condition
 def match_stories_api(request):
     """
     경기 스토리 API 엔드포인트.
-    모든 경기 스토리 데이터를 JSON 형태로 반환합니다.
+    경기 스토리 데이터를 (stage, match_number, set_number) 순서의 JSON으로 반환합니다.
+
+    쿼리 파라미터:
+    - format: json(기본) 또는 ndjson (한 줄에 스토리 하나)
+    - stream: 1이면 전체 JSON을 메모리에 만들지 않고 DB에서 청크 단위로 읽어 스트리밍
+    - limit / after: 키셋 페이지네이션 (after는 이전 응답의 next_cursor, NDJSON은 X-Next-Cursor 헤더)
+
+    파라미터가 없으면 응답 본문은 스토리 그룹 버전 캐시에 보관되며, MatchStory가 바뀌면 무효화됩니다.
+    format/stream/limit/after를 지정하면 캐시를 거치지 않고 스트리밍합니다.
     """
-    stories = MatchStory.objects.all().order_by('stage', 'match_number', 'set_number')
-    
-    data = {
-        'stories': [
-            {
-                'id': story.id,
-                'stage': story.stage,
-                'stage_display': story.get_stage_display(),
-                'match_number': story.match_number,
-                'set_number': story.set_number,
-                'team_a': story.team_a,
-                'team_b': story.team_b,
-                'winner': story.winner,
-                'final_score': story.final_score,
-                'match_overview': story.match_overview,
-                'banpick_analysis': story.banpick_analysis,
-                'game_narrative': story.game_narrative,
-            }
-            for story in stories
-        ],
-        'total_count': stories.count(),
-    }
-    
-    return JsonResponse(data)
\ No newline at end of file
+    output_format = request.GET.get('format', 'json')
+    if output_format not in ('json', 'ndjson'):
+        return JsonResponse({'error': f'지원하지 않는 format: {output_format} (json, ndjson)'}, status=400)
+    try:
+        after = request.GET.get('after')
+        after = decode_story_cursor(after) if after else None
+        limit = request.GET.get('limit')
+        limit = min(int(limit), MAX_STORIES_LIMIT) if limit else None
+        if limit is not None and limit < 1:
+            raise ValueError('limit은 1 이상이어야 합니다.')
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    streaming = output_format == 'ndjson' or request.GET.get('stream') == '1' or limit or after
+    if not streaming:
+        payload = cached_body(STORIES, 'all', build_match_stories_body)
+        return HttpResponse(payload, content_type='application/json')
+
+    stories, next_cursor = story_page(after, limit)
+    if output_format == 'ndjson':
+        response = StreamingHttpResponse(iter_story_ndjson(stories), content_type='application/x-ndjson')
+    else:
+        response = StreamingHttpResponse(
+            iter_story_json(stories, next_cursor, paginated=bool(limit)), content_type='application/json'
+        )
+    if next_cursor:
+        response['X-Next-Cursor'] = next_cursor
+    return response
+
+
+def build_match_stories_body():
+    """경기 스토리 API 응답 본문(JSON 문자열) 생성 (캐시용 전체 응답)"""
+    return ''.join(iter_story_json(MatchStory.objects.order_by(*STORY_ORDERING)))
@@ -81,6 +81,23 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# JSON API 응답 캐시 (main/api_cache.py).
+# 데이터 그룹 버전은 관리 명령(load_* 등)도 별도 프로세스에서 올리므로, 서버와 명령이 같은 캐시를 봐야 합니다.
+# 프로세스마다 따로인 로컬 메모리 캐시 대신 파일 캐시를 사용하며, 운영 배포에서는 Redis/Memcached로 바꿀 수 있습니다.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache' / 'api',
+        'OPTIONS': {
+            'MAX_ENTRIES': 1000,
+        },
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 